@@ -0,0 +1,278 @@
+"""
+Bulk eBay Listings
+Streams a CollX export (or any card CSV, through a column mapping) through
+build_full_listing and writes an eBay File Exchange CSV chunk by chunk, so
+memory stays flat however many cards go in. With workers > 1 the chunks are
+spread over a process pool (each worker keeps one reference-DB connection and
+its memoized lookups) and come back in input order. Used by the eBay Listings
+page and from the command line:
+    python bulk_listings.py collx-photos-master.csv -o ebay_upload.csv [--price 4.99] [--workers 4]
+File Exchange "Add" rows go live on upload, so a card with no usable price (its
+price column, else --price) gets no row; those cards are counted, not guessed at.
+"""
+
+import csv
+import io
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+import reference_db
+from collx_cache import image_url
+from ebay_listing_generator import (
+    FILE_EXCHANGE_COLUMNS, build_full_listing, format_for_file_exchange, parse_start_price,
+)
+
+# Listing field -> CSV column. Fields mapped to None (or a missing column) are left blank.
+CARD_FIELDS = ["player", "year", "set", "brand", "sport", "card_number", "team", "flags",
+               "grade", "price", "front_image", "back_image"]
+COLLX_COLUMNS: Dict[str, Optional[str]] = {
+    "player": "name", "year": "year", "set": "set", "brand": "brand", "sport": "category",
+    "card_number": "number", "team": "team", "flags": "flags", "grade": None, "price": None,
+    "front_image": "front_image", "back_image": "back_image",
+}
+# CollX flags -> eBay Features ("RC" is handled as is_rookie, "SN###" as Serial Numbered)
+FLAG_FEATURES = {"AU": "Autograph", "MEM": "Memorabilia", "SP": "Short Print", "SSP": "Short Print"}
+CHUNK_SIZE = 250  # rows per worker task, and between progress callbacks
+MAX_PENDING_PER_WORKER = 4  # chunks in flight per worker; bounds memory on huge inputs
+
+
+class BulkStats(NamedTuple):
+    listings: int
+    skipped: int  # rows with no player name
+    unpriced: int  # rows with no usable price (neither the price column nor start_price)
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        """Listings per second"""
+        return self.listings / self.seconds if self.seconds else 0.0
+
+
+def default_columns(header: Iterable[str]) -> Dict[str, Optional[str]]:
+    """COLLX_COLUMNS, keeping only the columns this header actually has"""
+    header = set(header)
+    return {field: col if col in header else None for field, col in COLLX_COLUMNS.items()}
+
+
+def _split_set(set_value: str, brand: str):
+    """
+    CollX set "2021 Topps - Orange" -> ("Orange", "Orange"): the set name without its
+    leading year and brand, and the parallel/insert after " - " (or "Base").
+    A plain set with nothing left after the brand ("1990 Fleer") becomes the brand.
+    Any other CSV's set names pass through, minus a leading year and brand.
+    """
+    name = set_value
+    first, _, after = name.partition(" ")
+    if first[:4].isdigit():
+        name = after
+    base, _, parallel = name.partition(" - ")
+    set_name = " ".join(p for p in (base, parallel) if p)
+    # "Topps - Topps Double Headers" -> "Double Headers": the title already leads with the brand
+    while brand and set_name.lower().startswith(brand.lower()):
+        set_name = set_name[len(brand):].strip()
+    return set_name or brand, parallel or "Base"
+
+
+def _features(flags: str) -> List[str]:
+    features = []
+    for flag in (f.strip().upper() for f in flags.split(",")):
+        if flag.startswith("SN") and flag[2:].isdigit():
+            features.append(f"Serial Numbered /{flag[2:]}")
+        elif flag in FLAG_FEATURES and FLAG_FEATURES[flag] not in features:
+            features.append(FLAG_FEATURES[flag])
+    return features
+
+
+def _picture(value: str, side: str) -> str:
+    # Full URLs pass through; short image ids from the CollX cache are expanded
+    return value if value.startswith("http") else image_url(value, side)
+
+
+def listing_row(card: Dict[str, str], start_price: str = "") -> Optional[Dict[str, str]]:
+    """
+    One File Exchange row for a card given as {field: value} (see CARD_FIELDS).
+    Its price column wins, then start_price; with neither usable there is no row (None).
+    """
+    brand = card.get("brand", "")
+    set_name, variety = _split_set(card.get("set", ""), brand)
+    flags = card.get("flags", "")
+    grade = card.get("grade", "")
+    listing = build_full_listing(
+        player=card["player"],
+        year=card.get("year", ""),
+        set_name=set_name,
+        brand=brand,
+        sport=card.get("sport", ""),
+        card_number=card.get("card_number", ""),
+        team=card.get("team", ""),
+        is_rookie="RC" in (f.strip().upper() for f in flags.split(",")),
+        is_graded=bool(grade),
+        grade=grade,
+        variety=variety,
+        features=", ".join(_features(flags)),
+        suggested_price=card.get("price", ""),
+    )
+    pictures = [_picture(card.get(f"{side}_image", ""), side) for side in ("front", "back")]
+    return format_for_file_exchange(listing, pictures, start_price)
+
+
+def _cards(rows: Iterable[Dict[str, str]], columns: Dict[str, Optional[str]]) -> Iterator[Dict[str, str]]:
+    mapped = [(field, col) for field, col in columns.items() if col]
+    for row in rows:
+        yield {field: (row.get(col) or "").strip() for field, col in mapped}
+
+
+def _listing_chunk(cards: List[Dict[str, str]], start_price: str) -> List[Optional[Dict[str, str]]]:
+    return [listing_row(card, start_price) if card.get("player") else None for card in cards]
+
+
+def _csv_chunk(cards: List[Dict[str, str]], start_price: str) -> Tuple[str, int, int, int]:
+    """(File Exchange CSV text without header, listings, skipped, unpriced) for one chunk"""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=FILE_EXCHANGE_COLUMNS)
+    listings = skipped = 0
+    for card, row in zip(cards, _listing_chunk(cards, start_price)):
+        if row is not None:
+            writer.writerow(row)
+            listings += 1
+        elif not card.get("player"):
+            skipped += 1
+    return buf.getvalue(), listings, skipped, len(cards) - listings - skipped
+
+
+def _init_worker() -> None:
+    # One pooled connection and one memoized reference index per worker process
+    if reference_db.exists():
+        reference_db.reference_index()
+
+
+def _run_chunks(cards: Iterable[Dict[str, str]], chunk_fn: Callable, start_price: str, workers: int) -> Iterator:
+    """chunk_fn(chunk, start_price) for every CHUNK_SIZE cards, results in input order"""
+    cards = iter(cards)
+    chunks = iter(lambda: list(islice(cards, CHUNK_SIZE)), [])
+    if workers <= 1:
+        for chunk in chunks:
+            yield chunk_fn(chunk, start_price)
+        return
+    with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(chunk_fn, chunk, start_price))
+            if len(pending) >= workers * MAX_PENDING_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def build_listings(
+    cards: Iterable[Dict[str, str]],
+    workers: int = 1,
+    start_price: str = "",
+) -> Iterator[Optional[Dict[str, str]]]:
+    """
+    File Exchange rows for cards ({field: value}, see CARD_FIELDS), one per card
+    in input order; None for a card without a player name or a usable price
+    (its price column, else start_price). workers > 1 shards the
+    cards over that many processes, CHUNK_SIZE cards per task.
+    """
+    for rows in _run_chunks(cards, _listing_chunk, start_price, workers):
+        yield from rows
+
+
+def write_listings(
+    rows: Iterable[Dict[str, str]],
+    out: TextIO,
+    columns: Optional[Dict[str, Optional[str]]] = None,
+    start_price: str = "",
+    progress: Optional[Callable[[int, int, float], None]] = None,
+    workers: int = 1,
+) -> BulkStats:
+    """
+    Write a File Exchange CSV to out, one listing per input row with a player name
+    and a price.
+    rows: dicts keyed by CSV column (e.g. csv.DictReader); columns maps CARD_FIELDS
+    to those columns (default COLLX_COLUMNS). progress(rows_read, listings, seconds) is
+    called after every CHUNK_SIZE rows. Workers format their chunk's CSV text
+    themselves, so only one string per chunk crosses back to this process.
+    """
+    csv.DictWriter(out, fieldnames=FILE_EXCHANGE_COLUMNS).writeheader()
+    listings = skipped = unpriced = 0
+    t0 = time.perf_counter()
+    for text, n_listings, n_skipped, n_unpriced in _run_chunks(_cards(rows, columns or COLLX_COLUMNS), _csv_chunk,
+                                                               start_price, workers):
+        out.write(text)
+        listings += n_listings
+        skipped += n_skipped
+        unpriced += n_unpriced
+        if progress:
+            progress(listings + skipped + unpriced, listings, time.perf_counter() - t0)
+    return BulkStats(listings, skipped, unpriced, time.perf_counter() - t0)
+
+
+def count_rows(f: TextIO) -> int:
+    """Data rows in a CSV file (one streaming pass, then rewinds)"""
+    n = sum(1 for _ in csv.reader(f)) - 1
+    f.seek(0)
+    return max(n, 0)
+
+
+def bulk_listings_file(
+    csv_path: str,
+    out_path: str,
+    columns: Optional[Dict[str, Optional[str]]] = None,
+    start_price: str = "",
+    progress: Optional[Callable[[int, int, float], None]] = None,
+    workers: int = 1,
+) -> BulkStats:
+    """write_listings() from one CSV file to another"""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f_in, \
+            open(out_path, "w", newline="", encoding="utf-8") as f_out:
+        reader = csv.DictReader(f_in)
+        return write_listings(reader, f_out, columns or default_columns(reader.fieldnames or []),
+                              start_price, progress, workers)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="CollX / card CSV -> eBay File Exchange CSV")
+    parser.add_argument("csv", help="input CSV (CollX export by default)")
+    parser.add_argument("-o", "--out", default="ebay_upload.csv", help="File Exchange CSV to write")
+    parser.add_argument("--price", default="",
+                        help="start price for cards without a price column value (default: those cards are left out)")
+    parser.add_argument("--map", nargs="*", default=[], metavar="FIELD=COLUMN",
+                        help=f"override the column for a field ({', '.join(CARD_FIELDS)})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (pays off from tens of thousands of rows)")
+    args = parser.parse_args()
+    if args.price and parse_start_price(args.price) is None:
+        parser.error(f"--price must be a positive amount, e.g. 4.99 (got {args.price!r})")
+
+    with open(args.csv, newline="", encoding="utf-8-sig") as f:
+        total = count_rows(f)
+        columns = default_columns(next(csv.reader(f), []))
+    for item in args.map:
+        field, _, col = item.partition("=")
+        if field not in CARD_FIELDS:
+            parser.error(f"unknown field {field!r}")
+        columns[field] = col or None
+
+    def progress(done: int, listings: int, seconds: float) -> None:
+        rate = listings / seconds if seconds else 0.0
+        print(f"\r  {done:,}/{total:,} rows  {rate:,.0f} listings/sec", end="", file=sys.stderr, flush=True)
+
+    stats = bulk_listings_file(args.csv, args.out, columns, args.price, progress, args.workers)
+    print(file=sys.stderr)
+    print(f"{stats.listings:,} listings ({stats.skipped:,} rows without a player skipped) in "
+          f"{stats.seconds:.2f}s - {stats.rate:,.0f} listings/sec -> {args.out}")
+    if stats.unpriced:
+        print(f"{stats.unpriced:,} cards without a price left out - map a price column or pass --price",
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Card Catalog
+One indexed SQLite catalog for every checklist set.
+The data/*.py checklist modules are the build sources; the app reads cards
+from data/catalog.db through the loader functions below instead of importing them.
+"""
+
+import importlib
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+CATALOG_PATH = "data/catalog.db"
+
+# Checklist sources, in sidebar order. set_id is stable and is part of every card_id.
+CHECKLIST_SOURCES = {
+    "topps-2021-s1": {"label": "2021 Topps S1", "name": "2021 Topps Series 1", "sport": "baseball", "year": 2021, "module": "data.topps_2021_s1"},
+    "topps-2026-s1": {"label": "2026 Topps S1", "name": "2026 Topps Series 1", "sport": "baseball", "year": 2026, "module": "data.topps_2026_s1"},
+    "prizm-2025-fb": {"label": "2025 Prizm Football", "name": "2025 Panini Prizm Football", "sport": "football", "year": 2025, "module": "data.panini_prizm_2025_football"},
+    "prizm-2021-fb": {"label": "2021 Prizm Football", "name": "2021 Panini Prizm Football", "sport": "football", "year": 2021, "module": "data.panini_prizm_2021_football"},
+    "mosaic-2021-fb": {"label": "2021 Mosaic Football", "name": "2021 Panini Mosaic Football", "sport": "football", "year": 2021, "module": "data.panini_mosaic_2021_football"},
+    "select-2021-fb": {"label": "2021 Select Football", "name": "2021 Panini Select Football", "sport": "football", "year": 2021, "module": "data.panini_select_2021_football"},
+    "prizm-2020-bk": {"label": "2020 Prizm Basketball", "name": "2020-21 Panini Prizm Basketball", "sport": "basketball", "year": 2020, "module": "data.panini_prizm_2020_basketball"},
+}
+
+# (number, player, team, type, notes) - same shape as the old ALL_CARDS tuples
+Card = Tuple[str, str, str, str, str]
+
+
+def card_id(set_id: str, number: str) -> str:
+    """Stable catalog id for a card: '<set_id>:<card number>'."""
+    return f"{set_id}:{number}"
+
+
+def create_catalog_schema(conn: sqlite3.Connection) -> None:
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS sets (
+            set_id TEXT PRIMARY KEY,
+            label TEXT UNIQUE,
+            name TEXT,
+            sport TEXT,
+            year INTEGER,
+            card_count INTEGER DEFAULT 0,
+            source TEXT,
+            last_updated TEXT
+        );
+        CREATE TABLE IF NOT EXISTS cards (
+            card_id TEXT PRIMARY KEY,
+            set_id TEXT NOT NULL REFERENCES sets(set_id),
+            seq INTEGER NOT NULL,
+            number TEXT,
+            player TEXT,
+            team TEXT,
+            type TEXT,
+            notes TEXT
+        );
+        CREATE TABLE IF NOT EXISTS prefixes (
+            set_id TEXT NOT NULL REFERENCES sets(set_id),
+            seq INTEGER NOT NULL,
+            code TEXT NOT NULL,
+            name TEXT,
+            card_type TEXT,
+            parallels TEXT,
+            PRIMARY KEY (set_id, code)
+        );
+        CREATE INDEX IF NOT EXISTS idx_cards_set_seq ON cards(set_id, seq);
+        CREATE INDEX IF NOT EXISTS idx_cards_player ON cards(player);
+        CREATE INDEX IF NOT EXISTS idx_cards_team ON cards(team);
+    ''')
+
+
+def build_catalog(db_path: str = CATALOG_PATH, sources: Optional[Dict] = None) -> Dict[str, int]:
+    """(Re)build the catalog from the checklist modules. Returns card counts per set."""
+    sources = sources or CHECKLIST_SOURCES
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    counts = {}
+    now = datetime.now().isoformat(timespec="seconds")
+
+    with sqlite3.connect(db_path) as conn:
+        create_catalog_schema(conn)
+        for set_id, info in sources.items():
+            module = importlib.import_module(info["module"])
+            cards = module.ALL_CARDS
+            prefix_info = getattr(module, "PREFIX_INFO", {}) or {}
+
+            conn.execute("DELETE FROM cards WHERE set_id = ?", (set_id,))
+            conn.execute("DELETE FROM prefixes WHERE set_id = ?", (set_id,))
+            conn.execute('''
+                INSERT OR REPLACE INTO sets (set_id, label, name, sport, year, card_count, source, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (set_id, info["label"], info["name"], info["sport"], info["year"], len(cards), info["module"], now))
+            conn.executemany('''
+                INSERT INTO cards (card_id, set_id, seq, number, player, team, type, notes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (card_id(set_id, str(num)), set_id, seq, str(num), player, team, ctype, notes)
+                for seq, (num, player, team, ctype, notes) in enumerate(cards)
+            ])
+            conn.executemany('''
+                INSERT INTO prefixes (set_id, seq, code, name, card_type, parallels)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [
+                (set_id, seq, code, name, ctype, parallels)
+                for seq, (code, (name, ctype, parallels)) in enumerate(prefix_info.items())
+            ])
+            counts[set_id] = len(cards)
+        conn.commit()
+
+    return counts
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    if not os.path.exists(db_path):
+        build_catalog(db_path)
+    return sqlite3.connect(db_path)
+
+
+def list_sets(db_path: str = CATALOG_PATH) -> List[Dict]:
+    """All catalog sets as dicts (set_id, label, name, sport, year, card_count)."""
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT set_id, label, name, sport, year, card_count FROM sets ORDER BY rowid"
+        ).fetchall()
+    finally:
+        conn.close()
+    keys = ("set_id", "label", "name", "sport", "year", "card_count")
+    return [dict(zip(keys, r)) for r in rows]
+
+
+def load_cards(set_id: str, db_path: str = CATALOG_PATH) -> List[Card]:
+    """Cards for one set, in checklist order."""
+    conn = _connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT number, player, team, type, notes FROM cards WHERE set_id = ? ORDER BY seq",
+            (set_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def load_prefix_info(set_id: str, db_path: str = CATALOG_PATH) -> Dict[str, Tuple[str, str, str]]:
+    """PREFIX_INFO for one set: code -> (name, card type, parallels/description)."""
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT code, name, card_type, parallels FROM prefixes WHERE set_id = ? ORDER BY seq",
+            (set_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return {code: (name, ctype, parallels) for code, name, ctype, parallels in rows}
+
+
+if __name__ == "__main__":
+    counts = build_catalog()
+    print(f"Card catalog built: {CATALOG_PATH}")
+    for set_id, n in counts.items():
+        print(f"  - {CHECKLIST_SOURCES[set_id]['label']}: {n} cards")
@@ -0,0 +1,357 @@
+"""
+Checklist Pages
+Declarative registry for the checklist set pages plus the pure helpers the
+page engine in views/checklist.py runs on: eBay query templates (compiled once
+per search format), card-type filters, sort options, prefix reference settings
+and the results-table HTML builder.
+Adding a set page = one CHECKLIST_PAGES entry (cards come from card_catalog).
+"""
+
+import html as html_mod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from card_catalog import CHECKLIST_SOURCES, Card
+from ebay_urls import ebay_search_url
+
+TINT_RC = "rgba(0,200,0,0.08)"
+TINT_INSERT = "rgba(100,100,255,0.06)"
+
+
+def card_number_key(card: Card):
+    """Numeric card numbers in numeric order, prefixed ones (86B-54) as text."""
+    return card[0].zfill(10) if card[0].isdigit() else card[0]
+
+
+FULL_SORTS = {
+    "Card # (default)": (card_number_key, False),
+    "Player A-Z": (lambda c: c[1].lower(), False),
+    "Player Z-A": (lambda c: c[1].lower(), True),
+    "Team A-Z": (lambda c: c[2].lower(), False),
+    "Type": (lambda c: c[3].lower(), False),
+}
+CARD_NUMBER_SORT = {"Card #": (card_number_key, False)}
+BASE_ONLY_FILTER = {"Base Only": lambda c: c[3] == "Base"}
+TOPPS_FILTERS = {
+    "Base Only": lambda c: c[3] == "Base",
+    "Inserts Only": lambda c: c[3] != "Base",
+    "RC Only": lambda c: "RC" in c[4],
+}
+
+
+def _topps_formats(year: int) -> List[Tuple[str, str]]:
+    return [
+        (f"{year} Topps + Player", f"{year} Topps {{player}}"),
+        (f"{year} Topps S1 + Player", f"{year} Topps Series 1 {{player}}"),
+        (f"{year} Topps + # + Player", f"{year} Topps {{num}} {{player}}"),
+        (f"{year} Topps S1 + # + Player", f"{year} Topps Series 1 {{num}} {{player}}"),
+        (f"{year} Topps + # + Player + Team", f"{year} Topps {{num}} {{player}} {{team}}"),
+        (f"{year} Topps S1 + # + Player + Team", f"{year} Topps Series 1 {{num}} {{player}} {{team}}"),
+    ]
+
+
+def _panini_formats(year: int, brand: str, sport: str, with_team: bool = False) -> List[Tuple[str, str]]:
+    formats = [
+        (f"{year} {brand} {sport} + Player", f"{year} {brand} {sport} {{player}}"),
+        (f"{year} Panini {brand} + Player", f"{year} Panini {brand} {sport} {{player}}"),
+        (f"{year} {brand} + # + Player", f"{year} {brand} {{num}} {{player}}"),
+        (f"{year} Panini {brand} + # + Player", f"{year} Panini {brand} {{num}} {{player}}"),
+    ]
+    if with_team:
+        formats += [
+            (f"{year} {brand} + # + Player + Team", f"{year} {brand} {{num}} {{player}} {{team}}"),
+            (f"{year} Panini {brand} + # + Player + Team", f"{year} Panini {brand} {{num}} {{player}} {{team}}"),
+        ]
+    return formats
+
+
+# Page spec keys:
+#   key            widget-key suffix (checklist_<key>_search, show_max_<key>, ...)
+#   header/caption/placeholder  page text
+#   search_formats (label, template) - template fields {num} {player} {team}
+#   default_format index into search_formats
+#   hash_types     card types whose numeric card # is searched as "#123" (None = any type)
+#   filter_label / filters   card-type filter selectbox: label -> predicate
+#   sorts          label -> (key, reverse); one entry = fixed order, no sort selectbox
+#   page_sizes     "Cards per page" options
+#   layout         "detailed" (notes column, row tints) or "basic"
+#   type_header    column title for the card type in the "basic" layout
+#   tints          [(predicate, css color)] first match wins ("detailed" layout)
+#   prefix_banner  format for the banner shown when the search is a prefix code
+#   prefix_title / prefix_query / prefix_detail   prefix quick-reference expander
+#   prefix_name_max  cut prefix names in that grid to this many characters (omit: full names)
+CHECKLIST_PAGES: Dict[str, Dict] = {
+    "topps-2021-s1": {
+        "key": "2021",
+        "header": "⚾ 2021 Topps Series 1 — Full Searchable Checklist",
+        "caption": "Search by **player name**, **card number** (e.g. 86B-54), **team**, or **prefix** (e.g. 86B, T52). All eBay links: Sold, No Autos.",
+        "placeholder": "e.g. Randy Johnson, 86B-54, Dodgers, T52, RC...",
+        "search_formats": _topps_formats(2021),
+        "default_format": 2,
+        "hash_types": ("Base",),
+        "filter_label": "Card Type",
+        "filters": TOPPS_FILTERS,
+        "sorts": FULL_SORTS,
+        "page_sizes": [50, 100, 200, 330, 999],
+        "layout": "detailed",
+        "tints": [(lambda c: "RC" in c[4], TINT_RC), (lambda c: c[3] != "Base", TINT_INSERT)],
+        "prefix_banner": "Parallels: {2}",
+        "prefix_title": "📋 All Insert Set Prefixes — Quick Reference",
+        "prefix_query": "2021 Topps {name}",
+        "prefix_detail": 1,
+        "prefix_name_max": 35,
+    },
+    "topps-2026-s1": {
+        "key": "2026",
+        "header": "⚾ 2026 Topps Series 1 — Full Searchable Checklist",
+        "caption": "75th Anniversary Set · Release Feb 11, 2026 · Search by **player name**, **card number**, **team**, or **notes**. All eBay links: Sold, No Autos.",
+        "placeholder": "e.g. Aaron Judge, 1, Yankees, RC...",
+        "search_formats": _topps_formats(2026),
+        "default_format": 2,
+        "hash_types": ("Base",),
+        "filter_label": "Card Type",
+        "filters": TOPPS_FILTERS,
+        "sorts": FULL_SORTS,
+        "page_sizes": [50, 100, 200, 350, 999],
+        "layout": "detailed",
+        "tints": [(lambda c: "RC" in c[4], TINT_RC), (lambda c: c[3] != "Base", TINT_INSERT)],
+        "prefix_banner": "Parallels: {2}",
+        "prefix_title": "📋 Insert Set Prefixes — Quick Reference",
+        "prefix_query": "2026 Topps {name}",
+        "prefix_detail": 1,
+        "prefix_name_max": 35,
+    },
+    "prizm-2025-fb": {
+        "key": "prizm",
+        "header": "🏈 2025 Panini Prizm Football — Full Searchable Checklist",
+        "caption": "Release Feb 2, 2026 · Search by **player name**, **card number**, or **team**. All eBay links: Sold, No Autos.",
+        "placeholder": "e.g. Caleb Williams, Travis Hunter, Bears, RC...",
+        "search_formats": _panini_formats(2025, "Prizm", "Football", with_team=True),
+        "default_format": 1,
+        "hash_types": ("Base", "Rookie"),
+        "filter_label": "Card Type",
+        "filters": {
+            "Base Only": lambda c: c[3] == "Base",
+            "Rookies Only": lambda c: c[3] == "Rookie",
+            "RC Only": lambda c: "RC" in c[4],
+        },
+        "sorts": FULL_SORTS,
+        "page_sizes": [50, 100, 200, 400, 999],
+        "layout": "detailed",
+        "tints": [(lambda c: "RC" in c[4] or c[3] == "Rookie", TINT_RC)],
+        "prefix_banner": "Parallels: {2}",
+        "prefix_title": "📋 Set Reference — Quick Links",
+        "prefix_query": "2025 Panini Prizm {name}",
+        "prefix_detail": 1,
+        "prefix_name_max": 35,
+    },
+    "prizm-2021-fb": {
+        "key": "prizm21",
+        "header": "🏈 2021 Panini Prizm Football — Base Checklist",
+        "caption": "330 base cards · Search by **player name**, **card number**, or **team**. All eBay links: Sold, No Autos.",
+        "placeholder": "e.g. Justin Herbert, Mac Jones, Chiefs, 1...",
+        "search_formats": _panini_formats(2021, "Prizm", "Football"),
+        "default_format": 1,
+        "hash_types": None,
+        "filter_label": "Card Type",
+        "filters": BASE_ONLY_FILTER,
+        "sorts": CARD_NUMBER_SORT,
+        "page_sizes": [50, 100, 200, 330, 999],
+        "layout": "basic",
+        "type_header": "Type",
+    },
+    "mosaic-2021-fb": {
+        "key": "mosaic21",
+        "header": "🏈 2021 Panini Mosaic Football — Base Checklist",
+        "caption": "200 base cards · Search by **player name**, **card number**, or **team**. All eBay links: Sold, No Autos.",
+        "placeholder": "e.g. Patrick Mahomes, Lamar Jackson, Chiefs...",
+        "search_formats": _panini_formats(2021, "Mosaic", "Football"),
+        "default_format": 1,
+        "hash_types": None,
+        "filter_label": "Card Type",
+        "filters": BASE_ONLY_FILTER,
+        "sorts": CARD_NUMBER_SORT,
+        "page_sizes": [50, 100, 200, 999],
+        "layout": "basic",
+        "type_header": "Type",
+    },
+    "select-2021-fb": {
+        "key": "select21",
+        "header": "🏈 2021 Panini Select Football — Base Checklist",
+        "caption": "300 base cards in 3 tiers: Premier (101-200), Club (201-300), Field (301-400) — Search by **player**, **card #**, or **team**. eBay links: Sold, No Autos.",
+        "placeholder": "e.g. Tom Brady, Mac Jones, 247, Premier...",
+        "search_formats": _panini_formats(2021, "Select", "Football"),
+        "default_format": 1,
+        "hash_types": None,
+        "filter_label": "Tier",
+        "filters": {
+            "Premier Only": lambda c: c[3] == "Premier",
+            "Club Only": lambda c: c[3] == "Club",
+            "Field Only": lambda c: c[3] == "Field",
+        },
+        "sorts": {"Tier + Card #": (lambda c: (c[3], card_number_key(c)), False)},
+        "page_sizes": [50, 100, 200, 300, 999],
+        "layout": "basic",
+        "type_header": "Tier",
+        "prefix_banner": "{2}",
+        "prefix_title": "📋 Tier Reference — Quick Links",
+        "prefix_query": "2021 Panini Select {name}",
+        "prefix_detail": 2,
+    },
+    "prizm-2020-bk": {
+        "key": "prizm20bb",
+        "header": "🏀 2020-21 Panini Prizm Basketball — Base Checklist",
+        "caption": "300 base cards · Search by **player name**, **card number**, or **team**. All eBay links: Sold, No Autos.",
+        "placeholder": "e.g. LeBron James, Anthony Edwards, Lakers...",
+        "search_formats": [
+            ("2021 Prizm Basketball + Player", "2021 Panini Prizm Basketball {player}"),
+            ("2020-21 Panini Prizm + Player", "2020-21 Panini Prizm Basketball {player}"),
+            ("2021 Prizm + # + Player", "2021 Panini Prizm {num} {player}"),
+            ("2020-21 Panini Prizm + # + Player", "2020-21 Panini Prizm {num} {player}"),
+        ],
+        "default_format": 1,
+        "hash_types": None,
+        "filter_label": "Card Type",
+        "filters": BASE_ONLY_FILTER,
+        "sorts": CARD_NUMBER_SORT,
+        "page_sizes": [50, 100, 200, 300, 999],
+        "layout": "basic",
+        "type_header": "Type",
+    },
+}
+
+MIN_PRICES = [5, 10, 25, 50]
+
+# Sidebar label -> set_id
+CHECKLIST_PAGE_LABELS = {CHECKLIST_SOURCES[set_id]["label"]: set_id for set_id in CHECKLIST_PAGES}
+
+
+def compile_query(template: str, hash_types: Optional[Sequence[str]]) -> Callable[[Card], str]:
+    """
+    One search format as a card -> eBay query function. The template and the
+    card-number rule are resolved here once, not per card.
+    """
+    fill = template.format
+
+    def query(card: Card) -> str:
+        num, player, team, card_type, _ = card
+        if num.isdigit() and (hash_types is None or card_type in hash_types):
+            num = "#" + num
+        return fill(num=num, player=player, team=team)
+
+    return query
+
+
+# Page key -> search format label -> compiled query function
+QUERY_BUILDERS: Dict[str, Dict[str, Callable[[Card], str]]] = {
+    spec["key"]: {label: compile_query(template, spec["hash_types"]) for label, template in spec["search_formats"]}
+    for spec in CHECKLIST_PAGES.values()
+}
+
+
+def format_labels(spec: Dict) -> List[str]:
+    return [label for label, _ in spec["search_formats"]]
+
+
+def query_builder(spec: Dict, search_fmt: str) -> Callable[[Card], str]:
+    """Compiled query function for one of the page's search formats."""
+    return QUERY_BUILDERS[spec["key"]][search_fmt]
+
+
+def ebay_query(spec: Dict, card: Card, search_fmt: str) -> str:
+    """eBay search query for one card in the given search format."""
+    return query_builder(spec, search_fmt)(card)
+
+
+def sort_order(spec: Dict, cards: Sequence[Card], sort_label: str) -> List[int]:
+    """Card positions in display order for one sort option (stable, like sorted())."""
+    key, reverse = spec["sorts"][sort_label]
+    return sorted(range(len(cards)), key=lambda i: key(cards[i]), reverse=reverse)
+
+
+def select_cards(spec: Dict, cards: Sequence[Card], order: Sequence[int],
+                 hits: Optional[Sequence[int]], filter_label: str) -> List[Card]:
+    """Cards in `order` that are search hits (None = no search) and pass the filter."""
+    keep = spec["filters"].get(filter_label)
+    hit_set = None if hits is None else set(hits)
+    return [
+        cards[i] for i in order
+        if (hit_set is None or i in hit_set) and (keep is None or keep(cards[i]))
+    ]
+
+
+def prefix_banner(spec: Dict, prefix_info: Dict, search: str) -> Optional[str]:
+    """Info banner text when the search box holds a prefix code (e.g. 86B)."""
+    code = search.strip().upper()
+    if not code or "prefix_banner" not in spec or code not in prefix_info:
+        return None
+    info = prefix_info[code]
+    return f"**{code}** = {info[0]} ({info[1]}) — " + spec["prefix_banner"].format(*info)
+
+
+def prefix_reference_html(spec: Dict, prefix_info: Dict) -> str:
+    """Quick-reference grid: one eBay link per prefix code."""
+    parts = ['<div style="display:grid;grid-template-columns:repeat(3,1fr);gap:6px 12px;font-size:13px;">']
+    name_max = spec.get("prefix_name_max")
+    for code, info in prefix_info.items():
+        name = info[0]
+        url = ebay_search_url(spec["prefix_query"].format(name=name), sold=True, min_price=5, exclude_auto=True)
+        parts.append(f'<div><a href="{url}" target="_blank"><b>{code}</b></a> — {name[:name_max]} '
+                     f'<span style="color:#888;">({info[spec["prefix_detail"]]})</span></div>')
+    parts.append('</div>')
+    return ''.join(parts)
+
+
+def table_columns(spec: Dict) -> List[Tuple[str, str]]:
+    """
+    (cell kind, header) for the card columns of a page's layout, ahead of the
+    eBay links column. "detailed" shows small team / type cells (type without
+    "Insert ") plus notes; "basic" shows plain team and type.
+    """
+    if spec["layout"] == "detailed":
+        return [("num", "Card #"), ("player", "Player"), ("team_small", "Team"), ("type_short", "Type"),
+                ("notes", "Notes")]
+    return [("num", "Card #"), ("player", "Player"), ("team", "Team"), ("type", spec["type_header"])]
+
+
+def results_table_html(spec: Dict, rows: Sequence[Card], search_fmt: str, min_price: int) -> str:
+    """Results table with Raw / Graded / All sold links for one page of cards."""
+    detailed = spec["layout"] == "detailed"
+    html = ['<table style="width:100%;border-collapse:collapse;font-size:13px;">']
+    html.append('<tr style="border-bottom:2px solid #555;text-align:left;">')
+    for header in [label for _, label in table_columns(spec)] + [f"eBay Sold ${min_price}+"]:
+        html.append(f'<th style="padding:4px 8px;">{header}</th>')
+    html.append('</tr>')
+
+    build_query = query_builder(spec, search_fmt)
+    for card in rows:
+        card_num, player_name, team, card_type, notes = card
+        ebay_q = build_query(card)
+        url_raw = ebay_search_url(ebay_q, sold=True, min_price=min_price, exclude_auto=True, exclude_graded=True)
+        url_graded = ebay_search_url(ebay_q, sold=True, min_price=min_price, exclude_auto=True, graded_only=True)
+        url_all = ebay_search_url(ebay_q, sold=True, min_price=min_price, exclude_auto=True)
+        e_num, e_player, e_team = html_mod.escape(card_num), html_mod.escape(player_name), html_mod.escape(team)
+
+        if detailed:
+            tint = next((color for matches, color in spec["tints"] if matches(card)), None)
+            e_type = html_mod.escape(card_type.replace("Insert ", ""))
+            e_notes = html_mod.escape(notes)
+            note_display = f'<span style="color:#FF6B6B;font-weight:bold;">{e_notes}</span>' if notes else ""
+            html.append(f'<tr style="background-color:{tint};">' if tint else '<tr>')
+            html.append(f'<td style="padding:3px 8px;font-weight:bold;">{e_num}</td>')
+            html.append(f'<td style="padding:3px 8px;">{e_player}</td>')
+            html.append(f'<td style="padding:3px 8px;color:#888;font-size:12px;">{e_team}</td>')
+            html.append(f'<td style="padding:3px 8px;font-size:12px;">{e_type}</td>')
+            html.append(f'<td style="padding:3px 8px;">{note_display}</td>')
+            html.append('<td style="padding:3px 8px;white-space:nowrap;">')
+            html.append(f'<a href="{url_raw}" target="_blank" title="Raw/Ungraded">🃏Raw</a>')
+            html.append(f' · <a href="{url_graded}" target="_blank" title="Graded PSA/BGS/SGC">🏆Graded</a>')
+            html.append(f' · <a href="{url_all}" target="_blank" title="All">📋All</a>')
+            html.append('</td></tr>')
+        else:
+            html.append(f'<tr><td style="padding:3px 8px;font-weight:bold;">{e_num}</td><td style="padding:3px 8px;">{e_player}</td>'
+                        f'<td style="padding:3px 8px;color:#888;">{e_team}</td><td style="padding:3px 8px;">{html_mod.escape(card_type)}</td>'
+                        f'<td style="padding:3px 8px;white-space:nowrap;"><a href="{url_raw}" target="_blank">🃏Raw</a> · '
+                        f'<a href="{url_graded}" target="_blank">🏆Graded</a> · <a href="{url_all}" target="_blank">📋All</a></td></tr>')
+
+    html.append('</table>')
+    return ''.join(html)
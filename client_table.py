@@ -0,0 +1,88 @@
+"""
+Client-Side Checklist Table
+Builds the static HTML/JS table (components/checklist_table.html) for
+st.components.v1.html. The set's cards ship once as compact JSON together with
+every search format's eBay query, the filter memberships, the sort orders and
+the page's columns and row tints, so search, filters, sorting, paging and link
+building all run in the browser and the rows look like the server-rendered table.
+"""
+
+import json
+import os
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from card_catalog import Card
+from ebay_urls import (
+    CARD_SINGLES_CATEGORY,
+    EBAY_SEARCH_BASE,
+    EXCLUDE_AUTO_TERMS,
+    EXCLUDE_GRADED_TERMS,
+    GRADED_ONLY_TERMS,
+)
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "components", "checklist_table.html")
+
+
+def client_table_payload(
+    cards: Sequence[Card],
+    search_formats: List[str],
+    ebay_query: Callable[[Card, str], str],
+    card_filters: Dict[str, Callable[[Card], bool]],
+    sorts: Dict[str, Tuple[Callable[[Card], object], bool]],
+    min_prices: List[int],
+    page_sizes: Sequence[int],
+    columns: Sequence[Tuple[str, str]],
+    tints: Sequence[Tuple[Callable[[Card], bool], str]] = (),
+    default_format: int = 0,
+    default_min_price: int = 0,
+) -> Dict:
+    """
+    Everything the browser needs, precomputed with the page's own rules:
+    ebay_query(card, search_fmt) for every format, card_filters
+    label -> predicate, sorts label -> (key, reverse), page_sizes the
+    page's "Cards per page" options (first is the default), columns as
+    checklists.table_columns() gives them, tints [(predicate, css color)]
+    with the first match coloring the row.
+    """
+    positions = range(len(cards))
+    colors = list(dict.fromkeys(color for _, color in tints))
+    return {
+        "cards": [list(card) for card in cards],
+        "formats": search_formats,
+        "queries": [
+            [ebay_query(card, fmt) for card in cards]
+            for fmt in search_formats
+        ],
+        "filters": [["All", None]] + [
+            [label, [i for i in positions if keep(cards[i])]] for label, keep in card_filters.items()
+        ],
+        "sorts": [
+            [label, sorted(positions, key=lambda i: key(cards[i]), reverse=reverse)]
+            for label, (key, reverse) in sorts.items()
+        ],
+        "columns": [list(column) for column in columns],
+        # Per card: index into tint_colors, or -1 for no tint
+        "tint_colors": colors,
+        "tints": [
+            next((colors.index(color) for matches, color in tints if matches(card)), -1) for card in cards
+        ],
+        "min_prices": min_prices,
+        "default_format": default_format,
+        "default_min_price": default_min_price,
+        "page_sizes": list(page_sizes),
+        "links": {
+            "base": EBAY_SEARCH_BASE,
+            "category": CARD_SINGLES_CATEGORY,
+            "exclude_auto": EXCLUDE_AUTO_TERMS,
+            "exclude_graded": EXCLUDE_GRADED_TERMS,
+            "graded_only": GRADED_ONLY_TERMS,
+        },
+    }
+
+
+def client_table_html(payload: Dict) -> str:
+    """Self-contained component document with the payload inlined."""
+    with open(TEMPLATE_PATH, "r", encoding="utf-8") as f:
+        template = f.read()
+    data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
+    return template.replace("__PAYLOAD__", data)
@@ -0,0 +1,191 @@
+"""
+CollX Collection Cache
+Parses the CollX CSV export once and keeps the cleaned frame in a binary
+columnar cache (Feather, memory-mapped on load; pickle if pyarrow is missing).
+The cache is keyed on the CSV's size, mtime and SHA-1, so it is reused across
+server restarts and dropped the moment the export changes.
+Cached frames are compacted first (categoricals, a numeric year, serial
+numbers parsed from the flags, short image ids) to keep the one in-process
+copy small.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+try:
+    from pyarrow import feather  # ships with streamlit
+    HAVE_ARROW = True
+except ImportError:
+    HAVE_ARROW = False
+
+from search_index import FIELD_SEP
+
+CACHE_DIR = os.path.join("data", ".cache")
+COLLX_SEARCH_COLS = ['name', 'number', 'team', 'year', 'brand', 'set', 'flags', 'category']
+# Low-cardinality text columns stored as pandas categoricals
+COLLX_CATEGORY_COLS = ['category', 'brand', 'team', 'set', 'flags']
+SERIAL_PATTERN = r"SN(\d+)"  # "SN299", "RC, SN199" -> print run
+# Bumped whenever compact_collx changes its output, so older cache files are rebuilt
+CACHE_FORMAT = 3
+
+# CollX image URLs are <prefix><id>-<side>.jpg; only <code><id> is kept in memory.
+# Anything that doesn't fit a known prefix is kept verbatim.
+IMAGE_URL_PREFIXES = {
+    "u": "https://storage.googleapis.com/collx-user-cards/",
+    "m": "https://storage.googleapis.com/collx-media/user_cards/",
+    "p": "https://storage.googleapis.com/collx-product-images/",
+}
+IMAGE_COLS = {"front_image": "front", "back_image": "back"}
+
+
+def csv_fingerprint(csv_path: str) -> Tuple[int, int]:
+    """(size, mtime_ns) - cheap enough to check on every rerun."""
+    stat = os.stat(csv_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def file_sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_collx_csv(csv_path: str) -> pd.DataFrame:
+    """Parse and clean the CollX export (no caching)."""
+    df = pd.read_csv(csv_path, dtype=str).fillna("")
+    # Strip whitespace from all columns
+    for col in df.columns:
+        df[col] = df[col].str.strip()
+    # Lowercased search haystack over every searchable column, built once per load
+    df['_haystack'] = df[COLLX_SEARCH_COLS[0]].str.cat(
+        [df[col] for col in COLLX_SEARCH_COLS[1:]], sep=FIELD_SEP
+    ).str.lower()
+    return df
+
+
+def _image_ids(urls: pd.Series, side: str) -> pd.Series:
+    suffix = f"-{side}.jpg"
+    ids = urls.copy()
+    for code, prefix in IMAGE_URL_PREFIXES.items():
+        hit = urls.str.startswith(prefix) & urls.str.endswith(suffix)
+        ids[hit] = code + urls[hit].str.slice(len(prefix), -len(suffix))
+    return ids
+
+
+def image_url(image_id: str, side: str = "front") -> str:
+    """Expand a short image id (front_image_id / back_image_id) back to its URL."""
+    prefix = IMAGE_URL_PREFIXES.get(image_id[:1]) if image_id else None
+    if prefix is None:
+        return image_id  # blank, or a URL kept verbatim
+    return f"{prefix}{image_id[1:]}-{side}.jpg"
+
+
+def compact_collx(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Memory-lean copy of a cleaned CollX frame. Text columns keep their values
+    (categoricals compare, sort and .str the same as strings), except year,
+    which becomes a nullable Int16 (<NA> when blank; see year_text). serial
+    (Int32) is the print run from an SN### flag. Image URLs become short ids.
+    """
+    out = df.copy()
+    for col in COLLX_CATEGORY_COLS:
+        out[col] = out[col].astype("category")
+    out['year'] = pd.to_numeric(df['year'], errors="coerce").astype("Int16")
+    serial = df['flags'].str.extract(SERIAL_PATTERN, expand=False)
+    out.insert(out.columns.get_loc('flags') + 1, 'serial', pd.to_numeric(serial, errors="coerce").astype("Int32"))
+    for col, side in IMAGE_COLS.items():
+        out.insert(out.columns.get_loc(col), f"{col}_id", _image_ids(df[col], side))
+        del out[col]
+    return out
+
+
+def year_text(year) -> str:
+    """A compacted frame's year as display / query text ("" when missing)"""
+    return "" if pd.isna(year) else str(year)
+
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _cache_paths(csv_path: str, cache_dir: str) -> Tuple[str, str]:
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    ext = "feather" if HAVE_ARROW else "pkl"
+    return os.path.join(cache_dir, f"{stem}.{ext}"), os.path.join(cache_dir, f"{stem}.meta.json")
+
+
+def _read_meta(meta_path: str) -> Dict:
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(meta_path: str, meta: Dict) -> None:
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def _read_frame(data_path: str) -> pd.DataFrame:
+    if HAVE_ARROW:
+        return feather.read_table(data_path, memory_map=True).to_pandas()
+    return pd.read_pickle(data_path)
+
+
+def _write_frame(df: pd.DataFrame, data_path: str) -> None:
+    tmp_path = data_path + ".tmp"
+    if HAVE_ARROW:
+        # Uncompressed so the file can be memory-mapped straight into Arrow buffers
+        df.reset_index(drop=True).to_feather(tmp_path, compression="uncompressed")
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, data_path)
+
+
+def load_collx(csv_path: str, cache_dir: str = CACHE_DIR) -> pd.DataFrame:
+    """
+    Cleaned, compacted CollX frame, served from the binary cache when the CSV is
+    unchanged. Size+mtime match -> cache hit without reading the CSV. A changed
+    mtime with the same content hash (e.g. a re-copied file) still hits and
+    refreshes the key.
+    """
+    data_path, meta_path = _cache_paths(csv_path, cache_dir)
+    size, mtime_ns = csv_fingerprint(csv_path)
+    meta = _read_meta(meta_path)
+    cached = (os.path.exists(data_path) and meta.get("csv") == os.path.abspath(csv_path)
+              and meta.get("format") == CACHE_FORMAT)
+
+    if cached and meta.get("size") == size and meta.get("mtime_ns") == mtime_ns:
+        return _read_frame(data_path)
+
+    sha1 = file_sha1(csv_path)
+    if cached and meta.get("sha1") == sha1:
+        _write_meta(meta_path, {**meta, "size": size, "mtime_ns": mtime_ns})
+        return _read_frame(data_path)
+
+    raw = read_collx_csv(csv_path)
+    df = compact_collx(raw)
+    memory = {"raw_bytes": frame_bytes(raw), "compact_bytes": frame_bytes(df)}
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_frame(df, data_path)
+        _write_meta(meta_path, {"csv": os.path.abspath(csv_path), "format": CACHE_FORMAT, "size": size,
+                                "mtime_ns": mtime_ns, "sha1": sha1, "memory": memory})
+    except OSError:
+        pass  # read-only deploy: serve the freshly parsed frame without caching
+    return df
+
+
+def collx_memory_report(csv_path: str, cache_dir: str = CACHE_DIR) -> Optional[Dict[str, int]]:
+    """{raw_bytes, compact_bytes} recorded when the cache was last built, if any."""
+    _, meta_path = _cache_paths(csv_path, cache_dir)
+    return _read_meta(meta_path).get("memory")
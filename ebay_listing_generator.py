@@ -4,12 +4,12 @@ Fills ALL eBay item specifics - no Ollama required.
 Uses reference DB for value context. You provide card details.
 """
 
-import sqlite3
-import os
-from typing import Dict, Optional, List
+import html
+from typing import Dict, Optional, List, Sequence
 from pathlib import Path
 
-DB_PATH = "data/reference.db"
+import reference_db
+
 EBAY_TITLE_MAX = 80
 
 # eBay 2025/2026 Item Specifics - Sports Trading Card Singles
@@ -29,6 +29,33 @@ SPORT_EBAY = {
     "hockey": "Ice Hockey",
 }
 
+# eBay File Exchange (bulk upload) - Sports Trading Card Singles
+FILE_EXCHANGE_ACTION = "*Action(SiteID=US|Country=US|Currency=USD|Version=1193)"
+CATEGORY_ID = "261328"
+CONDITION_ID_GRADED = "2750"
+CONDITION_ID_UNGRADED = "4000"
+# Our item specifics -> eBay aspect names (written as C:<aspect> columns).
+# "Rookie" has no aspect of its own; it goes into Features.
+ITEM_SPECIFIC_ASPECTS = {
+    "Player": "Player/Athlete",
+    "Year": "Year Manufactured",
+    "Brand": "Manufacturer",
+    "Sport": "Sport",
+    "Card Number": "Card Number",
+    "Team": "Team",
+    "Season": "Season",
+    "Variety": "Parallel/Variety",
+    "Features": "Features",
+    "Graded": "Graded",
+    "Grade": "Grade",
+    "Certification Number": "Certification Number",
+    "Condition": "Card Condition",
+}
+FILE_EXCHANGE_COLUMNS = [
+    FILE_EXCHANGE_ACTION, "*Category", "*Title", "*Description", "*ConditionID", "PicURL",
+    "*StartPrice", "*Quantity", "*Format", "*Duration",
+] + [f"C:{aspect}" for aspect in ITEM_SPECIFIC_ASPECTS.values()]
+
 # Brand options (common)
 BRANDS = ["Topps", "Panini", "Upper Deck", "Donruss", "Fleer", "Score", "Bowman", "Leaf", "Stadium Club", "Fleer Ultra", "Hoops", "O-Pee-Chee", "Sportflics", "SkyBox", "Sports Illustrated", "Other"]
 
@@ -42,29 +69,22 @@ def _truncate_title(title: str, max_len: int = EBAY_TITLE_MAX) -> str:
 def _lookup_reference(player: str, set_name: str, year: int, sport: str) -> Dict:
     """Check if card is in our valuable reference - adds listing boost context."""
     result = {"key_player": False, "tier1_set": False, "tier2_set": False, "notes": ""}
-    if not os.path.exists(DB_PATH):
+    if not reference_db.exists():
         return result
 
-    with sqlite3.connect(DB_PATH) as conn:
-        if player:
-            row = conn.execute(
-                "SELECT 1 FROM key_players WHERE LOWER(player_name) = LOWER(?)",
-                (player.strip(),)
-            ).fetchone()
-            result["key_player"] = bool(row)
-
-        # Match set (flexible - "1986 Fleer" matches "1986 Fleer Basketball")
-        set_lower = (set_name or "").lower()
-        for row in conn.execute("SELECT set_name, tier, notes, key_cards FROM valuable_sets"):
-            db_set, tier, notes, key_cards = row
-            if db_set.lower() in set_lower or set_lower in db_set.lower():
-                if tier == 1:
-                    result["tier1_set"] = True
-                    result["notes"] = notes or ""
-                else:
-                    result["tier2_set"] = True
-                    result["notes"] = key_cards or ""
-                break
+    index = reference_db.reference_index()
+    if player:
+        result["key_player"] = index.is_key_player(player.strip())
+
+    # Match set (flexible - "1986 Fleer" matches "1986 Fleer Basketball")
+    row = index.match_set(set_name)
+    if row:
+        if row.tier == 1:
+            result["tier1_set"] = True
+            result["notes"] = row.notes or ""
+        else:
+            result["tier2_set"] = True
+            result["notes"] = row.key_cards or ""
 
     return result
 
@@ -169,7 +189,7 @@ def build_full_listing(
         "item_specs": {k: v for k, v in item_specs.items() if v},
         "suggested_price": suggested_price or "Check sold listings",
         "category": "Sports Trading Card Singles",
-        "category_id": "261328",
+        "category_id": CATEGORY_ID,
         "keywords": keywords,
         "value_context": ref,
     }
@@ -234,6 +254,49 @@ def format_for_csv_row(listing: Dict) -> Dict:
     }
 
 
+def parse_start_price(price: str) -> Optional[str]:
+    """'$4.99' -> '4.99'; blanks, ranges, notes ('$3-$8', 'Check sold listings') and non-positive prices -> None."""
+    try:
+        value = float(price.replace("$", "").replace(",", "").strip())
+    except ValueError:
+        return None
+    return f"{value:.2f}" if value > 0 else None
+
+
+def format_for_file_exchange(
+    listing: Dict,
+    pictures: Sequence[str] = (),
+    start_price: str = "",
+) -> Optional[Dict]:
+    """
+    One eBay File Exchange row (columns: FILE_EXCHANGE_COLUMNS) for a fixed-price,
+    good-'til-cancelled, quantity-1 listing. pictures: image URLs, first is the gallery photo.
+    The listing's suggested price wins, then start_price. An "Add" row goes live on
+    upload, so with neither usable there is no row (None) rather than a made-up price.
+    """
+    price = parse_start_price(listing["suggested_price"]) or parse_start_price(start_price)
+    if price is None:
+        return None
+    s = listing["item_specs"]
+    graded = s.get("Graded") == "Yes"
+    features = [f for f in (s.get("Features", ""), "Rookie" if s.get("Rookie") == "Yes" else "") if f]
+    row = {
+        FILE_EXCHANGE_ACTION: "Add",
+        "*Category": listing["category_id"],
+        "*Title": listing["title"],
+        "*Description": html.escape(listing["description"]).replace("\n", "<br>"),
+        "*ConditionID": CONDITION_ID_GRADED if graded else CONDITION_ID_UNGRADED,
+        "PicURL": "|".join(p for p in pictures if p),
+        "*StartPrice": price,
+        "*Quantity": "1",
+        "*Format": "FixedPrice",
+        "*Duration": "GTC",
+    }
+    for key, aspect in ITEM_SPECIFIC_ASPECTS.items():
+        row[f"C:{aspect}"] = ", ".join(features) if key == "Features" else s.get(key, "")
+    return row
+
+
 if __name__ == "__main__":
     import sys
     if sys.platform == "win32":
@@ -0,0 +1,110 @@
+"""
+eBay Search URLs
+Single-card URL builder (memoized, with the fixed suffixes encoded once) plus
+a batch builder that emits the Raw / Graded / All / Active link columns for a
+whole collection DataFrame at once.
+"""
+
+import urllib.parse
+from functools import lru_cache
+from typing import Optional
+
+import pandas as pd
+
+EBAY_SEARCH_BASE = "https://www.ebay.com/sch/i.html"
+CARD_SINGLES_CATEGORY = "261328"  # Sports Trading Card Singles (excludes jerseys, apparel, etc.)
+
+# Note: eBay does substring matching, so -auto is too broad (hits "automatic" etc.)
+# Use -autograph and -autographed instead; keep -auto as well since many sellers
+# abbreviate, but the risk is minimal in the Trading Card Singles category
+EXCLUDE_AUTO_TERMS = " -autograph -signed -signature -auto"
+EXCLUDE_GRADED_TERMS = " -PSA -BGS -SGC -CGC -graded -slab"
+GRADED_ONLY_TERMS = " (PSA,BGS,SGC,CGC)"
+
+# eBay search formats offered on the CollX Collection page
+COLLX_SEARCH_FMTS = [
+    "Year + Set + Player",
+    "Year + Brand + Player",
+    "Year + Brand + # + Player",
+    "Set + Player",
+    "Player + Team",
+]
+
+
+URL_CACHE_SIZE = 32768  # full URLs kept by ebay_search_url (a few MB at most)
+
+
+@lru_cache(maxsize=None)
+def _encoded_terms(exclude_auto: bool, exclude_graded: bool, graded_only: bool) -> str:
+    """Percent-encoded exclusion / graded-only suffix for _nkw, encoded once per combination."""
+    terms = ""
+    if exclude_auto:
+        terms += EXCLUDE_AUTO_TERMS
+    if exclude_graded:
+        terms += EXCLUDE_GRADED_TERMS
+    if graded_only:
+        terms += GRADED_ONLY_TERMS
+    return urllib.parse.quote_plus(terms)
+
+
+@lru_cache(maxsize=256)
+def _url_tail(sold: bool, min_price=None) -> str:
+    """Everything after the _nkw value, in the same order urlencode emits it."""
+    tail = f"&_sacat={CARD_SINGLES_CATEGORY}"
+    if sold:
+        tail += "&LH_Complete=1&LH_Sold=1"
+    if min_price:
+        tail += f"&_udlo={urllib.parse.quote_plus(str(min_price))}"
+    return tail
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def ebay_search_url(query, sold=True, min_price=None, exclude_auto=False, exclude_graded=False, graded_only=False):
+    """
+    eBay search URL for query plus the optional exclusions, sold filter and
+    minimum price. Same string urlencode would build; only the query itself is
+    encoded per call (the suffix and tail are cached), and whole URLs are
+    memoized because every page asks for the same links on every rerun.
+    """
+    return (f"{EBAY_SEARCH_BASE}?_nkw={urllib.parse.quote_plus(query)}"
+            f"{_encoded_terms(exclude_auto, exclude_graded, graded_only)}{_url_tail(sold, min_price)}")
+
+
+def collx_queries(df: pd.DataFrame, search_fmt: str) -> pd.Series:
+    """eBay query for every collection row in the selected search format."""
+    # Categoricals and the nullable year -> plain text ("" for a missing year)
+    df = df[["year", "set", "brand", "number", "name", "team"]].astype("string").fillna("")
+    set_or_brand = df["set"].where(df["set"] != "", df["brand"])
+    if search_fmt == "Year + Set + Player":
+        queries = df["year"] + " " + set_or_brand + " " + df["name"]
+    elif search_fmt == "Year + Brand + Player":
+        queries = df["year"] + " " + df["brand"] + " " + df["name"]
+    elif search_fmt == "Year + Brand + # + Player":
+        num_str = ("#" + df["number"]).where(df["number"] != "", "")
+        queries = df["year"] + " " + df["brand"] + " " + num_str + " " + df["name"]
+    elif search_fmt == "Set + Player":
+        queries = set_or_brand + " " + df["name"]
+    else:  # Player + Team
+        queries = df["name"] + " " + df["team"]
+    return queries.str.strip()
+
+
+def ebay_search_urls(queries: pd.Series, min_price: Optional[int] = None) -> pd.DataFrame:
+    """
+    Raw / Graded / All / Active sold-search URLs for a Series of queries.
+    Same output as calling ebay_search_url four times per query (with
+    exclude_auto=True), but each distinct query is percent-encoded once and
+    the fixed suffixes are encoded once for the whole batch.
+    """
+    encoded = {q: urllib.parse.quote_plus(q) for q in queries.unique()}
+    head = f"{EBAY_SEARCH_BASE}?_nkw=" + queries.map(encoded)
+    sold_tail = _url_tail(True, min_price)
+    active_tail = _url_tail(False)
+    auto = _encoded_terms(True, False, False)
+    return pd.DataFrame({
+        "ebay_q": queries,
+        "url_raw": head + _encoded_terms(True, True, False) + sold_tail,
+        "url_graded": head + _encoded_terms(True, False, True) + sold_tail,
+        "url_all": head + auto + sold_tail,
+        "url_active": head + auto + active_tail,
+    }, index=queries.index)
@@ -0,0 +1,235 @@
+"""
+HTTP Disk Cache
+Conditional-request cache for outbound GETs, mounted on a requests Session as
+a transport adapter (CachingAdapter), so callers such as price_fetcher.py see
+ordinary 200 responses. Bodies are stored on disk with their ETag /
+Last-Modified; the next request for the same URL sends If-None-Match /
+If-Modified-Since and a 304 is answered from disk. The cache is an LRU
+bounded by total body size (recency survives restarts through file mtimes)
+and keeps hit / miss / revalidation / eviction counters.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+HTTP_CACHE_DIR = "data/.cache/http"
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+# Response headers kept with a body (transfer headers don't apply to the decoded body on disk)
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date", "Cache-Control")
+
+
+class CacheStats(NamedTuple):
+    hits: int  # served from disk without a request (younger than max_age)
+    misses: int  # nothing cached (or nothing to revalidate with): full download
+    revalidated: int  # 304 Not Modified: body served from disk
+    changed: int  # conditional request answered with a new body
+    evicted: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered with a cached body"""
+        served = self.hits + self.revalidated
+        total = served + self.misses + self.changed
+        return served / total if total else 0.0
+
+
+class HTTPCache:
+    """
+    Size-bounded LRU of response bodies in directory: <sha1(url)>.body plus a
+    <sha1(url)>.json with the URL, validators, kept headers and store time.
+    Thread-safe: the lock only guards the in-memory LRU; reads and writes of
+    entry files happen outside it. One instance per directory per process.
+    """
+
+    def __init__(self, directory: str = HTTP_CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES, max_age: float = 0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age  # seconds an entry is served without revalidating (0: always revalidate)
+        self._lru: "OrderedDict[str, int]" = OrderedDict()  # key -> body bytes, oldest first
+        self._bytes = 0
+        self._counts = dict.fromkeys(("hits", "misses", "revalidated", "changed", "evicted"), 0)
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        entries = []
+        for name in os.listdir(directory):
+            key, ext = os.path.splitext(name)
+            if ext == ".tmp":  # left by a write that never finished
+                os.remove(os.path.join(directory, name))
+                continue
+            body = self._path(key, ".body")
+            if ext == ".json" and os.path.exists(body):
+                entries.append((os.stat(self._path(key, ".json")).st_mtime_ns, key, os.path.getsize(body)))
+        for _, key, size in sorted(entries):
+            self._lru[key] = size
+            self._bytes += size
+
+    def _path(self, key: str, ext: str) -> str:
+        return os.path.join(self.directory, key + ext)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def get(self, url: str) -> Optional[Tuple[Dict, bytes]]:
+        """(metadata, body) for url, or None. Marks the entry most recently used."""
+        key = self.key(url)
+        with self._lock:
+            if key not in self._lru:
+                return None
+            self._lru.move_to_end(key)
+        # File I/O runs outside the lock, so fetch threads only queue on the LRU bookkeeping
+        try:
+            with open(self._path(key, ".json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(self._path(key, ".body"), "rb") as f:
+                body = f.read()
+            os.utime(self._path(key, ".json"))
+        except OSError:
+            # Evicted (or never fully written) under us: forget it, a later put rewrites it
+            with self._lock:
+                self._bytes -= self._lru.pop(key, 0)
+            return None
+        except ValueError:
+            self._discard(key)
+            return None
+        return meta, body
+
+    def put(self, url: str, headers: Dict[str, str], body: bytes) -> None:
+        """
+        Store a 200 body with its validators, evicting least recently used entries
+        past max_bytes. A body without ETag / Last-Modified, or one larger than
+        max_bytes, replaces nothing: any older entry for url is dropped instead,
+        so its stale validators are never sent again.
+        """
+        key = self.key(url)
+        if len(body) > self.max_bytes or not ("ETag" in headers or "Last-Modified" in headers):
+            self._discard(key)
+            return
+        meta = {"url": url, "stored_at": time.time(),
+                "headers": {h: headers[h] for h in STORED_HEADERS if h in headers}}
+        self._write(key, ".body", body)
+        self._write(key, ".json", json.dumps(meta).encode())
+        evicted = []
+        with self._lock:
+            self._bytes += len(body) - self._lru.pop(key, 0)
+            self._lru[key] = len(body)
+            while self._bytes > self.max_bytes:
+                old_key, size = self._lru.popitem(last=False)
+                self._bytes -= size
+                evicted.append(old_key)
+            self._counts["evicted"] += len(evicted)
+        for old_key in evicted:
+            self._remove_files(old_key)
+
+    def refresh(self, url: str, meta: Dict, headers: Dict[str, str]) -> Dict:
+        """
+        After a 304: merge the response's ETag / Last-Modified (and other kept
+        headers) into url's stored metadata and restart its max_age clock.
+        Returns the updated metadata.
+        """
+        meta = dict(meta, stored_at=time.time(),
+                    headers={**meta["headers"], **{h: headers[h] for h in STORED_HEADERS if h in headers}})
+        key = self.key(url)
+        with self._lock:
+            if key not in self._lru:
+                return meta
+        self._write(key, ".json", json.dumps(meta).encode())
+        return meta
+
+    def _write(self, key: str, ext: str, data: bytes) -> None:
+        # Unique temp file + rename: a reader never sees half a file, and two
+        # threads storing the same URL never write into one temp file
+        fd, tmp = tempfile.mkstemp(prefix=key, suffix=".tmp", dir=self.directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self._path(key, ext))
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            if key not in self._lru:
+                return
+            self._bytes -= self._lru.pop(key)
+        self._remove_files(key)
+
+    def _remove_files(self, key: str) -> None:
+        for ext in (".body", ".json"):
+            try:
+                os.remove(self._path(key, ext))
+            except OSError:
+                pass
+
+    def count(self, outcome: str) -> None:
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**self._counts, entries=len(self._lru), bytes=self._bytes)
+
+
+def _cached_response(
+    request: requests.PreparedRequest,
+    meta: Dict,
+    body: bytes,
+    adapter: HTTPAdapter,
+) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.reason = "OK"
+    resp.headers = CaseInsensitiveDict(meta["headers"])
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    resp._content = body
+    resp.url = request.url
+    resp.request = request
+    resp.connection = adapter
+    return resp
+
+
+class CachingAdapter(HTTPAdapter):
+    """HTTPAdapter that answers GETs through an HTTPCache with conditional requests."""
+
+    def __init__(self, cache: HTTPCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method != "GET" or stream:
+            return super().send(request, stream=stream, **kwargs)
+        cached = self.cache.get(request.url)
+        validators = {}
+        if cached is not None:
+            meta, body = cached
+            if self.cache.max_age and time.time() - meta["stored_at"] < self.cache.max_age:
+                self.cache.count("hits")
+                return _cached_response(request, meta, body, self)
+            headers = meta["headers"]
+            if "ETag" in headers:
+                validators["If-None-Match"] = headers["ETag"]
+            if "Last-Modified" in headers:
+                validators["If-Modified-Since"] = headers["Last-Modified"]
+            request.headers.update(validators)
+
+        resp = super().send(request, stream=stream, **kwargs)
+        if resp.status_code == 304 and validators:
+            self.cache.count("revalidated")
+            meta = self.cache.refresh(request.url, meta, resp.headers)
+            resp.close()
+            return _cached_response(request, meta, body, self)
+        self.cache.count("changed" if validators and resp.status_code == 200 else "misses")
+        if resp.status_code == 200:
+            self.cache.put(request.url, resp.headers, resp.content)
+        return resp
+
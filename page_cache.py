@@ -0,0 +1,70 @@
+"""
+Page Cache
+Thread-safe LRU for rendered HTML table pages. One instance is shared by every
+Streamlit session, so paging back (or another user opening the same page)
+serves the stored HTML instead of rebuilding every row and eBay link.
+Bounded by the stored HTML's total size: a 999-row page is close to 1 MB, and
+every search prefix a user types renders a page of its own.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+PAGE_CACHE_BYTES = 64 * 1024 * 1024
+PAGE_CACHE_ENTRIES = 512
+
+
+class LRUCache:
+    """
+    Bounded key -> value map; the least recently used entries are evicted first
+    once the values' total size (sys.getsizeof) passes max_bytes or there are
+    more than max_entries. A value larger than max_bytes is returned, not stored.
+    """
+
+    def __init__(self, max_bytes: int = PAGE_CACHE_BYTES, max_entries: int = PAGE_CACHE_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: str) -> str:
+        size = sys.getsizeof(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= sys.getsizeof(old)
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = value
+            self._bytes += size
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= sys.getsizeof(evicted)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
@@ -0,0 +1,319 @@
+"""
+PSA Price Guide Fetcher
+Downloads the price-guide page of every unscraped row in psa_cards.db `sets`
+and upserts its cards (psa_price_guide.py does the parsing and loading).
+Pages are fetched by a thread pool over one pooled requests Session; each host
+gets its own concurrency cap and token-bucket rate limit, and transient
+failures (connection errors, 429, 5xx) are retried with exponential backoff.
+A set is marked scraped only once its cards are committed, so an interrupted
+run picks up where it stopped. Responses go through the on-disk HTTP cache
+(http_cache.py), so a re-scrape only downloads pages that changed.
+--base-url points the stored URLs at another server (e.g. the local stub in
+scripts/price_fetch_load_test.py).
+Usage: python price_fetcher.py [--db data/psa_cards.db] [--workers 8] [--rate 2]
+"""
+
+import random
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import HTTP_CACHE_DIR, MAX_CACHE_BYTES, CachingAdapter, HTTPCache
+from psa_price_guide import BATCH_SIZE, PSA_DB_PATH, PriceRow, connect_price_db, ingest_rows, mark_scraped, parse_page
+
+USER_AGENT = "sports-card-checklists price fetcher"
+WORKERS = 8
+PER_HOST = 4  # requests in flight per host
+RATE = 2.0  # requests/sec per host (token bucket refill); 0 = unlimited
+BURST = 4  # tokens a host can bank while idle
+RETRIES = 3
+BACKOFF = 0.5  # seconds before the first retry, doubled each attempt (plus jitter)
+MAX_BACKOFF = 30.0
+TIMEOUT = (5, 30)  # connect, read seconds
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+UNSCRAPED_SETS_SQL = '''
+    SELECT sport, set_name, set_id, url FROM sets
+    WHERE scraped = 0 AND url IS NOT NULL AND url != '' ORDER BY id
+'''
+ALL_SETS_SQL = "SELECT sport, set_name, set_id, url FROM sets WHERE url IS NOT NULL AND url != '' ORDER BY id"
+
+
+class SetPage(NamedTuple):
+    sport: str
+    set_name: str
+    set_id: str
+    url: str
+
+
+class FetchStats(NamedTuple):
+    pages: int
+    failed: int
+    retries: int
+    rows: int
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        """Pages per second"""
+        return self.pages / self.seconds if self.seconds else 0.0
+
+
+class TokenBucket:
+    """rate tokens per second, at most burst banked; acquire() blocks until one is free."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_s = (1 - self.tokens) / self.rate
+            time.sleep(wait_s)
+
+
+def make_session(pool_size: int = WORKERS, cache: Optional[HTTPCache] = None) -> requests.Session:
+    """
+    A Session whose connection pool keeps pool_size keep-alive connections per host,
+    with GETs answered through cache (conditional requests) when one is given.
+    """
+    session = requests.Session()
+    adapter = CachingAdapter(cache, pool_maxsize=pool_size) if cache else HTTPAdapter(pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def rebase_url(url: str, base_url: Optional[str]) -> str:
+    """url with its scheme and host (and a base path prefix) taken from base_url."""
+    if not base_url:
+        return url
+    parts, base = urlsplit(url), urlsplit(base_url)
+    return urlunsplit((base.scheme, base.netloc, base.path.rstrip("/") + parts.path, parts.query, ""))
+
+
+def _retry_after(resp: requests.Response) -> Optional[float]:
+    value = resp.headers.get("Retry-After", "").strip()
+    return min(float(value), MAX_BACKOFF) if value.isdigit() else None
+
+
+class FetchStopped(Exception):
+    """Raised by PriceFetcher.get once stop() has been called."""
+
+
+class PriceFetcher:
+    """
+    Thread-safe GETs over one pooled Session, with a per-host concurrency cap,
+    a per-host token bucket and retries with exponential backoff and jitter.
+    stop() makes every get() in progress give up at its next attempt.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        workers: int = WORKERS,
+        per_host: int = PER_HOST,
+        rate: float = RATE,
+        burst: int = BURST,
+        retries: int = RETRIES,
+    ):
+        self.session = session or make_session(max(workers, per_host))
+        self.per_host = per_host
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.retried = 0
+        self._stopped = threading.Event()
+        self._hosts: Dict[str, Tuple[threading.BoundedSemaphore, TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host: str) -> Tuple[threading.BoundedSemaphore, TokenBucket]:
+        with self._lock:
+            limits = self._hosts.get(host)
+            if limits is None:
+                limits = self._hosts[host] = (threading.BoundedSemaphore(self.per_host),
+                                              TokenBucket(self.rate, self.burst))
+            return limits
+
+    def _backoff(self, attempt: int) -> float:
+        with self._lock:
+            self.retried += 1
+        return min(BACKOFF * 2 ** attempt, MAX_BACKOFF) * random.uniform(0.5, 1.5)
+
+    def stop(self) -> None:
+        """Make get() raise FetchStopped instead of starting another request or retry."""
+        self._stopped.set()
+
+    def get(self, url: str) -> str:
+        """Body of url; raises requests.RequestException once retries are spent."""
+        slots, bucket = self._host(urlsplit(url).netloc)
+        for attempt in range(self.retries + 1):
+            bucket.acquire()
+            if self._stopped.is_set():
+                raise FetchStopped(url)
+            try:
+                with slots:
+                    resp = self.session.get(url, timeout=TIMEOUT)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if resp.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    resp.raise_for_status()
+                    return resp.text
+                delay = max(_retry_after(resp) or 0.0, self._backoff(attempt))
+            self._stopped.wait(delay)
+
+
+def pending_sets(conn: sqlite3.Connection, rescrape: bool = False, limit: Optional[int] = None) -> List[SetPage]:
+    """Sets with a URL still to fetch (every set with a URL if rescrape), in id order."""
+    rows = conn.execute(ALL_SETS_SQL if rescrape else UNSCRAPED_SETS_SQL)
+    return [SetPage._make(r) for r in (rows.fetchmany(limit) if limit else rows)]
+
+
+class EmptyPageError(ValueError):
+    """A fetched page with no price table (layout change, captcha, truncated body)."""
+
+
+def _fetch_set(fetcher: PriceFetcher, page: SetPage, base_url: Optional[str]) -> List[PriceRow]:
+    url = rebase_url(page.url, base_url)
+    rows = list(parse_page(fetcher.get(url), page.sport, page.set_name, page.url, page.set_id))
+    if not rows:
+        # A failure, not an empty set: the set stays unscraped and the next run retries it
+        raise EmptyPageError(f"no price rows on {url}")
+    return rows
+
+
+def _commit(conn: sqlite3.Connection, rows: List[PriceRow], set_ids: List[str]) -> None:
+    # Cards first, then the scraped flags: a crash in between only means a refetch
+    if rows:
+        ingest_rows(conn, rows)
+    mark_scraped(conn, set_ids)
+
+
+def fetch_sets(
+    db_path: str = PSA_DB_PATH,
+    fetcher: Optional[PriceFetcher] = None,
+    base_url: Optional[str] = None,
+    workers: int = WORKERS,
+    rescrape: bool = False,
+    limit: Optional[int] = None,
+    progress: Optional[Callable[[SetPage, Optional[Exception], FetchStats], None]] = None,
+) -> FetchStats:
+    """
+    Fetch and ingest every unscraped set (every set if rescrape) in db_path.
+    Cards are committed every BATCH_SIZE rows and when the run ends, including on
+    Ctrl-C: queued pages are then dropped and in-flight ones stop before their next
+    request, so only pages already fetched are committed. A page that can't be fetched or has no price rows counts as failed and
+    its set stays unscraped. progress(set, error or None, stats so far) is called per page.
+    """
+    fetcher = fetcher or PriceFetcher(workers=workers)
+    conn = connect_price_db(db_path)
+    todo = iter(pending_sets(conn, rescrape, limit))
+    pages = failed = rows = 0
+    batch: List[PriceRow] = []
+    done_ids: List[str] = []
+    t0 = time.perf_counter()
+    pool = ThreadPoolExecutor(workers)
+    running = {}
+    try:
+        while True:
+            # Keep a bounded number of pages in flight; the DB writes stay on this thread
+            for page in todo:
+                running[pool.submit(_fetch_set, fetcher, page, base_url)] = page
+                if len(running) >= workers * 2:
+                    break
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                page = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    page_rows = future.result()
+                    batch.extend(page_rows)
+                    done_ids.append(page.set_id)
+                    pages += 1
+                    rows += len(page_rows)
+                else:
+                    failed += 1
+                if len(batch) >= BATCH_SIZE:
+                    _commit(conn, batch, done_ids)
+                    batch, done_ids = [], []
+                if progress:
+                    progress(page, error, FetchStats(pages, failed, fetcher.retried, rows,
+                                                     time.perf_counter() - t0))
+    finally:
+        # Interrupted (Ctrl-C or an error): drop the queued pages and stop the running
+        # ones rather than waiting for them to be fetched, then commit what finished
+        if running:
+            fetcher.stop()
+        pool.shutdown(wait=False, cancel_futures=True)
+        if done_ids:
+            _commit(conn, batch, done_ids)
+        conn.close()
+    return FetchStats(pages, failed, fetcher.retried, rows, time.perf_counter() - t0)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fetch PSA price-guide pages for unscraped sets into psa_cards.db")
+    parser.add_argument("--db", default=PSA_DB_PATH, help="psa_cards.db to read sets from and upsert into")
+    parser.add_argument("--base-url", help="send every request here instead (scheme://host[:port][/prefix])")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="fetch threads")
+    parser.add_argument("--per-host", type=int, default=PER_HOST, help="requests in flight per host")
+    parser.add_argument("--rate", type=float, default=RATE, help="requests/sec per host (0: unlimited)")
+    parser.add_argument("--burst", type=int, default=BURST, help="requests a host may burst after idling")
+    parser.add_argument("--retries", type=int, default=RETRIES, help="retries per page on errors / 429 / 5xx")
+    parser.add_argument("--limit", type=int, help="fetch at most this many sets")
+    parser.add_argument("--rescrape", action="store_true", help="refetch sets already marked scraped")
+    parser.add_argument("--cache-dir", default=HTTP_CACHE_DIR, help="HTTP cache directory")
+    parser.add_argument("--cache-mb", type=int, default=MAX_CACHE_BYTES // 2 ** 20, help="HTTP cache size limit (MB)")
+    parser.add_argument("--no-cache", action="store_true", help="always download full pages")
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else HTTPCache(args.cache_dir, args.cache_mb * 2 ** 20)
+    fetcher = PriceFetcher(make_session(max(args.workers, args.per_host), cache), per_host=args.per_host,
+                           rate=args.rate, burst=args.burst, retries=args.retries)
+
+    def progress(page: SetPage, error: Optional[Exception], stats: FetchStats) -> None:
+        if error is not None:
+            print(f"\n  {page.set_name}: {error}", file=sys.stderr)
+        print(f"\r  {stats.pages:,} pages, {stats.failed:,} failed, {stats.rows:,} cards  "
+              f"{stats.rate:,.1f} pages/sec", end="", file=sys.stderr, flush=True)
+
+    stats = fetch_sets(args.db, fetcher, args.base_url, args.workers, args.rescrape, args.limit, progress)
+    print(file=sys.stderr)
+    print(f"{stats.pages:,} pages ({stats.failed:,} failed, {stats.retries:,} retries), {stats.rows:,} cards "
+          f"in {stats.seconds:.2f}s - {stats.rate:,.1f} pages/sec -> {args.db}")
+    if cache:
+        c = cache.stats()
+        print(f"HTTP cache: {c.revalidated:,} not modified, {c.changed:,} changed, {c.misses:,} misses, "
+              f"{c.hits:,} fresh hits ({c.hit_ratio:.0%} from disk); {c.entries:,} entries, "
+              f"{c.bytes / 2 ** 20:,.1f} MB, {c.evicted:,} evicted")
+
+
+if __name__ == "__main__":
+    main()
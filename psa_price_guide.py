@@ -0,0 +1,381 @@
+"""
+PSA Price Guide Ingestion
+Loads saved PSA price-guide pages (.html) and exports (.csv) from a local
+directory into data/psa_cards.db: one `sets` row per set and one `cards` row per
+card with its PSA 1-10 prices. Rows are upserted with executemany in batched
+transactions (WAL mode), so re-running over the same folder refreshes prices
+in place. Nothing here touches the network.
+Layout: <dir>/<sport>/<year> <set name>.html|.csv (sport/set come from the path
+unless a CSV row has its own sport / year / set columns).
+Usage: python psa_price_guide.py saved-price-guide/ [--db data/psa_cards.db]
+"""
+
+import csv
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+PSA_DB_PATH = "data/psa_cards.db"
+BATCH_SIZE = 5000  # card rows per transaction
+GRADES = range(1, 11)
+
+# Header text -> column role. Grade columns are "10", "PSA 10", "psa_10", "9.0", ...
+GRADE_HEADER = re.compile(r"^(?:psa[\s_-]*)?(10|[1-9])(?:\.0)?$")
+NUMBER_HEADERS = {"#", "no", "no.", "number", "card #", "card no", "card no.", "card number"}
+PLAYER_HEADERS = {"name", "player", "player name", "card", "card name", "description", "subject"}
+SPORT_HEADERS = {"sport", "category"}
+YEAR_HEADERS = {"year"}
+SET_HEADERS = {"set", "set name"}
+MIN_GRADE_COLUMNS = 3  # a header row needs at least this many grade columns
+
+
+class PriceRow(NamedTuple):
+    sport: str
+    year: Optional[int]
+    set_name: str
+    set_id: str
+    url: str
+    card_number: str
+    player: str
+    prices: Tuple[Optional[float], ...]  # PSA 1..10
+
+
+class IngestStats(NamedTuple):
+    files: int
+    sets: int
+    rows: int
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        """Card rows per second"""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def create_price_schema(conn: sqlite3.Connection) -> None:
+    """The psa_cards.db schema (no-op on an existing DB)."""
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS cards (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sport TEXT,
+            year INTEGER,
+            set_name TEXT,
+            set_id TEXT,
+            card_number TEXT,
+            player TEXT,
+            psa_1 REAL, psa_2 REAL, psa_3 REAL, psa_4 REAL,
+            psa_5 REAL, psa_6 REAL, psa_7 REAL, psa_8 REAL,
+            psa_9 REAL, psa_10 REAL,
+            last_updated TEXT,
+            UNIQUE(sport, set_id, card_number, player)
+        );
+        CREATE TABLE IF NOT EXISTS sets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sport TEXT,
+            set_name TEXT,
+            set_id TEXT UNIQUE,
+            url TEXT,
+            scraped INTEGER DEFAULT 0,
+            card_count INTEGER DEFAULT 0,
+            last_updated TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_cards_psa10 ON cards(psa_10);
+        CREATE INDEX IF NOT EXISTS idx_cards_psa9 ON cards(psa_9);
+        CREATE INDEX IF NOT EXISTS idx_cards_player ON cards(player);
+        CREATE INDEX IF NOT EXISTS idx_cards_sport ON cards(sport);
+    ''')
+
+
+# ── Parsing ──────────────────────────────────────────────────────────
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def set_id_for(sport: str, set_name: str) -> str:
+    """Stable set id: '<sport>-<set name slug>', e.g. 'baseball-1952-topps'."""
+    return slugify(f"{sport} {set_name}")
+
+
+def parse_price(text: str) -> Optional[float]:
+    """'$1,250.00' -> 1250.0; blanks, dashes and 'N/A' -> None."""
+    text = text.replace("$", "").replace(",", "").strip()
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _year_of(set_name: str) -> Optional[int]:
+    match = re.match(r"(\d{4})", set_name)
+    return int(match.group(1)) if match else None
+
+
+def _column_roles(header: List[str]) -> Optional[Dict[str, int]]:
+    """{role: column index} for a header row, or None if it isn't a price table header."""
+    roles: Dict[str, int] = {}
+    for i, cell in enumerate(header):
+        key = " ".join(cell.lower().split())
+        grade = GRADE_HEADER.match(key)
+        if grade:
+            roles.setdefault(f"psa_{grade.group(1)}", i)
+        for role, names in (("number", NUMBER_HEADERS), ("player", PLAYER_HEADERS), ("sport", SPORT_HEADERS),
+                            ("year", YEAR_HEADERS), ("set", SET_HEADERS)):
+            if key in names:
+                roles.setdefault(role, i)
+    if sum(role.startswith("psa_") for role in roles) < MIN_GRADE_COLUMNS or "player" not in roles:
+        return None
+    return roles
+
+
+def _price_rows(
+    table: Iterable[List[str]],
+    sport: str,
+    set_name: str,
+    url: str,
+    set_id: Optional[str] = None,
+) -> Iterator[PriceRow]:
+    """
+    PriceRows from a table's rows (header found by content, anything above it skipped).
+    set_id pins every row to an existing sets row instead of deriving one per row.
+    """
+    roles = None
+    for cells in table:
+        if roles is None:
+            roles = _column_roles(cells)
+            continue
+
+        def cell(role: str) -> str:
+            i = roles.get(role)
+            return cells[i].strip() if i is not None and i < len(cells) else ""
+
+        player = cell("player")
+        if not player:
+            continue
+        row_sport = cell("sport").lower() or sport
+        row_set = cell("set") or set_name
+        year = cell("year")
+        yield PriceRow(
+            sport=row_sport,
+            year=int(year) if year.isdigit() else _year_of(row_set),
+            set_name=row_set,
+            set_id=set_id or set_id_for(row_sport, row_set),
+            url=url,
+            card_number=cell("number").lstrip("#"),
+            player=player,
+            prices=tuple(parse_price(cell(f"psa_{g}")) for g in GRADES),
+        )
+
+
+class _PageParser(HTMLParser):
+    """Every <table> on a page as lists of cell text, plus the page's canonical URL."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tables: List[List[List[str]]] = []
+        self.canonical = ""
+        self._open: List[List[List[str]]] = []  # tables being read (nested tables stack)
+        self._cell: Optional[List[str]] = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            self._open.append([])
+        elif tag == "tr" and self._open:
+            self._open[-1].append([])
+        elif tag in ("td", "th") and self._open and self._open[-1]:
+            self._cell = []
+        elif tag == "link":
+            attrs = dict(attrs)
+            if attrs.get("rel") == "canonical":
+                self.canonical = attrs.get("href") or ""
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th") and self._cell is not None:
+            self._open[-1][-1].append(" ".join("".join(self._cell).split()))
+            self._cell = None
+        elif tag == "table" and self._open:
+            self.tables.append(self._open.pop())
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def _page_rows(parser: _PageParser, sport: str, set_name: str, url: str, set_id: Optional[str]) -> Iterator[PriceRow]:
+    parser.close()
+    for table in parser.tables:
+        yield from _price_rows(table, sport, set_name, url or parser.canonical, set_id)
+
+
+def parse_page(
+    text: str,
+    sport: str,
+    set_name: str,
+    url: str = "",
+    set_id: Optional[str] = None,
+) -> Iterator[PriceRow]:
+    """PriceRows from one price-guide page's HTML (e.g. a fetched response body)."""
+    parser = _PageParser()
+    parser.feed(text)
+    return _page_rows(parser, sport, set_name, url, set_id)
+
+
+def parse_file(path: str, sport: str = "") -> Iterator[PriceRow]:
+    """PriceRows from one saved price-guide page (.html/.htm) or export (.csv)."""
+    set_name = os.path.splitext(os.path.basename(path))[0].strip()
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from _price_rows(csv.reader(f), sport, set_name, "")
+        return
+    parser = _PageParser()
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for chunk in iter(lambda: f.read(1 << 16), ""):
+            parser.feed(chunk)
+    yield from _page_rows(parser, sport, set_name, "", None)
+
+
+def price_guide_files(root: str) -> Iterator[Tuple[str, str]]:
+    """(path, sport) for every .html/.htm/.csv under root; sport is the folder name below root."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel = os.path.relpath(dirpath, root)
+        sport = "" if rel == "." else rel.split(os.sep)[0].lower()
+        for name in sorted(filenames):
+            if name.lower().endswith((".html", ".htm", ".csv")):
+                yield os.path.join(dirpath, name), sport
+
+
+# ── Loading ──────────────────────────────────────────────────────────
+
+# Leaves `scraped` alone: a set's cards can span batches, so it is only marked
+# (MARK_SCRAPED_SQL) once all of them are committed
+UPSERT_SET_SQL = '''
+    INSERT INTO sets (sport, set_name, set_id, url, scraped, last_updated)
+    VALUES (?, ?, ?, ?, 0, ?)
+    ON CONFLICT(set_id) DO UPDATE SET
+        sport = excluded.sport,
+        set_name = excluded.set_name,
+        url = COALESCE(NULLIF(excluded.url, ''), sets.url),
+        last_updated = excluded.last_updated
+'''
+# A page missing a grade keeps the price already stored for it
+UPSERT_CARD_SQL = f'''
+    INSERT INTO cards (sport, year, set_name, set_id, card_number, player,
+                       {", ".join(f"psa_{g}" for g in GRADES)}, last_updated)
+    VALUES ({", ".join("?" * (7 + len(GRADES)))})
+    ON CONFLICT(sport, set_id, card_number, player) DO UPDATE SET
+        year = excluded.year,
+        set_name = excluded.set_name,
+        {", ".join(f"psa_{g} = COALESCE(excluded.psa_{g}, cards.psa_{g})" for g in GRADES)},
+        last_updated = excluded.last_updated
+'''
+UPDATE_CARD_COUNT_SQL = '''
+    UPDATE sets SET card_count = (SELECT COUNT(*) FROM cards WHERE sport = ? AND set_id = ?)
+    WHERE set_id = ?
+'''
+MARK_SCRAPED_SQL = "UPDATE sets SET scraped = 1, last_updated = ? WHERE set_id = ?"
+
+
+def connect_price_db(db_path: str = PSA_DB_PATH) -> sqlite3.Connection:
+    """psa_cards.db in WAL mode (readers never block on a running ingest), schema ensured."""
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # durable at checkpoints; safe under WAL
+    create_price_schema(conn)
+    return conn
+
+
+def _flush(conn: sqlite3.Connection, rows: List[PriceRow], now: str) -> None:
+    sets = {(r.sport, r.set_id): (r.sport, r.set_name, r.set_id, r.url, now) for r in rows}
+    with conn:
+        conn.executemany(UPSERT_SET_SQL, sets.values())
+        conn.executemany(UPSERT_CARD_SQL, [
+            (r.sport, r.year, r.set_name, r.set_id, r.card_number, r.player, *r.prices, now) for r in rows
+        ])
+        conn.executemany(UPDATE_CARD_COUNT_SQL, [(sport, set_id, set_id) for sport, set_id in sets])
+
+
+def ingest_rows(
+    conn: sqlite3.Connection,
+    rows: Iterable[PriceRow],
+    batch_size: int = BATCH_SIZE,
+) -> Tuple[int, int]:
+    """Upsert rows batch by batch (one transaction each). Returns (rows, distinct sets)."""
+    now = datetime.now().isoformat(timespec="seconds")
+    batch: List[PriceRow] = []
+    total = 0
+    set_ids = set()
+    for row in rows:
+        batch.append(row)
+        set_ids.add(row.set_id)
+        if len(batch) >= batch_size:
+            _flush(conn, batch, now)
+            total += len(batch)
+            batch = []
+    if batch:
+        _flush(conn, batch, now)
+        total += len(batch)
+    return total, len(set_ids)
+
+
+def mark_scraped(conn: sqlite3.Connection, set_ids: Iterable[str]) -> None:
+    """Flag sets as fully loaded. Call only after every one of their cards is committed."""
+    now = datetime.now().isoformat(timespec="seconds")
+    with conn:
+        conn.executemany(MARK_SCRAPED_SQL, [(now, set_id) for set_id in set_ids])
+
+
+def ingest_directory(
+    root: str,
+    db_path: str = PSA_DB_PATH,
+    batch_size: int = BATCH_SIZE,
+    progress: Optional[Callable[[str, int, float], None]] = None,
+) -> IngestStats:
+    """
+    Ingest every saved page / export under root into db_path. The sets are
+    marked scraped once the last batch is committed (an interrupted run leaves
+    them unscraped). progress(path, rows_so_far, seconds) is called after each file.
+    """
+    files = list(price_guide_files(root))
+    counts = {"rows": 0}
+    set_ids = set()
+    t0 = time.perf_counter()
+
+    def all_rows() -> Iterator[PriceRow]:
+        for path, sport in files:
+            for row in parse_file(path, sport):
+                counts["rows"] += 1
+                set_ids.add(row.set_id)
+                yield row
+            if progress:
+                progress(path, counts["rows"], time.perf_counter() - t0)
+
+    conn = connect_price_db(db_path)
+    try:
+        rows, _ = ingest_rows(conn, all_rows(), batch_size)
+        mark_scraped(conn, set_ids)
+    finally:
+        conn.close()
+    return IngestStats(len(files), len(set_ids), rows, time.perf_counter() - t0)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load saved PSA price-guide pages/exports into psa_cards.db")
+    parser.add_argument("root", help="folder of saved .html / .csv price-guide files (<sport>/<set>.html)")
+    parser.add_argument("--db", default=PSA_DB_PATH, help="SQLite database to upsert into")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE, help="card rows per transaction")
+    args = parser.parse_args()
+
+    def report(path: str, rows: int, seconds: float) -> None:
+        print(f"  {os.path.relpath(path, args.root)}: {rows:,} rows so far ({rows / seconds if seconds else 0:,.0f}/s)")
+
+    stats = ingest_directory(args.root, args.db, args.batch, report)
+    print(f"{stats.rows:,} card rows from {stats.files} files ({stats.sets} sets) in {stats.seconds:.2f}s "
+          f"- {stats.rate:,.0f} rows/sec -> {args.db}")
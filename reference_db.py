@@ -0,0 +1,166 @@
+"""
+Reference DB Access
+Read-only queries against data/reference.db (key players, valuable sets) for the
+app and the listing generator. Connections are opened once in read-only,
+immutable URI mode with memory-mapped I/O and pooled, so a page visit or a
+listing borrows an open connection instead of opening (and leaking) a new one.
+Each query is a fixed SQL string with bound parameters, so sqlite3's per-connection
+statement cache prepares it once per pooled connection. reference_index() holds
+the in-memory lookups the listing generator runs per card, built once per DB file.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from search_index import NgramIndex, SubstringMatcher
+
+REFERENCE_DB_PATH = "data/reference.db"
+MMAP_SIZE = 64 * 1024 * 1024  # well above the DB size: every read is served from the page cache
+POOL_SIZE = 8  # idle connections kept per DB file; extra ones are closed when returned
+LOOKUP_MEMO_SIZE = 16384  # memoized player / set lookups per ReferenceIndex
+
+
+class KeyPlayer(NamedTuple):
+    player_name: str
+    sport: str
+
+
+class ValuableSet(NamedTuple):
+    set_name: str
+    sport: str
+    year: Optional[int]
+    tier: int
+    notes: Optional[str]
+    key_cards: Optional[str]
+
+
+KEY_PLAYERS_SQL = "SELECT player_name, sport FROM key_players ORDER BY sport, id"
+IS_KEY_PLAYER_SQL = "SELECT 1 FROM key_players WHERE LOWER(player_name) = LOWER(?)"
+VALUABLE_SETS_SQL = "SELECT set_name, sport, year, tier, notes, key_cards FROM valuable_sets ORDER BY id"
+VALUABLE_SETS_BY_TIER_SQL = (
+    "SELECT set_name, sport, year, tier, notes, key_cards FROM valuable_sets WHERE tier = ? ORDER BY sport, year"
+)
+
+# (absolute path, size, mtime_ns) -> idle connections. immutable=1 tells SQLite the
+# file never changes, so a rebuilt file gets a new key and fresh connections.
+_idle: Dict[Tuple[str, int, int], List[sqlite3.Connection]] = {}
+_lock = threading.Lock()
+
+
+def _open(path: str) -> sqlite3.Connection:
+    uri = f"{Path(path).as_uri()}?mode=ro&immutable=1"
+    # A pooled connection moves between threads, but only one thread uses it at a time
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    return conn
+
+
+@contextmanager
+def connection(db_path: str = REFERENCE_DB_PATH) -> Iterator[sqlite3.Connection]:
+    """Borrow a read-only connection to db_path; FileNotFoundError if it is missing."""
+    path = os.path.abspath(db_path)
+    st = os.stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    with _lock:
+        idle = _idle.get(key)
+        if idle is None:
+            # First use, or the file was rebuilt: drop connections to older versions
+            for old_key in [k for k in _idle if k[0] == path]:
+                for old in _idle.pop(old_key):
+                    old.close()
+            idle = _idle[key] = []
+        conn = idle.pop() if idle else None
+    if conn is None:
+        conn = _open(path)
+    try:
+        yield conn
+    finally:
+        with _lock:
+            idle = _idle.get(key)
+            if idle is not None and len(idle) < POOL_SIZE:
+                idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+
+
+def exists(db_path: str = REFERENCE_DB_PATH) -> bool:
+    return os.path.exists(db_path)
+
+
+def key_players(db_path: str = REFERENCE_DB_PATH) -> List[KeyPlayer]:
+    """Every key player, grouped by sport in insertion order."""
+    with connection(db_path) as conn:
+        return [KeyPlayer._make(r) for r in conn.execute(KEY_PLAYERS_SQL)]
+
+
+def is_key_player(player: str, db_path: str = REFERENCE_DB_PATH) -> bool:
+    """True if player is a key player (case-insensitive exact name)."""
+    with connection(db_path) as conn:
+        return conn.execute(IS_KEY_PLAYER_SQL, (player,)).fetchone() is not None
+
+
+def valuable_sets(tier: Optional[int] = None, db_path: str = REFERENCE_DB_PATH) -> List[ValuableSet]:
+    """Valuable sets in insertion order, or one tier's sets by sport and year."""
+    with connection(db_path) as conn:
+        if tier is None:
+            rows = conn.execute(VALUABLE_SETS_SQL)
+        else:
+            rows = conn.execute(VALUABLE_SETS_BY_TIER_SQL, (tier,))
+        return [ValuableSet._make(r) for r in rows]
+
+
+# SQLite's built-in LOWER() only folds ASCII letters
+_SQL_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+class ReferenceIndex:
+    """
+    Key-player and valuable-set lookups for one version of the reference DB.
+
+    is_key_player() is the in-memory form of IS_KEY_PLAYER_SQL. match_set()
+    returns the first valuable set (insertion order) whose lowercased name is a
+    substring of the lowercased query or contains it: names inside the query
+    come from an Aho-Corasick pass over the query, names containing it from an
+    n-gram index over the names. Both lookups are memoized per index, so a
+    bulk run repeating the same players and sets answers repeats from a dict.
+    """
+
+    def __init__(self, players: Iterable[KeyPlayer], sets: List[ValuableSet]):
+        self.sets = sets
+        self._player_names = frozenset(
+            p.player_name.translate(_SQL_LOWER) for p in players if p.player_name is not None
+        )
+        names = [s.set_name.lower() for s in sets]
+        self._names_within = SubstringMatcher(names)
+        self._names_containing = NgramIndex((name,) for name in names)
+        self.is_key_player = lru_cache(maxsize=LOOKUP_MEMO_SIZE)(self._is_key_player)
+        self.match_set = lru_cache(maxsize=LOOKUP_MEMO_SIZE)(self._match_set)
+
+    def _is_key_player(self, player: str) -> bool:
+        return player.translate(_SQL_LOWER) in self._player_names
+
+    def _match_set(self, set_name: Optional[str]) -> Optional[ValuableSet]:
+        q = (set_name or "").lower()
+        hits = self._names_containing.search(q, limit=1)
+        pos = self._names_within.first_in(q)
+        if pos is not None:
+            hits.append(pos)
+        return self.sets[min(hits)] if hits else None
+
+
+@lru_cache(maxsize=1)
+def _build_reference_index(path: str, size: int, mtime_ns: int) -> ReferenceIndex:
+    return ReferenceIndex(key_players(path), valuable_sets(db_path=path))
+
+
+def reference_index(db_path: str = REFERENCE_DB_PATH) -> ReferenceIndex:
+    """The ReferenceIndex for db_path's current contents (rebuilt when the file changes)."""
+    path = os.path.abspath(db_path)
+    st = os.stat(path)
+    return _build_reference_index(path, st.st_size, st.st_mtime_ns)
@@ -0,0 +1,211 @@
+"""
+Sold-Comps History
+Append-only `sales` table in data/psa_cards.db: one row per sold listing
+(card, grading company, grade, price, sale time, source, listing id), next to
+the price-guide snapshot in `cards`. Bulk inserts skip listings already stored
+(UNIQUE(source, listing_id)), so the same export or feed can be loaded again;
+any other bad row (e.g. no price) fails the load. sold_at is stored in one
+canonical ISO form, so text order is time order.
+(card_id, grade, sold_at) and (card_id, sold_at) indexes serve the per-card
+queries - last N sales and a date window - straight from the index in sale
+order, however many comps a card has.
+Usage: python sales_history.py import sales.csv [--db data/psa_cards.db]
+       python sales_history.py last CARD_ID [-n 20] [--grade 10]
+"""
+
+import csv
+import sqlite3
+import time
+from datetime import datetime, timezone
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from psa_price_guide import BATCH_SIZE, PSA_DB_PATH, connect_price_db
+
+SALE_COLUMNS = ["card_id", "grade_company", "grade", "price", "sold_at", "source", "listing_id"]
+
+
+class Sale(NamedTuple):
+    card_id: int
+    grade_company: str  # "PSA", "BGS", "SGC", ... ("" for raw)
+    grade: Optional[float]  # None for raw
+    price: float
+    sold_at: Union[str, datetime]  # ISO 8601, e.g. "2026-01-29T18:04:00" or "2026-01-29 18:04"
+    source: str  # "ebay", "pwcc", ...
+    listing_id: str
+
+
+class SalesLoad(NamedTuple):
+    inserted: int
+    duplicates: int
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        """Rows (inserted or skipped) per second"""
+        return (self.inserted + self.duplicates) / self.seconds if self.seconds else 0.0
+
+
+def create_sales_schema(conn: sqlite3.Connection) -> None:
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS sales (
+            id INTEGER PRIMARY KEY,
+            card_id INTEGER NOT NULL REFERENCES cards(id),
+            grade_company TEXT NOT NULL DEFAULT '',
+            grade REAL,
+            price REAL NOT NULL,
+            sold_at TEXT NOT NULL,
+            source TEXT NOT NULL,
+            listing_id TEXT NOT NULL,
+            UNIQUE(source, listing_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_sales_card_grade_sold ON sales(card_id, grade, sold_at);
+        CREATE INDEX IF NOT EXISTS idx_sales_card_sold ON sales(card_id, sold_at);
+    ''')
+
+
+def connect_sales_db(db_path: str = PSA_DB_PATH) -> sqlite3.Connection:
+    """psa_cards.db (WAL) with the price-guide and sales tables ensured."""
+    conn = connect_price_db(db_path)
+    create_sales_schema(conn)
+    return conn
+
+
+# Only a listing already stored is skipped; NOT NULL and other failures still raise
+INSERT_SALE_SQL = f'''
+    INSERT INTO sales ({", ".join(SALE_COLUMNS)}) VALUES ({", ".join("?" * len(SALE_COLUMNS))})
+    ON CONFLICT(source, listing_id) DO NOTHING
+'''
+SALE_SELECT = f"SELECT {', '.join(SALE_COLUMNS)} FROM sales"
+
+
+def sold_at_text(value: Union[str, datetime]) -> str:
+    """
+    Canonical stored form of a sale time: 'YYYY-MM-DDTHH:MM:SS'. Takes a datetime
+    or any ISO string ("2026-01-29", "2026-01-29 18:04", ...); times with a UTC
+    offset are stored as UTC. Raises ValueError for anything else.
+    """
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(value.strip())
+        except (AttributeError, ValueError):
+            raise ValueError(f"sold_at is not an ISO 8601 date/time: {value!r}") from None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="seconds")
+
+
+def add_sales(conn: sqlite3.Connection, sales: Iterable[Sale], batch_size: int = BATCH_SIZE) -> SalesLoad:
+    """
+    Append sales batch by batch (one transaction each). A (source, listing_id)
+    already in the table is skipped, so re-loading the same sales is a no-op.
+    A sale that breaks any other constraint, or whose sold_at doesn't parse,
+    raises; batches before it stay committed.
+    """
+    inserted = total = 0
+    batch: List[Tuple] = []
+    t0 = time.perf_counter()
+
+    def flush() -> int:
+        before = conn.total_changes
+        with conn:
+            conn.executemany(INSERT_SALE_SQL, batch)
+        return conn.total_changes - before
+
+    for sale in sales:
+        batch.append((*sale[:4], sold_at_text(sale.sold_at), *sale[5:]))
+        if len(batch) >= batch_size:
+            inserted += flush()
+            total += len(batch)
+            batch = []
+    if batch:
+        inserted += flush()
+        total += len(batch)
+    return SalesLoad(inserted, total - inserted, time.perf_counter() - t0)
+
+
+def _card_filter(card_id: int, grade: Optional[float], grade_company: Optional[str]) -> Tuple[str, List]:
+    # card_id (+ grade) pick the index; grade_company is checked on the rows it yields
+    where, params = ["card_id = ?"], [card_id]
+    if grade is not None:
+        where.append("grade = ?")
+        params.append(grade)
+    if grade_company is not None:
+        where.append("grade_company = ?")
+        params.append(grade_company)
+    return " AND ".join(where), params
+
+
+def last_sales(
+    conn: sqlite3.Connection,
+    card_id: int,
+    n: int = 20,
+    grade: Optional[float] = None,
+    grade_company: Optional[str] = None,
+) -> List[Sale]:
+    """A card's n most recent sales, newest first (one grade / company if given)."""
+    where, params = _card_filter(card_id, grade, grade_company)
+    rows = conn.execute(f"{SALE_SELECT} WHERE {where} ORDER BY sold_at DESC LIMIT ?", (*params, n))
+    return [Sale._make(r) for r in rows]
+
+
+def sales_between(
+    conn: sqlite3.Connection,
+    card_id: int,
+    start: Union[str, datetime],
+    end: Union[str, datetime],
+    grade: Optional[float] = None,
+    grade_company: Optional[str] = None,
+) -> List[Sale]:
+    """A card's sales with start <= sold_at < end, oldest first (one grade / company if given)."""
+    where, params = _card_filter(card_id, grade, grade_company)
+    rows = conn.execute(
+        f"{SALE_SELECT} WHERE {where} AND sold_at >= ? AND sold_at < ? ORDER BY sold_at",
+        (*params, sold_at_text(start), sold_at_text(end)),
+    )
+    return [Sale._make(r) for r in rows]
+
+
+def read_sales_csv(path: str) -> Iterable[Sale]:
+    """Sales from a CSV with SALE_COLUMNS headers (blank grade = raw)."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            grade = (row.get("grade") or "").strip()
+            yield Sale(
+                card_id=int(row["card_id"]),
+                grade_company=(row.get("grade_company") or "").strip(),
+                grade=float(grade) if grade else None,
+                price=float(row["price"].replace("$", "").replace(",", "")),
+                sold_at=row["sold_at"].strip(),
+                source=row["source"].strip(),
+                listing_id=row["listing_id"].strip(),
+            )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sold-comps history in psa_cards.db")
+    parser.add_argument("--db", default=PSA_DB_PATH, help="SQLite database")
+    commands = parser.add_subparsers(dest="command", required=True)
+    load = commands.add_parser("import", help="append sales from a CSV (duplicates skipped)")
+    load.add_argument("csv", help=f"CSV with columns {', '.join(SALE_COLUMNS)}")
+    show = commands.add_parser("last", help="a card's most recent sales")
+    show.add_argument("card_id", type=int)
+    show.add_argument("-n", type=int, default=20, help="how many sales")
+    show.add_argument("--grade", type=float, help="only this grade")
+    show.add_argument("--company", help="only this grading company")
+    args = parser.parse_args()
+
+    conn = connect_sales_db(args.db)
+    if args.command == "import":
+        try:
+            stats = add_sales(conn, read_sales_csv(args.csv))
+        except (ValueError, sqlite3.IntegrityError) as e:
+            parser.exit(1, f"{args.csv}: {e} (sales before the failing batch are stored)\n")
+        print(f"{stats.inserted:,} sales added ({stats.duplicates:,} already stored) in {stats.seconds:.2f}s "
+              f"- {stats.rate:,.0f} rows/sec -> {args.db}")
+    else:
+        for sale in last_sales(conn, args.card_id, args.n, args.grade, args.company):
+            grade = f"{sale.grade_company} {sale.grade:g}" if sale.grade is not None else "raw"
+            print(f"{sale.sold_at}  {grade:>8}  ${sale.price:>10,.2f}  {sale.source}:{sale.listing_id}")
+    conn.close()
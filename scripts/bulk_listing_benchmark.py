@@ -0,0 +1,83 @@
+"""
+Bulk listing throughput, 1 to N worker processes.
+Builds a synthetic collection (default 100k cards) from the reference DB's key
+players and valuable sets plus made-up commons, then times build_listings()
+(rows back in the parent) and write_listings() (File Exchange CSV to /dev/null)
+for each worker count.
+Usage: python scripts/bulk_listing_benchmark.py [--cards 100000] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SPORTS = ["Baseball", "Football", "Basketball", "Hockey"]
+BRANDS = ["Topps", "Panini", "Upper Deck", "Donruss", "Fleer", "Score", "Bowman", "Leaf"]
+PARALLELS = ["", "", "", "Refractor", "Silver", "Gold", "Orange", "Holo", "Rated Rookies"]
+FLAGS = ["", "", "", "", "RC", "RC", "SN99", "RC, SN199", "AU", "SP", "MEM"]
+FIRST = ["Mike", "Chris", "Tony", "Kevin", "Luis", "Josh", "Ryan", "Derek", "Marcus", "Tyler"]
+LAST = ["Smith", "Johnson", "Garcia", "Miller", "Davis", "Lopez", "Wilson", "Young", "Hill", "Moore"]
+
+
+def synthetic_cards(n, seed=1):
+    """n card dicts (CARD_FIELDS): ~1/3 key players, ~1/4 valuable sets, the rest commons"""
+    import reference_db
+
+    rng = random.Random(seed)
+    stars = [p.player_name for p in reference_db.key_players()]
+    sets = [s.set_name for s in reference_db.valuable_sets()]
+    cards = []
+    for i in range(n):
+        year = rng.randint(1980, 2025)
+        brand = rng.choice(BRANDS)
+        if rng.random() < 0.25:
+            set_name = rng.choice(sets)
+        else:
+            parallel = rng.choice(PARALLELS)
+            set_name = f"{year} {brand}" + (f" - {parallel}" if parallel else "")
+        player = rng.choice(stars) if rng.random() < 0.33 else f"{rng.choice(FIRST)} {rng.choice(LAST)} {i % 500}"
+        cards.append({
+            "player": player, "year": str(year), "set": set_name, "brand": brand,
+            "sport": rng.choice(SPORTS), "card_number": str(rng.randint(1, 700)), "team": "",
+            "flags": rng.choice(FLAGS), "price": f"{0.99 + rng.lognormvariate(1.5, 1):.2f}",
+            "front_image": f"u232360-{300000000 + i}", "back_image": f"u232360-{300000000 + i}",
+        })
+    return cards
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100_000, help="synthetic collection size")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        help="worker counts (default: 1, 2, 4, ... up to the CPU count)")
+    args = parser.parse_args()
+
+    os.chdir(BASE_DIR)
+    sys.path.insert(0, BASE_DIR)
+    import bulk_listings
+
+    cpus = os.cpu_count() or 1
+    workers = args.workers or sorted({1, cpus} | {w for w in (2, 4, 8, 16, 32) if w < cpus})
+    cards = synthetic_cards(args.cards)
+    columns = {field: field for field in bulk_listings.CARD_FIELDS}
+    print(f"{len(cards):,} synthetic cards, {cpus} CPU(s)")
+    print(f"{'workers':>8}{'build_listings s':>18}{'listings/sec':>14}{'speedup':>9}"
+          f"{'write_listings s':>18}{'listings/sec':>14}{'speedup':>9}")
+
+    base = None
+    for w in workers:
+        t0 = time.perf_counter()
+        built = sum(1 for row in bulk_listings.build_listings(cards, workers=w) if row is not None)
+        build_s = time.perf_counter() - t0
+        with open(os.devnull, "w", newline="", encoding="utf-8") as out:
+            stats = bulk_listings.write_listings(cards, out, columns, workers=w)
+        base = base or (build_s, stats.seconds)
+        print(f"{w:>8}{build_s:>18.2f}{built / build_s:>14,.0f}{base[0] / build_s:>8.2f}x"
+              f"{stats.seconds:>18.2f}{stats.rate:>14,.0f}{base[1] / stats.seconds:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """
 Parse Panini CSV checklists and output Python data format for app.
 Usage: python scripts/parse_panini_csv.py
+Then rebuild the card catalog: python card_catalog.py
 """
 import csv
 import os
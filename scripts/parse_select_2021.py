@@ -1,4 +1,6 @@
-"""Parse 2021 Panini Select Football CSV - extract base tiers (empty SEQUENCE only)."""
+"""Parse 2021 Panini Select Football CSV - extract base tiers (empty SEQUENCE only).
+Then rebuild the card catalog: python card_catalog.py
+"""
 import csv
 import os
 
@@ -0,0 +1,152 @@
+"""
+Price fetcher load test against a local stub server.
+Serves a synthetic PSA price-guide page (a table of --cards rows) for any path,
+with optional latency, a share of 503 responses and a share of sets whose page
+has no price table (--empty: a captcha / layout change), seeds a scratch psa_cards.db
+with --sets unscraped sets, and runs price_fetcher.fetch_sets() with --base-url
+pointed at the stub for each worker count. Every run checks that exactly the
+empty-page sets failed and were left unscraped. With --cache every run goes through
+a fresh HTTP cache and is followed by a --rescrape run, which the stub answers
+with 304s. Nothing goes to the real site.
+Usage: python scripts/price_fetch_load_test.py [--sets 500] [--workers 1 4 8 16] [--latency 0.05] [--errors 0.05] [--empty 0.02] [--cache]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def stub_page(cards):
+    header = "".join(f"<th>PSA {g}</th>" for g in range(1, 11))
+    rows = "".join(
+        f"<tr><td>{i}</td><td>Player {i}</td>" + "".join(f"<td>${(i + 1) * g:,}</td>" for g in range(1, 11)) + "</tr>"
+        for i in range(cards)
+    )
+    return f"<html><body><table><tr><th>#</th><th>Name</th>{header}</tr>{rows}</table></body></html>".encode()
+
+
+EMPTY_PAGE = b"<html><body><p>Please verify you are a human.</p></body></html>"
+
+
+def is_empty_path(path, empty):
+    """Whether the stub answers path with EMPTY_PAGE (fixed per path, so a set fails every run)"""
+    return zlib.crc32(path.encode()) % 10000 < empty * 10000
+
+
+def start_stub(cards, latency, errors, empty=0.0):
+    """ThreadingHTTPServer on a free localhost port; returns (server, base_url)"""
+    body = stub_page(cards)
+    etag = f'"stub-{cards}"'
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so the fetcher's pooled connections are reused
+
+        def do_GET(self):
+            if latency:
+                threading.Event().wait(latency)
+            if random.random() < errors:
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            page = EMPTY_PAGE if is_empty_path(self.path, empty) else body
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def set_path(i):
+    return f"/priceguide/baseball-card-values/stub-set-{i}/{i}"
+
+
+def seed_sets(db_path, n):
+    from psa_price_guide import connect_price_db
+
+    conn = connect_price_db(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO sets (sport, set_name, set_id, url) VALUES (?, ?, ?, ?)",
+            [("baseball", f"{1950 + i % 75} Stub Set {i}", f"stub-{i}", f"https://www.psacard.com{set_path(i)}")
+             for i in range(n)],
+        )
+    conn.close()
+
+
+def unscraped(db_path):
+    conn = sqlite3.connect(db_path)
+    n = conn.execute("SELECT COUNT(*) FROM sets WHERE scraped = 0").fetchone()[0]
+    conn.close()
+    return n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sets", type=int, default=500, help="sets (pages) to fetch per run")
+    parser.add_argument("--cards", type=int, default=200, help="cards per stub page")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16], help="fetch thread counts")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub response delay, seconds")
+    parser.add_argument("--errors", type=float, default=0.05, help="share of stub responses that are 503")
+    parser.add_argument("--rate", type=float, default=0, help="fetcher requests/sec per host (0: unlimited)")
+    parser.add_argument("--empty", type=float, default=0.02, help="share of sets whose page has no price table")
+    parser.add_argument("--cache", action="store_true", help="also time a cached re-scrape of every run")
+    args = parser.parse_args()
+
+    sys.path.insert(0, BASE_DIR)
+    import price_fetcher
+    from http_cache import HTTPCache
+
+    server, base_url = start_stub(args.cards, args.latency, args.errors, args.empty)
+    empty_sets = sum(is_empty_path(set_path(i), args.empty) for i in range(args.sets))
+    price_fetcher.BACKOFF = 0.01  # the stub's 503s are random, not load: retry at once
+    print(f"stub at {base_url}: {args.sets} sets x {args.cards} cards, "
+          f"{args.latency * 1000:.0f} ms latency, {args.errors:.0%} 503s, {empty_sets} sets with no price table")
+    print(f"{'workers':>8}{'run':>8}{'seconds':>10}{'pages/sec':>11}{'cards/sec':>11}{'retries':>9}{'failed':>8}"
+          f"{'unscraped':>11}{'speedup':>9}{'from cache':>12}")
+    base = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for w in args.workers:
+            db_path = os.path.join(tmp, f"psa_cards_{w}.db")
+            seed_sets(db_path, args.sets)
+            cache = HTTPCache(os.path.join(tmp, f"http_{w}")) if args.cache else None
+            runs = ["cold", "cached"] if cache else ["cold"]
+            for run in runs:
+                session = price_fetcher.make_session(w, cache)
+                fetcher = price_fetcher.PriceFetcher(session, per_host=w, rate=args.rate, burst=w)
+                stats = price_fetcher.fetch_sets(db_path, fetcher, base_url, workers=w, rescrape=run == "cached")
+                base = base or stats.seconds
+                served = f"{cache.stats().revalidated:,}" if cache else "-"
+                left = unscraped(db_path)
+                print(f"{w:>8}{run:>8}{stats.seconds:>10.2f}{stats.rate:>11,.1f}{stats.rows / stats.seconds:>11,.0f}"
+                      f"{stats.retries:>9}{stats.failed:>8}{left:>11}{base / stats.seconds:>8.2f}x{served:>12}")
+                # Empty pages must fail and stay unscraped; every other set must be done
+                assert stats.failed == left == empty_sets, (stats.failed, left, empty_sets)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
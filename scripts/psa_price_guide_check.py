@@ -0,0 +1,102 @@
+"""
+Price-guide ingest check on the saved fixtures in scripts/fixtures/psa_price_guide.
+Copies them into a scratch folder and loads them with
+psa_price_guide.ingest_directory() into a scratch psa_cards.db. Then asserts the
+file / set / row counts, a sample of parsed prices ("$12,600,000", "-", "N/A",
+blank), card_count and scraped on every set, and that re-running is a no-op.
+Finally it re-runs with one grade blanked and checks the stored price is kept.
+Usage: python scripts/psa_price_guide_check.py [--batch 2]
+"""
+import argparse
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(BASE_DIR, "scripts", "fixtures", "psa_price_guide")
+
+# set_id -> (sport, set_name, url, card_count)
+EXPECTED_SETS = {
+    "baseball-1952-topps": ("baseball", "1952 Topps",
+                            "https://www.psacard.com/priceguide/baseball-card-values/1952-topps/1046", 4),
+    "football-2000-playoff-contenders": ("football", "2000 Playoff Contenders", "", 2),
+    "basketball-1986-fleer": ("basketball", "1986 Fleer", "", 1),
+}
+# (set_id, card_number, player) -> {grade: price}
+EXPECTED_PRICES = {
+    ("baseball-1952-topps", "1", "Andy Pafko"): {1: 1250.0, 9: 95000.0, 10: None},
+    ("baseball-1952-topps", "261", "Willie Mays"): {2: 1400.0, 10: None},
+    ("baseball-1952-topps", "311", "Mickey Mantle"): {1: 25000.0, 10: 12600000.0},
+    ("baseball-1952-topps", "407", "Eddie Mathews & Checklist"): {8: 20000.0, 10: None},
+    ("football-2000-playoff-contenders", "144", "Tom Brady"): {10: 450000.0},
+    ("football-2000-playoff-contenders", "139", "Chad Pennington"): {1: 4.0, 10: 200.0},
+    ("basketball-1986-fleer", "57", "Michael Jordan"): {8: 14000.0, 10: 300000.0},
+}
+EXPECTED_YEARS = {"baseball-1952-topps": 1952, "football-2000-playoff-contenders": 2000, "basketball-1986-fleer": 1986}
+
+
+def price(conn, key, grade):
+    set_id, number, player = key
+    row = conn.execute(f"SELECT psa_{grade} FROM cards WHERE set_id = ? AND card_number = ? AND player = ?",
+                       (set_id, number, player)).fetchone()
+    assert row is not None, f"missing card {key}"
+    return row[0]
+
+
+def check_db(db_path):
+    conn = sqlite3.connect(db_path)
+    sets = {r[2]: r for r in conn.execute("SELECT sport, set_name, set_id, url, scraped, card_count FROM sets")}
+    assert sorted(sets) == sorted(EXPECTED_SETS), sorted(sets)
+    for set_id, (sport, set_name, url, card_count) in EXPECTED_SETS.items():
+        assert sets[set_id] == (sport, set_name, set_id, url, 1, card_count), sets[set_id]
+    cards = conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
+    assert cards == len(EXPECTED_PRICES), cards
+    for key, prices in EXPECTED_PRICES.items():
+        for grade, expected in prices.items():
+            got = price(conn, key, grade)
+            assert got == expected, (key, grade, got, expected)
+    for set_id, year in EXPECTED_YEARS.items():
+        years = {r[0] for r in conn.execute("SELECT year FROM cards WHERE set_id = ?", (set_id,))}
+        assert years == {year}, (set_id, years)
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch", type=int, default=2, help="card rows per transaction (small, so sets span batches)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, BASE_DIR)
+    from psa_price_guide import ingest_directory
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "saved")
+        shutil.copytree(FIXTURES, root)
+        db_path = os.path.join(tmp, "psa_cards.db")
+
+        stats = ingest_directory(root, db_path, args.batch)
+        print(f"first run: {stats.files} files, {stats.sets} sets, {stats.rows} rows")
+        assert (stats.files, stats.sets, stats.rows) == (2, len(EXPECTED_SETS), len(EXPECTED_PRICES)), stats
+        check_db(db_path)
+
+        again = ingest_directory(root, db_path, args.batch)
+        print(f"re-run:    {again.files} files, {again.sets} sets, {again.rows} rows")
+        assert again.rows == stats.rows, again
+        check_db(db_path)
+
+        # A page that lost a grade (blank cell) keeps the price already stored for it
+        page = os.path.join(root, "baseball", "1952 Topps.html")
+        with open(page, encoding="utf-8") as f:
+            html = f.read()
+        with open(page, "w", encoding="utf-8") as f:
+            f.write(html.replace("<td>$12,600,000</td>", "<td></td>"))
+        ingest_directory(root, db_path, args.batch)
+        check_db(db_path)
+        print("blanked grade kept its stored price")
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
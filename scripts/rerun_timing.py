@@ -0,0 +1,98 @@
+"""
+Startup / rerun timing for the Streamlit app, page by page.
+Runs app.py headless (streamlit.testing AppTest): startup is the first script
+run in a fresh process, first visit is the run that opens a page, rerun is the
+median of repeated reruns on that page with nothing changed.
+Usage: python scripts/rerun_timing.py [--ref HEAD~1] [--runs 10] [--pages "Home" "90s NBA"]
+With --ref, the same measurements run against that commit (extracted to a
+temp dir) and both are printed side by side as before / after.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(app_dir, pages, runs):
+    """{"startup": ms, "pages": {page: [first_visit_ms, rerun_ms]}} for the app in app_dir"""
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(app_dir)
+    sys.path.insert(0, app_dir)
+    at = AppTest.from_file(os.path.join(app_dir, "app.py"), default_timeout=300)
+    t0 = time.perf_counter()
+    at.run()
+    result = {"startup": (time.perf_counter() - t0) * 1000, "pages": {}}
+    for page in pages:
+        at.sidebar.selectbox[0].select(page)
+        t0 = time.perf_counter()
+        at.run()
+        first = (time.perf_counter() - t0) * 1000
+        reruns = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            at.run()
+            reruns.append((time.perf_counter() - t0) * 1000)
+        result["pages"][page] = [first, statistics.median(reruns)]
+    return result
+
+
+def measure_in_subprocess(app_dir, pages, runs):
+    # Each tree gets its own interpreter so modules of the same name never mix
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--measure", app_dir, "--runs", str(runs), "--pages", *pages],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def extract_ref(ref, dest):
+    """Check out ref's tree (tracked files only) into dest"""
+    archive = subprocess.run(["git", "-C", BASE_DIR, "archive", ref], check=True, capture_output=True).stdout
+    subprocess.run(["tar", "-x", "-C", dest], input=archive, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ref", help="git ref to compare against (before)")
+    parser.add_argument("--runs", type=int, default=10, help="reruns per page (median is reported)")
+    parser.add_argument("--pages", nargs="+", help="page labels (default: every sidebar page)")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        import logging
+        logging.disable(logging.WARNING)
+        print(json.dumps(measure(args.measure, args.pages, args.runs)))
+        return
+
+    pages = args.pages
+    if not pages:
+        sys.path.insert(0, BASE_DIR)
+        from views import PAGES
+        pages = PAGES
+
+    columns = []
+    if args.ref:
+        with tempfile.TemporaryDirectory() as before_dir:
+            extract_ref(args.ref, before_dir)
+            columns.append((f"before ({args.ref})", measure_in_subprocess(before_dir, pages, args.runs)))
+    columns.append(("after (working tree)", measure_in_subprocess(BASE_DIR, pages, args.runs)))
+
+    header = f"{'':24}" + "".join(f"{label:>30}" for label, _ in columns)
+    print(header)
+    print(f"{'ms: first visit / rerun':24}" + "".join(f"{'':>30}" for _ in columns))
+    print(f"{'startup':24}" + "".join(f"{r['startup']:>30.0f}" for _, r in columns))
+    for page in pages:
+        cells = "".join(f"{r['pages'][page][0]:>20.0f} / {r['pages'][page][1]:>7.1f}" for _, r in columns)
+        print(f"{page[:24]:24}{cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Sold-comps store timings on a synthetic history.
+Seeds a scratch psa_cards.db with --sales sales spread over --cards cards, one
+"hot" card getting --hot of them, then times the bulk insert, a duplicate
+re-load (every row skipped) and the per-card queries on the hot card, with
+the query plan SQLite picks for each.
+Usage: python scripts/sales_query_benchmark.py [--sales 500000] [--cards 2000] [--hot 50000]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRADES = [None, 6.0, 7.0, 8.0, 9.0, 9.0, 10.0, 10.0]
+COMPANIES = ["PSA", "PSA", "PSA", "BGS", "SGC"]
+SOURCES = ["ebay", "ebay", "pwcc", "goldin"]
+
+
+def synthetic_sales(n, cards, hot, seed=1):
+    """n Sale rows over five years: hot of them on card 1, the rest on cards 2..cards"""
+    from sales_history import Sale
+
+    rng = random.Random(seed)
+    start = datetime(2021, 1, 1)
+    for i in range(n):
+        grade = rng.choice(GRADES)
+        yield Sale(
+            card_id=1 if i < hot else rng.randint(2, cards),
+            grade_company="" if grade is None else rng.choice(COMPANIES),
+            grade=grade,
+            price=round(rng.lognormvariate(4, 1), 2),
+            sold_at=start + timedelta(seconds=rng.randint(0, 5 * 365 * 86400)),
+            source=rng.choice(SOURCES),
+            listing_id=str(100000000 + i),
+        )
+
+
+def timed(fn, runs=20):
+    """(median ms, result) over runs calls"""
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sales", type=int, default=500_000, help="total sales")
+    parser.add_argument("--cards", type=int, default=2000, help="cards the sales are spread over")
+    parser.add_argument("--hot", type=int, default=50_000, help="sales on the one card the queries use")
+    args = parser.parse_args()
+
+    sys.path.insert(0, BASE_DIR)
+    import sales_history as sh
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sh.connect_sales_db(os.path.join(tmp, "psa_cards.db"))
+        load = sh.add_sales(conn, synthetic_sales(args.sales, args.cards, args.hot))
+        print(f"insert:   {load.inserted:,} sales in {load.seconds:.2f}s - {load.rate:,.0f} rows/sec")
+        again = sh.add_sales(conn, synthetic_sales(args.sales, args.cards, args.hot))
+        print(f"re-load:  {again.duplicates:,} duplicates skipped, {again.inserted} added "
+              f"in {again.seconds:.2f}s - {again.rate:,.0f} rows/sec")
+
+        queries = [
+            ("last 20", lambda: sh.last_sales(conn, 1, 20)),
+            ("last 20, PSA 10", lambda: sh.last_sales(conn, 1, 20, grade=10.0, grade_company="PSA")),
+            ("30 days", lambda: sh.sales_between(conn, 1, "2025-06-01", "2025-07-01")),
+            ("1 year, grade 9", lambda: sh.sales_between(conn, 1, "2024-01-01", "2025-01-01", grade=9.0)),
+            ("all 5 years", lambda: sh.sales_between(conn, 1, "2021-01-01", "2026-01-01")),
+        ]
+        print(f"\ncard 1: {args.hot:,} sales")
+        print(f"{'query':<18}{'rows':>8}{'ms':>9}")
+        for label, query in queries:
+            ms, rows = timed(query)
+            print(f"{label:<18}{len(rows):>8,}{ms:>9.2f}")
+        plans = [
+            (f"{sh.SALE_SELECT} WHERE card_id = ? ORDER BY sold_at DESC LIMIT ?", (1, 20)),
+            (f"{sh.SALE_SELECT} WHERE card_id = ? AND grade = ? ORDER BY sold_at DESC LIMIT ?", (1, 10.0, 20)),
+        ]
+        for sql, params in plans:
+            detail = "; ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+            print(f"  {detail}")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
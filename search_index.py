@@ -0,0 +1,220 @@
+"""
+Search Index
+Prebuilt n-gram inverted index for fast substring search over card records.
+Matches the checklist pages' semantics exactly: a record matches when the
+lowercased query is a substring of any one of its lowercased fields.
+Also an Aho-Corasick matcher for the reverse question: which of a fixed list of
+names occur inside a piece of text.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+FIELD_SEP = "\n"   # joins fields so a query can never match across two (search boxes are single-line)
+GRAM_SIZE = 3
+
+
+class NgramIndex:
+    """
+    Inverted index of every min_gram..gram_size character gram -> record positions.
+
+    Queries of min_gram..gram_size chars are answered straight from one posting
+    list. Longer queries take the rarest of their grams as candidates and verify
+    each with a plain substring check, so results never differ from a scan.
+    Queries shorter than min_gram fall back to a scan (stopping at limit).
+    """
+
+    def __init__(self, records: Iterable[Sequence], gram_size: int = GRAM_SIZE, min_gram: int = 1):
+        self.gram_size = gram_size
+        self.min_gram = min_gram
+        self.haystacks: List[str] = [
+            FIELD_SEP.join(str(field).lower() for field in record) for record in records
+        ]
+        postings: Dict[str, array] = {}
+        for pos, hay in enumerate(self.haystacks):
+            for gram in self._grams(hay):
+                plist = postings.get(gram)
+                if plist is None:
+                    plist = postings[gram] = array("I")
+                plist.append(pos)
+        self._postings = postings
+
+    def _grams(self, hay: str) -> set:
+        grams = set()
+        for k in range(self.min_gram, self.gram_size + 1):
+            for j in range(len(hay) - k + 1):
+                gram = hay[j:j + k]
+                if FIELD_SEP not in gram:
+                    grams.add(gram)
+        return grams
+
+    def __len__(self) -> int:
+        return len(self.haystacks)
+
+    def search(self, query: str, limit: Optional[int] = None, within: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Positions (in input order) of records containing query in any field.
+        within: ascending positions already known to hold every match (e.g. the
+        hits for a shorter query contained in this one) - only those are checked.
+        """
+        q = (query or "").lower()
+        if not q:
+            if within is not None:
+                return list(within)[:limit]
+            return list(range(len(self.haystacks) if limit is None else min(limit, len(self.haystacks))))
+        if FIELD_SEP in q:
+            return []
+        if within is not None:
+            return self._scan(q, within, limit)
+        if len(q) < self.min_gram:
+            return self._scan(q, range(len(self.haystacks)), limit)
+
+        k = min(len(q), self.gram_size)
+        rarest = None
+        for j in range(len(q) - k + 1):
+            plist = self._postings.get(q[j:j + k])
+            if plist is None:
+                return []
+            if rarest is None or len(plist) < len(rarest):
+                rarest = plist
+
+        if len(q) <= self.gram_size:
+            return list(rarest if limit is None else rarest[:limit])
+        return self._scan(q, rarest, limit)
+
+    def _scan(self, q: str, positions: Iterable[int], limit: Optional[int]) -> List[int]:
+        haystacks = self.haystacks
+        if limit is None:
+            return [pos for pos in positions if q in haystacks[pos]]
+        hits = []
+        for pos in positions:
+            if q in haystacks[pos]:
+                hits.append(pos)
+                if len(hits) >= limit:
+                    break
+        return hits
+
+
+class SubstringMatcher:
+    """
+    Aho-Corasick automaton over a fixed list of patterns (lowercased).
+
+    first_in(text) finds the earliest-listed pattern that occurs anywhere in
+    text in a single pass over text, however many patterns there are. Each
+    state stores the lowest pattern position ending there or along its failure
+    chain, so no output lists are walked while scanning.
+    """
+
+    NO_MATCH = 1 << 62
+
+    def __init__(self, patterns: Iterable[str]):
+        goto: List[Dict[str, int]] = [{}]
+        best: List[int] = [self.NO_MATCH]
+        for pos, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern.lower():
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = goto[state][ch] = len(goto)
+                    goto.append({})
+                    best.append(self.NO_MATCH)
+                state = nxt
+            best[state] = min(best[state], pos)
+
+        # Failure links, breadth-first so a state's fallback is finished before it
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if state else 0
+                best[nxt] = min(best[nxt], best[fail[nxt]])
+                queue.append(nxt)
+        self._goto = goto
+        self._fail = fail
+        self._best = best
+
+    def first_in(self, text: str) -> Optional[int]:
+        """Position of the earliest-listed pattern that is a substring of text.lower(), or None."""
+        goto, fail, best = self._goto, self._fail, self._best
+        state = 0
+        found = best[0]
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if best[state] < found:
+                found = best[state]
+        return None if found == self.NO_MATCH else found
+
+
+# (source, number, player, team, detail, ebay query)
+SearchEntry = Tuple[str, str, str, str, str, str]
+
+
+class GlobalSearchIndex:
+    """
+    Ranked substring search across every checklist and the collection at once.
+
+    Ranking: player name starts with the query, then any word of the player
+    name starts with it, then any other substring hit (number, team, detail).
+    Name ranks come from sorted lists via bisect, the rest from an NgramIndex
+    with trigram-only postings to keep memory flat on large catalogs.
+    """
+
+    def __init__(self, entries: Iterable[SearchEntry]):
+        self.entries: List[SearchEntry] = list(entries)
+        self._ngrams = NgramIndex(
+            ((number, player, team, detail) for _, number, player, team, detail, _ in self.entries),
+            min_gram=GRAM_SIZE,
+        )
+        names, words = [], []
+        for pos, entry in enumerate(self.entries):
+            player = entry[2].lower()
+            names.append((player, pos))
+            for word in set(player.split()):
+                words.append((word, pos))
+        names.sort()
+        words.sort()
+        self._names = names
+        self._words = words
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _prefixed(sorted_pairs: List[Tuple[str, int]], q: str, limit: int) -> List[int]:
+        hits = []
+        i = bisect_left(sorted_pairs, (q, -1))
+        while i < len(sorted_pairs) and len(hits) < limit:
+            key, pos = sorted_pairs[i]
+            if not key.startswith(q):
+                break
+            hits.append(pos)
+            i += 1
+        return hits
+
+    def search(self, query: str, limit: int = 25) -> List[SearchEntry]:
+        """Top `limit` entries for query, best matches first."""
+        q = (query or "").strip().lower()
+        if not q:
+            return []
+        ranked, seen = [], set()
+        tiers = (
+            lambda: self._prefixed(self._names, q, limit),
+            lambda: self._prefixed(self._words, q, limit),
+            lambda: self._ngrams.search(q, limit=limit + len(seen)),
+        )
+        for tier in tiers:
+            for pos in tier():
+                if pos not in seen:
+                    seen.add(pos)
+                    ranked.append(pos)
+            if len(ranked) >= limit:
+                break
+        return [self.entries[pos] for pos in ranked[:limit]]
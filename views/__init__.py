@@ -0,0 +1,57 @@
+"""
+Page Modules
+One module per sidebar page, each exposing render(). A page's module (and its
+static data) is imported the first time that page is selected and then stays
+in sys.modules, so a rerun only executes the selected page's render().
+"""
+
+import importlib
+
+from checklists import CHECKLIST_PAGE_LABELS
+
+# Page list for sidebar navigation
+PAGES = [
+    "Home",
+    "CollX Collection",
+    "2021 Topps S1",
+    "2026 Topps S1",
+    "2025 Prizm Football",
+    "2021 Prizm Football",
+    "2021 Mosaic Football",
+    "2021 Select Football",
+    "2020 Prizm Basketball",
+    "Search",
+    "Athletes A-Z",
+    "Sets by Year",
+    "By Year & Sport",
+    "Junk Wax Gems",
+    "90s NBA",
+    "Parallels & Inserts",
+    "Key Sets",
+    "Key Players",
+    "eBay Listings",
+]
+
+# Page label -> module in this package; checklist set pages all use views.checklist
+PAGE_MODULES = {
+    "Home": "home",
+    "CollX Collection": "collx",
+    "Search": "search",
+    "Athletes A-Z": "athletes",
+    "Sets by Year": "sets_by_year",
+    "By Year & Sport": "year_sport",
+    "Junk Wax Gems": "junk_wax",
+    "90s NBA": "nba_90s",
+    "Parallels & Inserts": "parallels",
+    "Key Sets": "key_sets",
+    "Key Players": "key_players",
+    "eBay Listings": "ebay_listings",
+}
+
+
+def render_page(page):
+    """Import the page's module on first use and render it"""
+    if page in CHECKLIST_PAGE_LABELS:
+        importlib.import_module(f"{__name__}.checklist").render(CHECKLIST_PAGE_LABELS[page])
+    else:
+        importlib.import_module(f"{__name__}.{PAGE_MODULES[page]}").render()
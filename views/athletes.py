@@ -0,0 +1,47 @@
+"""
+Athletes A-Z
+Every key player with a PSA $100+ sold link, filtered as you type.
+"""
+
+import streamlit as st
+
+from ebay_urls import ebay_search_url
+from views.shared import DB_PATH, file_version, fragment, get_all_players, link_grid
+
+
+GRID_STYLE = "display: grid; grid-template-columns: repeat(5, 1fr); gap: 4px 12px; font-size: 14px;"
+
+
+@st.cache_resource(max_entries=1)
+def _athlete_items(db_version):
+    """(lowercased names, grid item HTML) for every athlete in name order, built once per DB version"""
+    sorted_df = get_all_players().sort_values('player_name', kind='stable')
+    names, items = [], []
+    for player, league_tag in zip(sorted_df['player_name'], sorted_df['league']):
+        url = ebay_search_url(f"{player} PSA", sold=True, min_price=100, exclude_auto=True)
+        names.append(player.lower())
+        items.append(f'<div><a href="{url}" target="_blank" style="text-decoration:none;">{player}</a> <span style="color:#888;font-size:11px;">{league_tag}</span></div>')
+    return tuple(names), tuple(items)
+
+
+@fragment
+def _athlete_grid():
+    """Search box and the filtered athlete grid - reruns on its own"""
+    # Search box with auto-filter
+    search_query = st.text_input("🔍 Search athletes...", placeholder="Type to filter...", key="athlete_search")
+    
+    # Prebuilt grid items; a search just picks the matching ones
+    names, items = _athlete_items(file_version(DB_PATH))
+    if search_query:
+        q = search_query.lower()
+        items = [item for name, item in zip(names, items) if q in name]
+    
+    st.caption(f"**{len(items)}** athletes | Click = eBay SOLD $100+ (no autos)")
+    
+    if items:
+        st.markdown(link_grid(GRID_STYLE, items), unsafe_allow_html=True)
+
+def render():
+    st.header("Athletes A-Z - PSA Graded $100+")
+    
+    _athlete_grid()
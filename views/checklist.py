@@ -0,0 +1,130 @@
+"""
+Checklist Set Pages
+Page engine behind every CHECKLIST_PAGES entry: search, filters, sort, paging,
+the eBay links table and the optional in-browser table.
+"""
+
+from functools import partial
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from card_catalog import CATALOG_PATH
+from checklists import (
+    CHECKLIST_PAGES, MIN_PRICES, ebay_query, format_labels, prefix_banner,
+    prefix_reference_html, results_table_html, select_cards, sort_order, table_columns,
+)
+from client_table import client_table_html, client_table_payload
+from views.shared import (
+    file_version, find_card, fragment, get_checklist, get_checklist_index, get_page_cache, narrowed_search,
+    page_controls,
+)
+
+# Sort orders, prefix grids, table pages and the browser-side table document
+# are all cached once per set.
+@st.cache_resource(max_entries=64)
+def _checklist_sort_order(set_id, sort_label, catalog_version):
+    cards, _ = get_checklist(set_id)
+    return sort_order(CHECKLIST_PAGES[set_id], cards, sort_label)
+
+@st.cache_resource(max_entries=32)
+def _prefix_reference(set_id, catalog_version):
+    _, prefix_info = get_checklist(set_id)
+    return prefix_reference_html(CHECKLIST_PAGES[set_id], prefix_info)
+
+@st.cache_resource(max_entries=32)
+def _client_table_doc(set_id, catalog_version):
+    spec = CHECKLIST_PAGES[set_id]
+    cards, _ = get_checklist(set_id)
+    return client_table_html(client_table_payload(
+        cards, format_labels(spec), partial(ebay_query, spec), spec["filters"], spec["sorts"],
+        MIN_PRICES, spec["page_sizes"], table_columns(spec), spec.get("tints", ()),
+        default_format=spec["default_format"]
+    ))
+
+@fragment
+def _results_region(set_id):
+    """Search, filters, sort, paging and the eBay links table - reruns on its own"""
+    spec = CHECKLIST_PAGES[set_id]
+    key = spec["key"]
+    catalog_version = file_version(CATALOG_PATH)
+    ALL_CARDS, PREFIX_INFO = get_checklist(set_id)
+    search_formats = format_labels(spec)
+
+    # ── Search bar ────────────────────────────────────────────────
+    checklist_search = st.text_input(
+        "🔍 Search the checklist",
+        placeholder=spec["placeholder"],
+        key=f"checklist_{key}_search"
+    ).strip()
+
+    # ── Filter options ────────────────────────────────────────────
+    col_f1, col_f2, col_f3, col_f4 = st.columns(4)
+    with col_f1:
+        filter_type = st.selectbox(spec["filter_label"], ["All"] + list(spec["filters"]), key=f"filter_type_{key}")
+    with col_f2:
+        show_max = st.selectbox("Cards per page", spec["page_sizes"], index=0, key=f"show_max_{key}")
+    with col_f3:
+        min_price_filter = st.selectbox("Min eBay Price", MIN_PRICES, index=0, key=f"min_price_{key}")
+    with col_f4:
+        search_fmt = st.selectbox("eBay Search Format", search_formats, index=spec["default_format"], key=f"search_fmt_{key}")
+
+    sort_labels = list(spec["sorts"])
+    if len(sort_labels) > 1:
+        sort_choice = st.selectbox("Sort by", sort_labels, index=0, key=f"sort_{key}")
+    else:
+        sort_choice = sort_labels[0]
+
+    # ── Search + filter over the presorted order ──────────────────
+    search_lower = checklist_search.lower()
+    hits = None
+    if search_lower:
+        index = get_checklist_index(set_id)
+        hits = narrowed_search(f"checklist_{key}_hits", (set_id, catalog_version), search_lower,
+                               lambda query, within: index.search(query, within=within))
+    order = _checklist_sort_order(set_id, sort_choice, catalog_version)
+    results = select_cards(spec, ALL_CARDS, order, hits, filter_type)
+
+    total_matches = len(results)
+    st.markdown(f"**{total_matches}** cards found")
+    start, stop = page_controls(f"checklist_{key}", total_matches, show_max,
+                                (checklist_search, filter_type, sort_choice, show_max),
+                                find=lambda text: find_card(results, text))
+    results = results[start:stop]
+
+    # ── If search matched a prefix, show prefix info banner ───────
+    banner = prefix_banner(spec, PREFIX_INFO, checklist_search)
+    if banner:
+        st.info(banner)
+
+    # ── Results table with eBay links ─────────────────────────────
+    if results:
+        page_key = (set_id, tuple(results), search_fmt, min_price_filter)
+        table_html = get_page_cache().get(page_key)
+        if table_html is None:
+            table_html = get_page_cache().put(page_key, results_table_html(spec, results, search_fmt, min_price_filter))
+        st.markdown(table_html, unsafe_allow_html=True)
+    else:
+        st.warning("No cards found. Try a different search term.")
+
+def render(set_id):
+    """One checklist set page: search, filters, sort, paging and the eBay links table"""
+    spec = CHECKLIST_PAGES[set_id]
+    key = spec["key"]
+    catalog_version = file_version(CATALOG_PATH)
+    st.header(spec["header"])
+    st.caption(spec["caption"])
+
+    _, PREFIX_INFO = get_checklist(set_id)
+
+    if st.toggle("⚡ Instant table", key=f"client_table_{key}",
+                 help="Search, filter, sort and build eBay links in your browser - no server round trip per keystroke"):
+        components.html(_client_table_doc(set_id, catalog_version), height=760, scrolling=True)
+    else:
+        _results_region(set_id)
+
+    # ── Prefix quick reference (collapsed) ────────────────────────────
+    if PREFIX_INFO and "prefix_title" in spec:
+        st.markdown("---")
+        with st.expander(spec["prefix_title"]):
+            st.markdown(_prefix_reference(set_id, catalog_version), unsafe_allow_html=True)
@@ -0,0 +1,240 @@
+"""
+CollX Collection
+The whole CollX export as a searchable, filterable, paged table with Raw /
+Graded / All / Buy eBay links per card.
+"""
+
+import html as html_mod
+from functools import partial
+
+import pandas as pd
+import streamlit as st
+
+from collx_cache import collx_memory_report, year_text
+from ebay_urls import COLLX_SEARCH_FMTS, ebay_search_url
+from views.shared import (
+    COLLX_CSV_PATH, collx_search_hits, collx_version, find_card, fragment, get_collx_ebay_urls, get_page_cache,
+    load_collx_csv, narrowed_search, page_controls,
+)
+
+# Sort label -> (column, ascending)
+SORT_MAP = {
+    "Name A-Z": ("name", True),
+    "Name Z-A": ("name", False),
+    "Year (newest)": ("year", False),
+    "Year (oldest)": ("year", True),
+    "Brand A-Z": ("brand", True),
+    "Team A-Z": ("team", True),
+    "Card #": ("number", True),
+}
+
+CONNECT_HTML = """
+    <div style="background:rgba(79,172,254,0.06);border:1px solid #333;border-radius:8px;padding:14px 18px;font-size:13px;color:#bbb;line-height:1.7;">
+        <b style="color:#ccc;">Looking to buy, sell, or trade?</b><br>
+        Find us on
+        <a href="https://collx.app/EconomicIntegrity" target="_blank" style="color:#4CAF50;text-decoration:none;font-weight:600;">CollX @EconomicIntegrity</a>
+        or browse our
+        <a href="https://www.ebay.com/usr/economicintegrity" target="_blank" style="color:#4CAF50;text-decoration:none;font-weight:600;">eBay store</a>.
+        Always happy to chat cards.
+    </div>
+    """
+
+
+@st.cache_resource(max_entries=1)
+def _collection_summary(collx_ver):
+    """Filter choices and headline counts - fixed for a given export, so computed once"""
+    collx_df = load_collx_csv()
+    return {
+        "categories": sorted(collx_df[collx_df['category'] != '']['category'].unique().tolist()),
+        "brands": sorted(collx_df[collx_df['brand'] != '']['brand'].unique().tolist()),
+        "years": sorted(collx_df['year'].dropna().unique().tolist(), reverse=True),
+        "total": len(collx_df),
+        "players": collx_df[collx_df['name'] != '']['name'].nunique(),
+        "brand_count": collx_df[collx_df['brand'] != '']['brand'].nunique(),
+        "rc_count": collx_df['flags'].str.contains('RC', case=False, na=False).sum(),
+    }
+
+
+@fragment
+def _collection_table(summary):
+    """Search, filters, sort, paging and the results table - reruns on its own"""
+    collx_df = load_collx_csv()
+
+    # ── Search bar ────────────────────────────────────────────────────
+    collx_search = st.text_input(
+        "🔍 Search your collection",
+        placeholder="e.g. Ken Griffey, Bowman Chrome, Yankees, 1989, RC...",
+        key="collx_search"
+    ).strip()
+
+    # ── Filter options ────────────────────────────────────────────────
+    col_f1, col_f2, col_f3, col_f4, col_f5 = st.columns(5)
+    with col_f1:
+        cat_filter = st.selectbox("Sport", ["All"] + summary["categories"], key="collx_cat")
+    with col_f2:
+        brand_filter = st.selectbox("Brand", ["All"] + summary["brands"], key="collx_brand")
+    with col_f3:
+        year_filter = st.selectbox("Year", ["All"] + summary["years"], key="collx_year")
+    with col_f4:
+        show_max_collx = st.selectbox("Per page", [50, 100, 200, 500, 999, 2999], index=1, key="collx_max")
+    with col_f5:
+        min_price_collx = st.selectbox("Min eBay $", [0, 5, 10, 25, 50], index=0, key="collx_min_price")
+
+    # ── eBay search format ────────────────────────────────────────────
+    col_s1, col_s2 = st.columns(2)
+    with col_s1:
+        collx_search_fmt = st.selectbox("eBay Search Format", COLLX_SEARCH_FMTS, index=0, key="collx_fmt")
+    with col_s2:
+        collx_sort = st.selectbox("Sort by", list(SORT_MAP), index=0, key="collx_sort")
+
+    # ── Filter logic (boolean mask; the cached frame is never copied) ──
+    mask = pd.Series(True, index=collx_df.index)
+
+    if collx_search:
+        # Typing more narrows the last hits instead of rescanning the collection
+        hits = narrowed_search("collx_search_hits", collx_version(), collx_search.lower(),
+                               partial(collx_search_hits, collx_df))
+        search_mask = pd.Series(False, index=collx_df.index)
+        search_mask.iloc[hits] = True
+        mask &= search_mask
+
+    if cat_filter != "All":
+        mask &= collx_df['category'] == cat_filter
+    if brand_filter != "All":
+        mask &= collx_df['brand'] == brand_filter
+    if year_filter != "All":
+        mask &= collx_df['year'].eq(year_filter).fillna(False)
+
+    # ── Sort ──────────────────────────────────────────────────────────
+    sort_col, sort_asc = SORT_MAP[collx_sort]
+    # Sort just the key column of the matching rows, then pull the visible rows
+    sorted_index = collx_df.loc[mask, sort_col].sort_values(ascending=sort_asc, kind='stable', na_position='last').index
+
+    total_matches = len(sorted_index)
+    st.markdown(f"**{total_matches}** cards found")
+    start, stop = page_controls(
+        "collx", total_matches, show_max_collx,
+        (collx_search, cat_filter, brand_filter, year_filter, collx_sort, show_max_collx),
+        find=lambda text: find_card(list(collx_df.loc[sorted_index, ['number', 'name']].itertuples(index=False)), text),
+    )
+    display_df = collx_df.loc[sorted_index[start:stop]]
+
+    # ── Results table with eBay links ─────────────────────────────────
+    if len(display_df) > 0:
+        mp = min_price_collx if min_price_collx > 0 else None
+        page_key = ("collx", collx_version(), tuple(display_df.index), collx_search_fmt, mp)
+        table_html = get_page_cache().get(page_key)
+        if table_html is None:
+            html = ['<table style="width:100%;border-collapse:collapse;font-size:13px;">']
+            html.append('<tr style="border-bottom:2px solid #555;text-align:left;">')
+            html.append('<th style="padding:4px 8px;">Card #</th>')
+            html.append('<th style="padding:4px 8px;">Player</th>')
+            html.append('<th style="padding:4px 8px;">Team</th>')
+            html.append('<th style="padding:4px 8px;">Year</th>')
+            html.append('<th style="padding:4px 8px;">Set / Brand</th>')
+            html.append('<th style="padding:4px 8px;">Flags</th>')
+            html.append('<th style="padding:4px 8px;">eBay Sold' + (f' ${min_price_collx}+' if min_price_collx else '') + '</th>')
+            html.append('</tr>')
+
+            url_df = get_collx_ebay_urls(collx_version(), collx_search_fmt, mp).loc[display_df.index]
+
+            for row, urls in zip(display_df.itertuples(index=False), url_df.itertuples(index=False)):
+                if not urls.ebay_q:
+                    continue  # skip rows with no useful data
+
+                card_num = html_mod.escape(row.number)
+                player_name = html_mod.escape(row.name)
+                team = html_mod.escape(row.team)
+                year = year_text(row.year)
+                set_name = html_mod.escape(row.set)
+                flags = html_mod.escape(row.flags)
+                url_raw, url_graded, url_all, url_active = urls.url_raw, urls.url_graded, urls.url_all, urls.url_active
+
+                # Row styling
+                row_bg = ""
+                if flags and "RC" in flags.upper():
+                    row_bg = ' style="background-color:rgba(0,200,0,0.08);"'
+                elif pd.notna(row.serial) or "SP" in flags.upper():
+                    row_bg = ' style="background-color:rgba(255,165,0,0.08);"'
+
+                # Flags display
+                flag_display = ""
+                if flags:
+                    flag_display = f'<span style="color:#FF6B6B;font-weight:bold;">{flags}</span>'
+
+                # Strip leading year from set/brand to avoid doubling with Year column
+                set_clean = set_name
+                if year and set_clean.startswith(year + " "):
+                    set_clean = set_clean[len(year) + 1:]
+
+                # Truncate long set names
+                set_display = set_clean if len(set_clean) <= 35 else set_clean[:32] + "..."
+
+                html.append(f'<tr{row_bg}>')
+                html.append(f'<td style="padding:3px 8px;font-weight:bold;">{card_num}</td>')
+                html.append(f'<td style="padding:3px 8px;">{player_name}</td>')
+                html.append(f'<td style="padding:3px 8px;color:#888;font-size:12px;">{team}</td>')
+                html.append(f'<td style="padding:3px 8px;">{year}</td>')
+                html.append(f'<td style="padding:3px 8px;font-size:12px;" title="{set_clean}">{set_display}</td>')
+                html.append(f'<td style="padding:3px 8px;">{flag_display}</td>')
+                html.append(f'<td style="padding:3px 8px;white-space:nowrap;">')
+                html.append(f'<a href="{url_raw}" target="_blank" title="Raw/Ungraded sold">🃏Raw</a>')
+                html.append(f' · <a href="{url_graded}" target="_blank" title="Graded PSA/BGS/SGC sold">🏆Graded</a>')
+                html.append(f' · <a href="{url_all}" target="_blank" title="All sold">📋All</a>')
+                html.append(f' · <a href="{url_active}" target="_blank" title="Active listings now" style="color:#4CAF50;">🛒Buy</a>')
+                html.append('</td></tr>')
+
+            html.append('</table>')
+            table_html = get_page_cache().put(page_key, ''.join(html))
+        st.markdown(table_html, unsafe_allow_html=True)
+    else:
+        st.warning("No cards found. Try a different search or filter.")
+
+
+def render():
+    st.header("📦 My CollX Collection — Full Searchable Checklist")
+    st.caption("Your entire CollX export. Search by **player**, **card #**, **team**, **year**, **brand**, or **set**. eBay links: Sold, No Autos.")
+
+    collx_df = load_collx_csv()
+    summary = _collection_summary(collx_version())
+
+    # ── Stats bar ─────────────────────────────────────────────────────
+    stat1, stat2, stat3, stat4 = st.columns(4)
+    with stat1:
+        st.metric("Total Cards", summary["total"])
+    with stat2:
+        st.metric("Unique Players", summary["players"])
+    with stat3:
+        st.metric("Brands", summary["brand_count"])
+    with stat4:
+        st.metric("Rookies (RC)", summary["rc_count"])
+    memory = collx_memory_report(COLLX_CSV_PATH)
+    if memory:
+        st.caption(f"In memory: {memory['compact_bytes'] / 1e6:.2f} MB per process, shared by every session "
+                   f"(was {memory['raw_bytes'] / 1e6:.2f} MB as plain text columns)")
+
+    _collection_table(summary)
+
+
+    # ── Brand breakdown (collapsed) ───────────────────────────────────
+    st.markdown("---")
+    with st.expander("📊 Collection Breakdown by Brand"):
+        brand_counts = collx_df[collx_df['brand'] != ''].groupby('brand', observed=True).size().sort_values(ascending=False)
+        bc_html = ['<div style="display:grid;grid-template-columns:repeat(4,1fr);gap:4px 12px;font-size:13px;">']
+        for brand_name, count in brand_counts.items():
+            url = ebay_search_url(f"{brand_name} PSA", sold=True, min_price=50, exclude_auto=True)
+            bc_html.append(f'<div><a href="{url}" target="_blank"><b>{html_mod.escape(brand_name)}</b></a> ({count})</div>')
+        bc_html.append('</div>')
+        st.markdown(''.join(bc_html), unsafe_allow_html=True)
+
+    with st.expander("📅 Collection Breakdown by Year"):
+        year_counts = collx_df['year'].value_counts().sort_index(ascending=False)
+        yc_html = ['<div style="display:grid;grid-template-columns:repeat(8,1fr);gap:4px 8px;font-size:13px;">']
+        for yr, count in year_counts.items():
+            yc_html.append(f'<div><b>{yr}</b> ({count})</div>')
+        yc_html.append('</div>')
+        st.markdown(''.join(yc_html), unsafe_allow_html=True)
+
+    # ── Connect with us ───────────────────────────────────────────────
+    st.markdown("")
+    st.markdown(CONNECT_HTML, unsafe_allow_html=True)
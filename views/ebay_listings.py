@@ -0,0 +1,215 @@
+"""
+eBay Listing Generator
+Card details form -> complete listing with eBay item specifics, plus bulk mode:
+a whole card CSV -> one eBay File Exchange upload file.
+"""
+
+import csv
+import io
+import os
+import shutil
+import tempfile
+import time
+import zlib
+
+import streamlit as st
+
+from views.shared import COLLX_CSV_PATH, fragment
+
+UNMAPPED = "—"
+# Built upload files live in one folder per session under BULK_DIR; Streamlit has no
+# session-end hook, so folders idle for BULK_FILE_TTL are swept on the next build
+BULK_DIR = os.path.join(tempfile.gettempdir(), "card_checklists_bulk")
+BULK_FILE_TTL = 3600  # seconds
+
+
+def _bulk_output_path():
+    """This session's upload file path (replacing its last one); sweeps abandoned sessions' folders"""
+    os.makedirs(BULK_DIR, exist_ok=True)
+    session_dir = st.session_state.get("bulk_dir")
+    if not session_dir or not os.path.isdir(session_dir):
+        session_dir = st.session_state["bulk_dir"] = tempfile.mkdtemp(dir=BULK_DIR)
+    os.utime(session_dir)
+    now = time.time()
+    for name in os.listdir(BULK_DIR):
+        path = os.path.join(BULK_DIR, name)
+        if path != session_dir and now - os.path.getmtime(path) > BULK_FILE_TTL:
+            shutil.rmtree(path, ignore_errors=True)
+    return os.path.join(session_dir, "ebay_upload.csv")
+
+
+@fragment
+def _bulk_listings():
+    """Bulk mode: card CSV in, File Exchange CSV out - reruns on its own"""
+    import bulk_listings
+    from ebay_listing_generator import parse_start_price
+
+    st.subheader("📦 Bulk Listings")
+    st.caption("Turn your whole CollX export (or any card CSV) into one eBay File Exchange upload file.")
+    source = st.radio("Cards from", ["My CollX export", "Upload a CSV"], horizontal=True, key="bulk_source")
+    if source == "Upload a CSV":
+        upload = st.file_uploader("Card CSV", type="csv", key="bulk_upload")
+        if upload is None:
+            return
+        f_in = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    elif os.path.exists(COLLX_CSV_PATH):
+        f_in = open(COLLX_CSV_PATH, newline="", encoding="utf-8-sig")
+    else:
+        st.info("No CollX export found - upload a CSV instead.")
+        return
+
+    try:
+        total = bulk_listings.count_rows(f_in)
+        header = next(csv.reader(f_in), [])
+        f_in.seek(0)
+
+        # Column mapping, defaulting to the CollX export's columns; keyed on the header
+        # so a different file starts from its own defaults
+        defaults = bulk_listings.default_columns(header)
+        header_key = zlib.crc32("|".join(header).encode())
+        options = [UNMAPPED] + header
+        columns = {}
+        with st.expander(f"Column mapping ({total:,} rows)", expanded=source == "Upload a CSV"):
+            map_cols = st.columns(4)
+            for i, field in enumerate(bulk_listings.CARD_FIELDS):
+                default = defaults.get(field)
+                with map_cols[i % 4]:
+                    col = st.selectbox(field.replace("_", " ").title(), options,
+                                       index=options.index(default) if default else 0,
+                                       key=f"bulk_col_{field}_{header_key}")
+                columns[field] = None if col == UNMAPPED else col
+        start_price = st.text_input("Start price", placeholder="4.99 - blank: unpriced cards are left out",
+                                    help="For cards without a price in the mapped Price column. Uploaded "
+                                         "listings go live at once, so cards with no price get no row.",
+                                    key="bulk_price")
+
+        if st.button("📦 Build upload file", key="bulk_go"):
+            if not columns["player"]:
+                st.error("Map a column to Player first.")
+                return
+            if start_price and parse_start_price(start_price) is None:
+                st.error("Start price must be an amount like 4.99.")
+                return
+            bar = st.progress(0.0, text="Starting...")
+
+            def progress(done, listings, seconds):
+                rate = listings / seconds if seconds else 0.0
+                bar.progress(min(done / total, 1.0) if total else 1.0,
+                             text=f"{done:,} / {total:,} rows · {rate:,.0f} listings/sec")
+
+            # Stream straight to this session's file; only the download reads it back
+            st.session_state.pop("bulk_result", None)  # the old file is about to be overwritten
+            out_path = _bulk_output_path()
+            with open(out_path, "w", newline="", encoding="utf-8") as f_out:
+                stats = bulk_listings.write_listings(csv.DictReader(f_in), f_out, columns, start_price, progress)
+            st.session_state["bulk_result"] = (out_path, stats)
+    except UnicodeDecodeError:
+        st.error("That file isn't UTF-8 text. Save it as \"CSV UTF-8\" and try again.")
+        return
+    finally:
+        if source == "Upload a CSV":
+            f_in.detach()  # leave the upload's buffer open for Streamlit
+        else:
+            f_in.close()
+
+    result = st.session_state.get("bulk_result")
+    if result and os.path.exists(result[0]):
+        path, stats = result
+        skipped = f" · {stats.skipped:,} rows without a player skipped" if stats.skipped else ""
+        st.success(f"✅ {stats.listings:,} listings in {stats.seconds:.2f}s · {stats.rate:,.0f} listings/sec{skipped}")
+        if stats.unpriced:
+            st.warning(f"{stats.unpriced:,} cards without a price were left out of the file. "
+                       "Map a Price column or enter a start price to include them.")
+        if not stats.listings:
+            return
+        with open(path, "rb") as f:
+            st.download_button("Download File Exchange CSV", f, file_name="ebay_upload.csv",
+                               mime="text/csv", key="dl_bulk")
+
+
+def render():
+    st.header("📝 eBay Listing Generator")
+    st.markdown("**Fill in card details → get a complete listing with all eBay item specifics.** Uses your reference DB for value context.")
+
+    try:
+        from ebay_listing_generator import (
+            build_full_listing,
+            format_for_copy,
+            format_for_csv_row,
+            CONDITION_OPTIONS,
+            BRANDS,
+            SPORT_EBAY,
+        )
+
+        with st.form("ebay_listing_form", clear_on_submit=False):
+            st.subheader("Card Details")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                player = st.text_input("Player Name*", placeholder="Mark Brunell")
+                year = st.number_input("Year*", min_value=1900, max_value=2026, value=1995)
+                set_name = st.text_input("Set Name*", placeholder="Sports Illustrated Kids")
+                brand = st.selectbox("Brand", BRANDS, index=BRANDS.index("Topps") if "Topps" in BRANDS else 0)
+            with col2:
+                sport = st.selectbox("Sport", list(SPORT_EBAY.values()))
+                card_number = st.text_input("Card #", placeholder="123 or leave blank")
+                team = st.text_input("Team", placeholder="Jacksonville Jaguars")
+                is_rookie = st.checkbox("Rookie Card")
+            with col3:
+                is_graded = st.checkbox("Graded")
+                grade = st.text_input("Grade", placeholder="PSA 10", disabled=not is_graded)
+                cert_number = st.text_input("Cert #", placeholder="e.g. 12345678", disabled=not is_graded)
+
+            condition = st.selectbox("Condition (ungraded)", CONDITION_OPTIONS, disabled=is_graded)
+            variety = st.text_input("Variety/Parallel", placeholder="Base, Refractor, Silver Prizm, Holo...", value="Base")
+            features = st.text_input("Features", placeholder="Serial Numbered, Autograph, etc.")
+            suggested_price = st.text_input("Suggested Price", placeholder="$5-$15 or leave blank")
+            description_extra = st.text_area("Extra description (optional)", placeholder="Additional notes for buyers...")
+
+            submitted = st.form_submit_button("📝 Generate Full Listing")
+
+        if submitted:
+            sport_key = next((k for k, v in SPORT_EBAY.items() if v == sport), "football")
+            listing = build_full_listing(
+                player=player or "Unknown",
+                year=int(year),
+                set_name=set_name or "Unknown",
+                brand=brand,
+                sport=sport_key,
+                card_number=card_number,
+                team=team,
+                is_rookie=is_rookie,
+                is_graded=is_graded,
+                grade=grade if is_graded else "",
+                cert_number=cert_number if is_graded else "",
+                condition=condition if not is_graded else "Graded",
+                variety=variety or "Base",
+                features=features,
+                description_extra=description_extra,
+                suggested_price=suggested_price,
+            )
+
+            st.success("✅ Listing generated! Copy each field into eBay.")
+
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.text_area("TITLE (80 char max)", listing["title"], height=60, key="ebay_title")
+                st.text_area("DESCRIPTION", listing["description"], height=200, key="ebay_desc")
+            with col_b:
+                st.markdown("**ITEM SPECIFICS**")
+                for k, v in listing["item_specs"].items():
+                    if v:
+                        st.text_input(k, v, key=f"spec_{k.replace(' ', '_')}", disabled=True)
+                st.info(f"**Price:** {listing['suggested_price']} | **Category:** {listing['category']}")
+                st.caption(f"Keywords: {listing['keywords']}")
+
+            if listing.get("value_context", {}).get("key_player") or listing.get("value_context", {}).get("tier1_set"):
+                st.success("🔥 Key player / Tier 1 set - value context added to description!")
+
+            st.download_button("Download .txt", format_for_copy(listing), file_name="ebay_listing.txt", key="dl_ebay")
+
+        st.markdown("---")
+        _bulk_listings()
+
+    except ImportError as e:
+        st.error("eBay listing module not available")
+        st.code(str(e))
@@ -0,0 +1,191 @@
+"""
+Home
+Landing page: the grading problem, what each page does, and the roadmap.
+"""
+
+import streamlit as st
+
+# (page, description) rows of the "Pages at a Glance" table
+PAGES_INFO = [
+    ("📦 CollX Collection", "Browse your entire collection with search, filters, and one-click eBay lookups — raw, graded, and active listings for every card."),
+    ("⚾ 2021 Topps S1", "Full searchable checklist with card numbers, insert prefixes, RC flags, and eBay links to compare raw vs. graded prices."),
+    ("⚾ 2026 Topps S1", "75th Anniversary MLB base set — 350 cards with search and eBay links."),
+    ("🏈 2025 Prizm Football", "400-card checklist (300 base + 100 rookies) with search, filters, and eBay links."),
+    ("🏈 2021 Prizm Football", "330 base cards with search and eBay links."),
+    ("🏈 2021 Mosaic Football", "200 base cards with search and eBay links."),
+    ("🏀 2020 Prizm Basketball", "300 base cards with search and eBay links."),
+    ("🏈 2021 Select Football", "300 base cards (Premier 101-200, Club 201-300, Field 301-400) with search and eBay links."),
+    ("🔍 Search", "Custom eBay lookup — enter any player, year, set, and grade to find sold comps instantly."),
+    ("🅰️ Athletes A-Z", "Every key athlete in the database with direct links to their PSA graded sold results ($100+)."),
+    ("📅 Sets by Year", "50 years of sets (1975–2025) across all sports — click any set to see PSA sold results."),
+    ("📆 By Year & Sport", "Browse by year and league (MLB, NFL, NBA, NHL) for graded sold results."),
+    ("📦 Junk Wax Gems", "The few cards from 1987–1992 actually worth grading. PSA 10 or bust."),
+    ("🏀 90s NBA", "90s basketball stars — quick links to their sold results."),
+    ("🌈 Parallels & Inserts", "Prizm, Optic, Refractors, numbered cards, premium inserts — all with eBay links."),
+    ("🔥 Key Sets & Players", "Tier 1 sets and key players from the reference database."),
+    ("📝 eBay Listings", "Generate complete eBay listings with title, description, and item specifics — ready to copy and paste."),
+]
+
+# Built once at import, not on every rerun
+PAGES_TABLE_HTML = (
+    '<table style="width:100%;border-collapse:collapse;font-size:14px;">'
+    + ''.join(
+        f'<tr style="border-bottom:1px solid #333;">'
+        f'<td style="padding:8px 12px;font-weight:bold;white-space:nowrap;vertical-align:top;">{page_name}</td>'
+        f'<td style="padding:8px 12px;color:#bbb;">{desc}</td>'
+        '</tr>'
+        for page_name, desc in PAGES_INFO
+    )
+    + '</table>'
+)
+
+
+def render():
+    # ── Hero Section ──────────────────────────────────────────────────
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%);
+                padding: 40px; border-radius: 12px; margin-bottom: 24px; text-align: center;">
+        <h1 style="color: #e94560; margin: 0; font-size: 2.4em;">Sports Card Value Sniper</h1>
+        <p style="color: #ccc; font-size: 1.2em; margin: 12px 0 4px 0;">
+            Find the spread between raw and graded prices. Snipe the profit.
+        </p>
+        <p style="color: #888; font-size: 0.95em; margin: 0;">
+            Most cards aren't worth grading. This tool helps you find the ones that are.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # ── The Grading Problem ───────────────────────────────────────────
+    st.markdown("### Why Most Grading Submissions Lose Money")
+    st.markdown("""
+    Here's the reality of card grading in 2026:
+
+    - **PSA charges $28+ per card** with a **4+ month turnaround**. That's real money and real time tied up.
+    - **Most cards sell for the same price raw or graded.** If a raw card sells for $8 and a PSA 9 sells for $12, you just lost $20 after grading fees.
+    - **The only grading plays worth making are cards with a massive spread** between mint raw and PSA 8+ prices. A card that sells for $5 raw but $80 graded? That's a snipe.
+    - **You need to check comps before you submit** — not after. One bad submission costs you more than a month of this tool.
+
+    **The formula is simple:** Raw price + $28 grading fee + 4 months of your time < Graded sold price. If the math doesn't work, don't send it.
+    """)
+
+    st.markdown("---")
+
+    # ── What This Tool Does ───────────────────────────────────────────
+    st.markdown("### What This Tool Does")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        **🎯 Find the Spread**
+
+        Every card has links to both **raw sold prices** and **graded sold prices** side by side.
+        You see the spread instantly — no more guessing if a card is worth submitting.
+        """)
+    with col2:
+        st.markdown("""
+        **📦 Browse Your Collection**
+
+        Import your CollX collection and search, filter, and sort every card you own.
+        One click takes you to eBay sold listings — raw, graded, or active.
+        """)
+    with col3:
+        st.markdown("""
+        **📊 Curated Reference Data**
+
+        Key players, valuable sets, junk wax gems, parallels worth chasing — all pre-loaded.
+        Checklists with eBay links so you can verify value in seconds.
+        """)
+
+    st.markdown("---")
+
+    # ── The Sniper's Playbook ─────────────────────────────────────────
+    st.markdown("### The Sniper's Playbook")
+    st.markdown("""
+    <div style="background: rgba(233,69,96,0.08); border-left: 4px solid #e94560; padding: 16px 20px; border-radius: 4px; font-size: 14px;">
+        <b>Step 1:</b> Search for your card (by player, set, year, or card number)<br>
+        <b>Step 2:</b> Click <b>🃏 Raw</b> — see what ungraded copies sell for<br>
+        <b>Step 3:</b> Click <b>🏆 Graded</b> — see what PSA/BGS copies sell for<br>
+        <b>Step 4:</b> If the graded price is <b>3x+ the raw price</b> and covers the $28 fee + your time → <b>submit it</b><br>
+        <b>Step 5:</b> If not → <b>sell it raw</b> and move on. Don't tie up money for 4 months on a bad play.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # ── Pages at a Glance ─────────────────────────────────────────────
+    st.markdown("### Pages at a Glance")
+
+    st.markdown(PAGES_TABLE_HTML, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # ── Who This Is For ───────────────────────────────────────────────
+    st.markdown("### Who This Is For")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("""
+        **Collectors** sitting on boxes of cards who want to know if anything is actually worth submitting — before wasting $28 and 4 months.
+
+        **Flippers & Resellers** who need instant comps at card shows, estate sales, and thrift stores to snipe underpriced cards.
+        """)
+    with col2:
+        st.markdown("""
+        **Grading Submitters** who want to only send cards where the raw-to-graded spread covers the fee and then some.
+
+        **eBay Sellers** who need to price competitively and generate listings fast with accurate item specifics.
+        """)
+
+    st.markdown("---")
+
+    # ── Roadmap ───────────────────────────────────────────────────────
+    st.markdown("### Roadmap — What's Next")
+    st.markdown("""
+    This is an MVP. Here's where it's headed:
+
+    | Phase | Feature | What It Does |
+    |-------|---------|-------------|
+    | **Next** | **CSV Upload** | Any user uploads their CollX/TCDB export and gets instant value analysis |
+    | **Next** | **eBay Affiliate Links** | Every eBay link earns revenue — passive monetization from day one |
+    | **Soon** | **Spread Calculator** | Auto-calculate the raw vs. graded spread and flag the best grading plays |
+    | **Soon** | **Collection Value Report** | Upload your CSV, get a PDF showing your top 20 most valuable cards with comps |
+    | **Later** | **Price Alerts** | Get notified when a card in your collection sells above a threshold |
+    | **Later** | **Price History Database** | Build our own sold price database — the "Kelley Blue Book" for trading cards |
+    | **Later** | **AI Card Grading** | Upload card photos, get an estimated grade before you send to PSA |
+    """)
+
+    st.markdown("---")
+
+    # ── Get Started ───────────────────────────────────────────────────
+    st.markdown("### Get Started")
+    st.info("👈 **Use the sidebar** to navigate to any page. Start with **CollX Collection** to browse your cards, or use **Search** to look up any card on eBay. Compare the 🃏Raw and 🏆Graded links on every card to find the spread.")
+
+    st.markdown("---")
+
+    # ── More from Economic Integrity ──────────────────────────────────
+    st.markdown("### More from Economic Integrity")
+    st.markdown("""
+    If you enjoy this tool, check out our other projects:
+
+    - **[AltProps.com](https://altprops.com)** — Alternative sports props and analytics
+    - **[FootballStool.com](https://footballstool.com)** — Football research tools and data-driven insights
+    - **[Substack Newsletter](https://economicintegrity.substack.com/)** — Updates, card market insights, and new tool announcements
+
+    We build tools that give everyday people an edge. More coming soon.
+    """)
+
+    st.markdown("---")
+
+    # ── Contact ───────────────────────────────────────────────────────
+    st.markdown("""
+    <div style="text-align:center;padding:16px 0;">
+        <p style="font-size:15px;font-weight:600;margin:0 0 6px 0;color:#ccc;">Comments / Questions / Ideas?</p>
+        <a href="mailto:Economic_integrity@outlook.com" style="color:#4CAF50;text-decoration:none;font-size:14px;">📧 Economic_integrity@outlook.com</a>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div style="text-align:center;padding:8px 0;font-size:12px;color:#555;">
+        © 2026 Economic Integrity LLC. All rights reserved.
+    </div>
+    """, unsafe_allow_html=True)
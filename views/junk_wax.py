@@ -0,0 +1,99 @@
+"""
+Junk Wax Gems
+The few 1987-1992 rookies worth grading, as (player, card) pairs per league.
+"""
+
+import streamlit as st
+
+from ebay_urls import ebay_search_url
+from views.shared import link_grid
+
+MLB_JUNK = [
+    ("Barry Bonds", "1987 Topps #320"), ("Barry Bonds", "1987 Fleer #604"),
+    ("Mark McGwire", "1987 Topps #366"), ("Mark McGwire", "1987 Donruss #46"),
+    ("Bo Jackson", "1987 Topps #170"), ("Greg Maddux", "1987 Topps #36"),
+    ("Will Clark", "1987 Topps #420"), ("Tom Glavine", "1988 Topps #779"),
+    ("Roberto Alomar", "1988 Topps #4"), ("Ken Griffey Jr", "1989 Upper Deck #1"),
+    ("Ken Griffey Jr", "1989 Bowman #220"), ("Ken Griffey Jr", "1989 Donruss #33"),
+    ("Craig Biggio", "1989 Upper Deck #273"), ("Randy Johnson", "1989 Fleer #381"),
+    ("John Smoltz", "1989 Donruss #642"), ("Gary Sheffield", "1989 Upper Deck #13"),
+    ("Frank Thomas", "1990 Topps #414"), ("Frank Thomas", "1990 Leaf #300"),
+    ("Sammy Sosa", "1990 Leaf #220"), ("Larry Walker", "1990 Topps #757"),
+    ("David Justice", "1990 Topps #48"), ("Juan Gonzalez", "1990 Topps #331"),
+    ("Chipper Jones", "1991 Topps #333"), ("Ivan Rodriguez", "1991 Topps #101"),
+    ("Jeff Bagwell", "1991 Topps #755"), ("Jim Thome", "1991 Topps #353"),
+    ("Mike Piazza", "1992 Bowman #461"), ("Manny Ramirez", "1992 Bowman #532"),
+    ("Pedro Martinez", "1992 Bowman #82"), ("Mariano Rivera", "1992 Bowman #302"),
+]
+
+NBA_JUNK = [
+    ("Michael Jordan", "1987 Fleer #59"), ("Michael Jordan", "1988 Fleer #17"),
+    ("Michael Jordan", "1989 Fleer #21"), ("Michael Jordan", "1990 Fleer #26"),
+    ("Scottie Pippen", "1988 Fleer #20"), ("Reggie Miller", "1988 Fleer #57"),
+    ("Dennis Rodman", "1989 Hoops #211"), ("David Robinson", "1989 Hoops #138"),
+    ("David Robinson", "1989 Fleer #76"), ("Gary Payton", "1990 Hoops #391"),
+    ("Shawn Kemp", "1990 Hoops #279"), ("Tim Hardaway", "1990 Hoops #113"),
+    ("Dikembe Mutombo", "1991 Hoops #549"), ("Larry Johnson", "1991 Hoops #547"),
+    ("Shaquille O'Neal", "1992 Topps #362"), ("Shaquille O'Neal", "1992 Fleer #401"),
+    ("Shaquille O'Neal", "1992 Upper Deck #1"), ("Alonzo Mourning", "1992 Topps #393"),
+    ("Charles Barkley", "1987 Fleer #9"), ("Patrick Ewing", "1987 Fleer #37"),
+    ("Karl Malone", "1987 Fleer #68"), ("John Stockton", "1987 Fleer #115"),
+    ("Hakeem Olajuwon", "1987 Fleer #80"), ("Clyde Drexler", "1987 Fleer #30"),
+]
+
+NFL_JUNK = [
+    ("Bo Jackson", "1987 Topps #327"), ("Barry Sanders", "1989 Score #257"),
+    ("Barry Sanders", "1989 Topps Traded #83T"), ("Deion Sanders", "1989 Score #246"),
+    ("Troy Aikman", "1989 Score #270"), ("Troy Aikman", "1989 Topps Traded #70T"),
+    ("Emmitt Smith", "1990 Score #101"), ("Emmitt Smith", "1990 Topps Traded #27T"),
+    ("Brett Favre", "1991 Stadium Club #94"), ("Brett Favre", "1991 Ultra #283"),
+    ("Junior Seau", "1990 Score #302"), ("Thurman Thomas", "1988 Topps #226"),
+    ("Sterling Sharpe", "1988 Topps #392"), ("Tim Brown", "1988 Topps #144"),
+    ("Cris Carter", "1988 Topps #119"), ("Michael Irvin", "1989 Score #18"),
+    ("Derrick Thomas", "1989 Score #258"), ("Andre Rison", "1989 Score #272"),
+    ("Rod Woodson", "1987 Topps #264"), ("Cortez Kennedy", "1990 Score #599"),
+]
+
+NHL_JUNK = [
+    ("Brett Hull", "1988 Topps #66"), ("Joe Sakic", "1989 O-Pee-Chee #113"),
+    ("Jaromir Jagr", "1990 Score #428"), ("Sergei Fedorov", "1990 Score #429"),
+    ("Pavel Bure", "1990 Upper Deck #526"), ("Eric Lindros", "1991 Score #440"),
+    ("Martin Brodeur", "1991 Upper Deck #146"), ("Dominik Hasek", "1991 Upper Deck #335"),
+    ("Teemu Selanne", "1992 Upper Deck #406"), ("Luc Robitaille", "1987 Topps #42"),
+    ("Brian Leetch", "1988 Topps #196"), ("Jeremy Roenick", "1989 Topps #111"),
+    ("Mike Modano", "1989 Topps #174"), ("Nicklas Lidstrom", "1991 Upper Deck #167"),
+]
+
+
+# (subheader, cards) sections in page order
+SECTIONS = [
+    ("⚾ MLB - Key Rookies Worth Grading", MLB_JUNK),
+    ("🏀 NBA - Key Rookies Worth Grading", NBA_JUNK),
+    ("🏈 NFL - Key Rookies Worth Grading", NFL_JUNK),
+    ("🏒 NHL - Key Rookies Worth Grading", NHL_JUNK),
+]
+GRID_STYLE = "display:grid;grid-template-columns:repeat(3,1fr);gap:4px 10px;font-size:13px;"
+
+
+@st.cache_resource
+def _section_html():
+    """One link grid per league, built once per process"""
+    grids = []
+    for _, cards in SECTIONS:
+        items = []
+        for player, card in sorted(cards, key=lambda x: x[0]):
+            url = ebay_search_url(f"{player} {card}", sold=True, min_price=50, exclude_auto=True)
+            items.append(f'<div><a href="{url}" target="_blank">{player} - {card}</a></div>')
+        grids.append(link_grid(GRID_STYLE, items))
+    return grids
+
+
+def render():
+    st.header("📦 JUNK WAX GEMS (1987-1992)")
+    st.caption("The FEW cards from the overproduction era actually worth grading. PSA 10 or bust!")
+
+    for (subheader, _), grid in zip(SECTIONS, _section_html()):
+        st.subheader(subheader)
+        st.markdown(grid, unsafe_allow_html=True)
+
+    st.info("💡 **Junk Wax Tip:** Most base cards are worthless. Only PSA 10s of key rookies and stars have value. Centering is everything!")
@@ -0,0 +1,56 @@
+"""
+Key Players
+Key players from the reference database, grouped by sport.
+"""
+
+import streamlit as st
+
+from ebay_urls import ebay_search_url
+from views.shared import DB_PATH, file_version, fragment, get_key_players, link_grid, require_db
+
+GRID_STYLE = "display:grid;grid-template-columns:repeat(3,1fr);gap:4px 10px;font-size:14px;"
+
+
+@st.cache_resource(max_entries=1)
+def _sport_items(db_version):
+    """[(sport, [(lowercased name, grid item HTML), ...]), ...] in reference-DB order, built once per DB version"""
+    players = get_key_players()
+    sport_items = []
+    for sport in players['sport'].unique():
+        items = []
+        for p in players.loc[players['sport'] == sport, 'player_name']:
+            url = ebay_search_url(f"{p} PSA 10", sold=True)
+            items.append((p.lower(), f'<div><a href="{url}" target="_blank">{p}</a></div>'))
+        sport_items.append((sport, items))
+    return sport_items
+
+
+@fragment
+def _player_grids():
+    """Player search and one link grid per sport - reruns on its own"""
+    search_query = st.text_input("🔍 Search players...", placeholder="Type to filter...", key="key_player_search")
+    q = search_query.lower() if search_query else ""
+    
+    # One markdown element per sport rather than one per player
+    for sport, sport_items in _sport_items(file_version(DB_PATH)):
+        if q:
+            items = [item for name, item in sport_items if q in name]
+            if not items:
+                continue
+        else:
+            items = [item for _, item in sport_items]
+        with st.expander(f"**{sport.upper()}** ({len(items)})", expanded=True):
+            st.markdown(link_grid(GRID_STYLE, items), unsafe_allow_html=True)
+
+
+def render():
+    st.header("Key Players")
+    
+    require_db()
+    try:
+        _sport_items(file_version(DB_PATH))
+    except:
+        st.info("Key players data not loaded.")
+        return
+    
+    _player_grids()
@@ -0,0 +1,27 @@
+"""
+Key Sets
+Tier 1 sets from the reference database.
+"""
+
+import streamlit as st
+
+import reference_db
+from ebay_urls import ebay_search_url
+from views.shared import DB_PATH, require_db
+
+
+def render():
+    st.header("Key Sets to Always Check")
+    
+    require_db()
+    st.subheader("🔥 TIER 1 - Grade ANY card")
+    try:
+        tier1 = reference_db.valuable_sets(tier=1, db_path=DB_PATH)
+        for sport in dict.fromkeys(row.sport for row in tier1):
+            with st.expander(f"**{sport.upper()}**"):
+                for row in tier1:
+                    if row.sport == sport:
+                        url = ebay_search_url(f"{row.set_name} PSA 10", sold=True)
+                        st.markdown(f"**{row.set_name}** - {row.notes or ''} [eBay]({url})")
+    except:
+        st.info("Key sets data not loaded.")
@@ -0,0 +1,180 @@
+"""
+Page Chrome
+Title bar, sidebar and footer shared by every page. The static HTML blocks are
+module constants, built once per process instead of on every rerun.
+"""
+
+import html as html_mod
+import os
+import time
+
+import streamlit as st
+
+from card_catalog import CATALOG_PATH
+from ebay_urls import ebay_search_url
+from views.shared import GRADING_COST, LOGO_PATH, collx_version, file_version, get_global_index, refresh_shared_data
+
+SIDEBAR_BRAND_HTML = '<p style="margin:0;padding-top:4px;font-size:18px;font-weight:800;line-height:1.25;letter-spacing:-0.3px;">Sports Card<br>Value Sniper</p>'
+
+QUICK_SEARCH_TITLE_HTML = '<p style="margin:0 0 4px 0;font-size:13px;font-weight:600;">🔍 Quick eBay Search</p>'
+
+CHEAT_SHEET_TITLE_HTML = '<p style="margin:0 0 4px 0;font-size:13px;font-weight:600;">🎯 Sniper\'s Cheat Sheet</p>'
+
+CHEAT_SHEET_HTML = f"""
+    <div style="font-size:12px;line-height:1.6;color:#bbb;">
+        <div style="display:flex;justify-content:space-between;"><span>PSA grading fee</span><span style="color:#e94560;font-weight:600;">${GRADING_COST}</span></div>
+        <div style="display:flex;justify-content:space-between;"><span>PSA turnaround</span><span style="color:#e94560;font-weight:600;">4+ months</span></div>
+        <div style="display:flex;justify-content:space-between;margin-top:6px;padding-top:6px;border-top:1px solid #333;"><span>Min graded value to profit</span><span style="color:#4CAF50;font-weight:700;">~$80+</span></div>
+        <div style="display:flex;justify-content:space-between;"><span>Target spread (raw→graded)</span><span style="color:#4CAF50;font-weight:700;">3x+</span></div>
+    </div>
+    """
+
+GRADE_IT_HTML = """
+    <div style="background:rgba(233,69,96,0.1);border-radius:6px;padding:8px 10px;font-size:11px;color:#ccc;line-height:1.5;">
+        <b style="color:#e94560;">Grade it?</b> Only if raw sells for &lt;$20 and PSA 8+ sells for $80+. Otherwise sell raw.
+    </div>
+    """
+
+LINKS_TITLE_HTML = '<p style="margin:0 0 4px 0;font-size:13px;font-weight:600;">🔗 Links</p>'
+
+LINKS_HTML = """
+    <div style="font-size:12px;line-height:2;">
+        <a href="https://www.psacard.com/priceguide" target="_blank" style="color:#aaa;text-decoration:none;">📊 PSA Price Guide</a><br>
+        <a href="https://130point.com/sales/" target="_blank" style="color:#aaa;text-decoration:none;">🔍 130point Sales Data</a><br>
+        <a href="https://www.ebay.com/usr/economicintegrity" target="_blank" style="color:#aaa;text-decoration:none;">🛒 Our eBay Store</a><br>
+        <a href="https://collx.app/EconomicIntegrity" target="_blank" style="color:#aaa;text-decoration:none;">📦 CollX Profile</a><br>
+        <a href="https://economicintegrity.substack.com/" target="_blank" style="color:#aaa;text-decoration:none;">📝 Substack Newsletter</a><br>
+        <a href="https://altprops.com" target="_blank" style="color:#aaa;text-decoration:none;">🏈 AltProps.com</a><br>
+        <a href="https://footballstool.com" target="_blank" style="color:#aaa;text-decoration:none;">🏟️ FootballStool.com</a>
+    </div>
+    """
+
+CONTACT_HTML = """
+    <div style="font-size:11px;color:#666;line-height:1.6;text-align:center;">
+        <a href="mailto:Economic_integrity@outlook.com" style="color:#4CAF50;text-decoration:none;">💬 Questions / Ideas? Email us</a><br>
+        <span style="margin-top:4px;display:inline-block;">© 2026 Economic Integrity LLC</span>
+    </div>
+    """
+
+FOOTER_HTML = """
+<div style="text-align:center;font-size:13px;color:#888;line-height:2;">
+    <a href="https://altprops.com" target="_blank" style="color:#4CAF50;text-decoration:none;">AltProps.com</a>
+    &nbsp;·&nbsp;
+    <a href="https://footballstool.com" target="_blank" style="color:#4CAF50;text-decoration:none;">FootballStool.com</a>
+    &nbsp;·&nbsp;
+    <a href="https://economicintegrity.substack.com/" target="_blank" style="color:#4CAF50;text-decoration:none;">Substack</a>
+    &nbsp;·&nbsp;
+    <a href="mailto:Economic_integrity@outlook.com" style="color:#4CAF50;text-decoration:none;">Contact Us</a>
+    <br>
+    <span style="font-size:11px;color:#555;">© 2026 Economic Integrity LLC. All rights reserved.</span>
+</div>
+"""
+
+HAS_LOGO = os.path.exists(LOGO_PATH)
+
+
+def render_header():
+    """Logo + title"""
+    logo_col, title_col = st.columns([0.07, 0.93])
+    with logo_col:
+        if HAS_LOGO:
+            st.image(LOGO_PATH, width=60)
+    with title_col:
+        st.title("Sports Card Value Sniper")
+        st.markdown("**Find the spread. Snipe the profit.** — Raw vs. Graded price tool")
+    st.markdown('<span style="color: #00FF00; font-size: 14px;">Economic Integrity LLC IP — Created 1/29/26</span>', unsafe_allow_html=True)
+
+
+def _render_all_sets_hits(quick_search):
+    global_index = get_global_index(collx_version(), file_version(CATALOG_PATH))
+    t0 = time.perf_counter()
+    hits = global_index.search(quick_search, limit=25)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+    st.caption(f"{len(hits)} matches across {len(global_index):,} cards · {elapsed_ms:.1f} ms")
+    hit_html = ['<div style="font-size:12px;line-height:1.45;">']
+    for source, num, player, team, detail, ebay_q in hits:
+        url_raw = ebay_search_url(ebay_q, sold=True, exclude_auto=True, exclude_graded=True)
+        url_graded = ebay_search_url(ebay_q, sold=True, exclude_auto=True, graded_only=True)
+        num_display = f" #{html_mod.escape(num)}" if num else ""
+        hit_html.append('<div style="padding:4px 0;border-bottom:1px solid #333;">')
+        hit_html.append(f'<b>{html_mod.escape(player)}</b>{num_display}<br>')
+        hit_html.append(f'<span style="color:#888;" title="{html_mod.escape(detail)}">{html_mod.escape(source)} · {html_mod.escape(team)}</span><br>')
+        hit_html.append(f'<a href="{url_raw}" target="_blank">🃏Raw</a> · <a href="{url_graded}" target="_blank">🏆Graded</a>')
+        hit_html.append('</div>')
+    hit_html.append('</div>')
+    st.markdown(''.join(hit_html), unsafe_allow_html=True)
+
+
+def render_sidebar(pages):
+    """Branding, navigation, quick search and reference links; returns the selected page"""
+    with st.sidebar:
+        # ── Branding ──────────────────────────────────────────────────────
+        if HAS_LOGO:
+            sb_logo_col, sb_text_col = st.columns([0.22, 0.78])
+            with sb_logo_col:
+                st.image(LOGO_PATH, width=50)
+            with sb_text_col:
+                st.markdown(SIDEBAR_BRAND_HTML, unsafe_allow_html=True)
+        else:
+            st.markdown("**Sports Card Value Sniper**")
+
+        # ── Navigation ────────────────────────────────────────────────────
+        page = st.selectbox("Navigate", pages, index=0, label_visibility="collapsed")
+
+        st.markdown("---")
+
+        # ── Quick eBay Search ─────────────────────────────────────────────
+        st.markdown(QUICK_SEARCH_TITLE_HTML, unsafe_allow_html=True)
+        quick_search = st.text_input("Search eBay", placeholder="e.g. Ken Griffey Jr 1989 Upper Deck", label_visibility="collapsed")
+        qs_col1, qs_col2 = st.columns(2)
+        with qs_col1:
+            qs_sold = st.checkbox("Sold", value=True, key="qs_sold")
+        with qs_col2:
+            qs_graded = st.checkbox("Graded", value=False, key="qs_graded")
+        qs_all_sets = st.checkbox("Search all sets", value=False, key="qs_all_sets",
+                                  help="Search every checklist and your CollX collection at once")
+        if quick_search:
+            q = quick_search
+            url_sold = ebay_search_url(q, sold=True, exclude_auto=True, graded_only=qs_graded)
+            url_active = ebay_search_url(q, sold=False, exclude_auto=True, graded_only=qs_graded)
+            st.markdown(f"""
+            <div style="display:flex;gap:8px;margin:4px 0;">
+                <a href="{url_sold}" target="_blank" style="flex:1;text-align:center;padding:6px;background:#1a1a2e;border:1px solid #444;border-radius:6px;color:#4CAF50;text-decoration:none;font-size:12px;font-weight:600;">🔍 Sold</a>
+                <a href="{url_active}" target="_blank" style="flex:1;text-align:center;padding:6px;background:#1a1a2e;border:1px solid #444;border-radius:6px;color:#2196F3;text-decoration:none;font-size:12px;font-weight:600;">🛒 Active</a>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # ── All-sets card search ──────────────────────────────────────────
+        if quick_search and qs_all_sets:
+            _render_all_sets_hits(quick_search)
+
+        st.markdown("---")
+
+        # ── Sniper's Cheat Sheet ──────────────────────────────────────────
+        st.markdown(CHEAT_SHEET_TITLE_HTML, unsafe_allow_html=True)
+        st.markdown(CHEAT_SHEET_HTML, unsafe_allow_html=True)
+
+        st.markdown("")
+        st.markdown(GRADE_IT_HTML, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # ── Links ─────────────────────────────────────────────────────────
+        st.markdown(LINKS_TITLE_HTML, unsafe_allow_html=True)
+        st.markdown(LINKS_HTML, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # ── Contact & Copyright ───────────────────────────────────────────
+        st.markdown(CONTACT_HTML, unsafe_allow_html=True)
+
+        if st.button("🔄 Reload data", key="reload_data", help="Re-read the reference DB, card catalog and CollX export"):
+            refresh_shared_data()
+            st.rerun()
+
+    return page
+
+
+def render_footer():
+    st.markdown("---")
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
@@ -0,0 +1,40 @@
+"""
+90s NBA
+Quick sold links for 90s basketball stars.
+"""
+
+import streamlit as st
+
+from ebay_urls import ebay_search_url
+from views.shared import link_grid
+
+NBA_90S_STARS = [
+    "Alonzo Mourning", "Anfernee Hardaway", "Charles Barkley", "Christian Laettner",
+    "Cliff Robinson", "Clyde Drexler", "David Robinson", "Dikembe Mutombo",
+    "Doc Rivers", "Dominique Wilkins", "Gary Payton", "Glen Rice",
+    "Hakeem Olajuwon", "Isiah Thomas", "Jason Kidd", "John Stockton",
+    "Karl Malone", "Kevin McHale", "Larry Bird", "Latrell Sprewell",
+    "Magic Johnson", "Moses Malone", "Mugsy Bogues", "Patrick Ewing",
+    "Reggie Miller", "Scottie Pippen", "Shaquille O'Neal", "Shawn Bradley",
+    "Shawn Kemp", "Steve Kerr", "Tim Hardaway", "Toni Kukoc", "Vlade Divac",
+]
+
+
+GRID_STYLE = "display:grid;grid-template-columns:repeat(4,1fr);gap:6px 12px;font-size:14px;"
+
+
+@st.cache_resource
+def _stars_html():
+    """The whole link grid, built once per process"""
+    items = []
+    for player in sorted(NBA_90S_STARS):
+        url = ebay_search_url(f"{player}", sold=True, min_price=50, exclude_auto=True)
+        items.append(f'<div><a href="{url}" target="_blank">{player}</a></div>')
+    return link_grid(GRID_STYLE, items)
+
+
+def render():
+    st.header("🏀 90s NBA STARS")
+    st.caption("Click = eBay SOLD $50+, no autos (any grade)")
+    
+    st.markdown(_stars_html(), unsafe_allow_html=True)
@@ -0,0 +1,59 @@
+"""
+Parallels & Inserts
+Parallel, insert and premium-set keywords with PSA $100+ sold links.
+"""
+
+import streamlit as st
+
+from ebay_urls import ebay_search_url
+from views.shared import link_grid
+
+PRIZM = ["Silver", "Gold", "Green", "Blue", "Red", "Orange", "Purple", "Pink", "Black", "Camo", "Tie Dye", "Disco", "Mojo", "Shimmer"]
+OPTIC = ["Holo", "Silver", "Blue", "Red", "Orange", "Pink", "Purple", "Gold", "Black", "Shock", "Wave"]
+REFRACTORS = ["Refractor", "Gold Refractor", "Red Refractor", "Blue Refractor", "Orange Refractor", "Atomic Refractor", "Xfractor", "Superfractor"]
+SP_SSP = ["SP Short Print", "SSP Super Short Print", "SP Variation", "Photo Variation", "Image Variation"]
+NUMBERED = ["/1 One of One", "/5", "/10", "/25", "/50", "/75", "/99", "/199", "/299", "/499"]
+INSERTS = ["Kaboom", "Downtown", "Color Blast", "Case Hit", "Net Marvels", "Cracked Ice", "Mojo", "Shimmer"]
+PREMIUM = ["National Treasures", "Flawless", "Immaculate", "Exquisite", "Noir", "One", "Spectra", "Obsidian"]
+
+
+def _grid_style(columns):
+    return f"display:grid;grid-template-columns:repeat({columns},1fr);gap:4px 10px;font-size:13px;"
+
+
+# (subheader, keywords, eBay query template, grid columns) in page order;
+# a "---" divider sits between the first three sections and the rest
+SECTIONS = [
+    ("🔷 Prizm Parallels", PRIZM, "Prizm {} PSA", 5),
+    ("🟣 Optic Parallels", OPTIC, "Optic {} PSA", 5),
+    ("💎 Refractors", REFRACTORS, "{} PSA", 4),
+    ("🎯 Short Prints & Variations", SP_SSP, "{} PSA", 3),
+    ("🔢 Numbered Cards", NUMBERED, "Numbered {} PSA", 5),
+    ("🔥 Premium Inserts", INSERTS, "{} PSA", 4),
+    ("👑 Premium Sets", PREMIUM, "{} PSA", 4),
+]
+DIVIDER_BEFORE = 3
+
+
+@st.cache_resource
+def _section_html():
+    """One link grid per section, built once per process"""
+    grids = []
+    for _, keywords, template, columns in SECTIONS:
+        items = []
+        for p in keywords:
+            url = ebay_search_url(template.format(p), sold=True, min_price=100, exclude_auto=True)
+            items.append(f'<div><a href="{url}" target="_blank">{p}</a></div>')
+        grids.append(link_grid(_grid_style(columns), items))
+    return grids
+
+
+def render():
+    st.header("🌈 Parallels & Inserts - PSA $100+ Sold")
+    st.caption("Click = eBay SOLD $100+, no autos")
+    
+    for i, ((subheader, *_), grid) in enumerate(zip(SECTIONS, _section_html())):
+        if i == DIVIDER_BEFORE:
+            st.markdown("---")
+        st.subheader(subheader)
+        st.markdown(grid, unsafe_allow_html=True)
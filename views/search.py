@@ -0,0 +1,41 @@
+"""
+eBay Price Lookup
+Builds one sold search from player, year/set, card number and grade.
+"""
+
+import streamlit as st
+
+from ebay_urls import ebay_search_url
+
+
+def render():
+    st.header("eBay Price Lookup")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        player = st.text_input("Player Name", placeholder="LeBron James")
+    with col2:
+        year_set = st.text_input("Year/Set", placeholder="2003 Topps Chrome")
+    
+    col3, col4 = st.columns(2)
+    with col3:
+        card_num = st.text_input("Card # (optional)", placeholder="111")
+    with col4:
+        grade = st.selectbox("Grade", ["PSA 10", "PSA 9", "PSA 8", "BGS 9.5", "Any PSA"])
+    
+    if st.button("🔍 Search eBay Sold", type="primary"):
+        query_parts = [p for p in [player, year_set, f"#{card_num}" if card_num else "", 
+                                    grade if grade != "Any PSA" else "PSA"] if p]
+        if query_parts:
+            url = ebay_search_url(" ".join(query_parts), sold=True)
+            st.markdown(f"### [Search eBay: {' '.join(query_parts)}]({url})")
+    
+    st.markdown("---")
+    st.markdown("### Quick Links")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("[📊 PSA Price Guide](https://www.psacard.com/priceguide)")
+        st.markdown("[🔍 130point Sales](https://130point.com/sales/)")
+    with col2:
+        st.markdown("[📈 Card Ladder](https://cardladder.com/)")
+        st.markdown("[🏷️ COMC](https://www.comc.com/)")
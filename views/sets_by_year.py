@@ -0,0 +1,144 @@
+"""
+Sets by Year
+Fifty years of flagship sets (plus hockey) with PSA $100+ sold links.
+⭐ marks premium sets.
+"""
+
+import streamlit as st
+
+from ebay_urls import ebay_search_url
+from views.shared import fragment, link_grid
+
+SETS_BY_YEAR = {
+    2025: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐", "Panini Select ⭐", "Panini Donruss Optic ⭐"],
+    2024: ["Topps", "Topps Chrome ⭐", "Topps Finest ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐", "Panini Select ⭐", "Panini Donruss Optic ⭐", "Panini Mosaic ⭐"],
+    2023: ["Topps", "Topps Chrome ⭐", "Topps Finest ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐", "Panini Select ⭐", "Panini Donruss Optic ⭐", "Panini Mosaic ⭐"],
+    2022: ["Topps", "Topps Chrome ⭐", "Topps Finest ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐", "Panini Select ⭐", "Panini Donruss Optic ⭐", "Panini Mosaic ⭐"],
+    2021: ["Topps", "Topps Chrome ⭐", "Topps Finest ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐", "Panini Select ⭐", "Panini Donruss Optic ⭐", "Panini Mosaic ⭐"],
+    2020: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐", "Panini Select ⭐", "Panini Donruss Optic ⭐", "Panini Mosaic ⭐"],
+    2019: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐", "Panini Select ⭐", "Panini Donruss Optic ⭐"],
+    2018: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐", "Panini Select ⭐", "Panini Donruss Optic ⭐"],
+    2017: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐", "Panini Select ⭐"],
+    2016: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐"],
+    2015: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐"],
+    2014: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐"],
+    2013: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐"],
+    2012: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Panini Prizm ⭐⭐"],
+    2011: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐"],
+    2010: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐"],
+    2009: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    2008: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    2007: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    2006: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    2005: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    2004: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    2003: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    2002: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    2001: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    2000: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    1999: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck"],
+    1998: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Upper Deck SP Authentic ⭐"],
+    1997: ["Topps", "Topps Chrome ⭐", "Bowman", "Bowman Chrome ⭐", "Bowman's Best ⭐"],
+    1996: ["Topps", "Topps Chrome ⭐", "Bowman's Best ⭐", "Finest ⭐"],
+    1995: ["Topps", "Finest ⭐", "Bowman's Best ⭐"],
+    1994: ["Topps", "Finest ⭐", "Upper Deck SP ⭐"],
+    1993: ["Topps", "Finest ⭐", "Upper Deck SP ⭐", "Stadium Club"],
+    1992: ["Topps", "Stadium Club ⭐", "Upper Deck", "Bowman", "Fleer Ultra"],
+    1991: ["Topps", "Stadium Club ⭐", "Upper Deck", "Fleer Ultra"],
+    1990: ["Topps", "Upper Deck", "Leaf ⭐", "Bowman"],
+    1989: ["Topps", "Upper Deck ⭐", "Bowman", "Donruss", "Fleer", "Score"],
+    1988: ["Topps", "Donruss", "Fleer", "Score"],
+    1987: ["Topps", "Donruss", "Fleer"],
+    1986: ["Topps", "Donruss", "Fleer ⭐"],
+    1985: ["Topps", "Donruss", "Fleer"],
+    1984: ["Topps", "Donruss", "Fleer"],
+    1983: ["Topps", "Donruss", "Fleer"],
+    1982: ["Topps", "Donruss", "Fleer"],
+    1981: ["Topps", "Donruss", "Fleer"],
+    1980: ["Topps"],
+    1979: ["Topps", "O-Pee-Chee"],
+    1978: ["Topps", "O-Pee-Chee"],
+    1977: ["Topps", "O-Pee-Chee"],
+    1976: ["Topps"],
+    1975: ["Topps"],
+}
+
+HOCKEY_SETS = {
+    "2020-21 Upper Deck": ["2020-21 Upper Deck Series 1 Hockey", "2020-21 Upper Deck Series 2 Hockey", "2020-21 Upper Deck Extended Series Hockey"],
+    "2019-20 Upper Deck": ["2019-20 Upper Deck Series 1 Hockey", "2019-20 Upper Deck Series 2 Hockey", "2019-20 Upper Deck Trilogy Hockey", "2019-20 Upper Deck Artifacts Hockey", "2019-20 Upper Deck Update Hockey", "2019-20 Upper Deck Credentials Hockey"],
+    "2018-19 Upper Deck": ["2018-19 SP Hockey", "2018-19 SP Authentic Hockey", "2018-19 Upper Deck Series 1 Hockey", "2018-19 Upper Deck Series 2 Hockey"],
+    "SP Hockey": ["2020-21 SP Hockey", "2019-20 SP Hockey", "2018-19 SP Hockey", "2017-18 SP Hockey", "2016-17 SP Hockey", "2015-16 SP Hockey", "2020-21 SP Authentic Hockey", "2019-20 SP Authentic Hockey", "2018-19 SP Authentic Hockey", "2017-18 SP Authentic Hockey"],
+    "2009-10 Hockey": ["2009-10 Upper Deck Hockey", "2009-10 O-Pee-Chee Hockey", "2009-10 Upper Deck Series 1 Hockey", "2009-10 Upper Deck Series 2 Hockey"],
+    "Vintage Topps Hockey": ["1988 Topps Hockey", "1986 Topps Hockey", "1985 Topps Hockey", "1984 Topps Hockey", "1981 Topps Hockey", "1978 Topps Hockey"],
+    "Vintage O-Pee-Chee Hockey": ["1977 O-Pee-Chee Hockey", "1978 O-Pee-Chee Hockey", "1979 O-Pee-Chee Hockey", "1980 O-Pee-Chee Hockey", "1981 O-Pee-Chee Hockey", "1984 O-Pee-Chee Hockey", "1985 O-Pee-Chee Hockey", "1986 O-Pee-Chee Hockey"],
+}
+
+
+YEAR_GRID_STYLE = "display:grid;grid-template-columns:repeat(4,1fr);gap:2px 10px;font-size:13px;"
+HOCKEY_GRID_STYLE = "display:grid;grid-template-columns:repeat(2,1fr);gap:4px 10px;font-size:13px;"
+
+
+@st.cache_resource
+def _year_items():
+    """[(year, [(lowercased set name, grid item HTML), ...]), ...] newest first, built once per process"""
+    year_items = []
+    for year in range(2025, 1974, -1):
+        if year in SETS_BY_YEAR:
+            items = []
+            for set_name in SETS_BY_YEAR[year]:
+                clean_name = set_name.replace(" ⭐⭐", "").replace(" ⭐", "")
+                url = ebay_search_url(f"{year} {clean_name} PSA", sold=True, min_price=100, exclude_auto=True)
+                items.append((set_name.lower(), f'<div><a href="{url}" target="_blank">{set_name}</a></div>'))
+            year_items.append((year, items))
+    return year_items
+
+
+@st.cache_resource
+def _hockey_html():
+    """One link grid per hockey category, built once per process"""
+    grids = []
+    for sets in HOCKEY_SETS.values():
+        items = []
+        for set_name in sets:
+            url = ebay_search_url(f"{set_name}", sold=True, min_price=50, exclude_auto=True)
+            items.append(f'<div><a href="{url}" target="_blank">{set_name}</a></div>')
+        grids.append(link_grid(HOCKEY_GRID_STYLE, items))
+    return grids
+
+
+@fragment
+def _year_sets():
+    """Set search and the per-year set lists - reruns on its own"""
+    col_search, col_expand = st.columns([3, 1])
+    with col_search:
+        set_search = st.text_input("🔍 Search sets...", placeholder="e.g. prizm, chrome, bowman...", key="set_search", label_visibility="collapsed")
+    with col_expand:
+        expand_all = st.checkbox("Expand All", value=False, key="expand_all")
+    
+    search_lower = set_search.lower() if set_search else ""
+    
+    for year, set_items in _year_items():
+        if search_lower:
+            items = [item for name, item in set_items if search_lower in name]
+            if not items:
+                continue
+        else:
+            items = [item for _, item in set_items]
+        
+        with st.expander(f"**{year}** ({len(items)} sets)", expanded=expand_all or bool(search_lower)):
+            st.markdown(link_grid(YEAR_GRID_STYLE, items), unsafe_allow_html=True)
+
+
+def render():
+    st.header("📅 Sets by Year - PSA $100+ Sold")
+    st.caption("Click = eBay SOLD $100+, no autos | ⭐ = Premium")
+    
+    _year_sets()
+    
+    # Hockey section
+    st.markdown("---")
+    st.subheader("🏒 HOCKEY SETS")
+    
+    for (category, sets), grid in zip(HOCKEY_SETS.items(), _hockey_html()):
+        with st.expander(f"**{category}** ({len(sets)} sets)", expanded=False):
+            st.markdown(grid, unsafe_allow_html=True)
@@ -0,0 +1,261 @@
+"""
+Shared Page Helpers
+Process-wide data loaders, the rendered-page cache and the pagination controls
+every page module uses. Imported once per process, so nothing here is rebuilt
+on a rerun.
+"""
+
+import os
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import reference_db
+from card_catalog import CATALOG_PATH, list_sets, load_cards, load_prefix_info
+from collx_cache import COLLX_SEARCH_COLS, csv_fingerprint, load_collx, year_text
+from ebay_urls import collx_queries, ebay_search_urls
+from page_cache import LRUCache
+from search_index import GlobalSearchIndex, NgramIndex
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOGO_PATH = os.path.join(BASE_DIR, "logo.png")
+
+DB_PATH = reference_db.REFERENCE_DB_PATH
+GRADING_COST = 27.99
+
+# A page's search / filter / results region runs as a fragment, so typing or
+# changing a filter reruns only that region - not the title, sidebar, footer or
+# the rest of the page. st.fragment is 1.37+, st.experimental_fragment 1.33+;
+# on older Streamlit the region reruns with the whole script as before.
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+def require_db():
+    """Stop the page with an error if the reference DB is missing"""
+    if not reference_db.exists(DB_PATH):
+        st.error("Reference database not found.")
+        st.stop()
+
+# ── Shared read-only data ────────────────────────────────────────────
+# Players, sets, checklists and the collection are loaded once per process with
+# st.cache_resource and handed to every session by reference (st.cache_data would
+# unpickle a fresh copy per call). Callers must treat them as read-only. Each loader
+# is keyed on its source file's version, so a rebuilt file is picked up on the next
+# rerun; refresh_shared_data() drops everything at once (sidebar "Reload data").
+
+def file_version(path):
+    """(size, mtime_ns) of a data file, or None if it is missing"""
+    try:
+        return csv_fingerprint(path)
+    except OSError:
+        return None
+
+@st.cache_resource(max_entries=1)
+def _load_key_players(db_version):
+    return pd.DataFrame(reference_db.key_players(DB_PATH), columns=reference_db.KeyPlayer._fields)
+
+def get_key_players():
+    """Every key_players row, grouped by sport in reference-DB order (shared, read-only)"""
+    return _load_key_players(file_version(DB_PATH))
+
+# Athletes A-Z view of the same rows: no soccer, by name, with a league tag
+@st.cache_resource(max_entries=1)
+def _load_players(db_version):
+    df = _load_key_players(db_version)
+    df = df[df['sport'] != 'soccer'].sort_values('player_name', kind='stable', ignore_index=True)
+    # Map to league abbreviations
+    league_map = {'football': 'NFL', 'baseball': 'MLB', 'basketball': 'NBA', 'hockey': 'NHL'}
+    df['league'] = df['sport'].map(league_map).fillna(df['sport'].str.upper())
+    return df
+
+def get_all_players():
+    """All key players (shared, read-only)"""
+    return _load_players(file_version(DB_PATH))
+
+@st.cache_resource(max_entries=1)
+def _load_sets(catalog_version):
+    return tuple(MappingProxyType(info) for info in list_sets())
+
+def get_sets():
+    """Catalog sets in sidebar order (shared, read-only)"""
+    return _load_sets(file_version(CATALOG_PATH))
+
+# Checklist cards come from the card catalog (data/catalog.db), one set at a time
+@st.cache_resource(max_entries=32)
+def _load_checklist(set_id, catalog_version):
+    return tuple(load_cards(set_id)), MappingProxyType(load_prefix_info(set_id))
+
+def get_checklist(set_id):
+    """One checklist set's cards (tuple) and prefix info (read-only mapping)"""
+    return _load_checklist(set_id, file_version(CATALOG_PATH))
+
+# One n-gram index per checklist, built once per process and shared by every session
+@st.cache_resource(max_entries=32)
+def _build_checklist_index(set_id, catalog_version):
+    cards, _ = get_checklist(set_id)
+    return NgramIndex(cards)
+
+def get_checklist_index(set_id):
+    """Substring index over (number, player, team, type, notes) for one checklist"""
+    return _build_checklist_index(set_id, file_version(CATALOG_PATH))
+
+COLLX_CSV_PATH = os.path.join(BASE_DIR, "collx-photos-master.csv")
+COLLX_INDEX_MIN_ROWS = 20000  # below this, one vectorized pass over the haystack is fast enough
+
+def collx_version():
+    """(size, mtime) of the CollX export - every collection cache below is keyed on it"""
+    return csv_fingerprint(COLLX_CSV_PATH)
+
+# CollX export is shared by the collection page and the all-sets quick search.
+# Parsed frames live in a Feather cache on disk (collx_cache.py); a changed file
+# gets a new version key here, so nothing waits out a TTL.
+@st.cache_resource(max_entries=1)
+def _load_collx_version(version):
+    return load_collx(COLLX_CSV_PATH)
+
+def load_collx_csv():
+    return _load_collx_version(collx_version())
+
+@st.cache_resource(max_entries=1)
+def get_collx_search_index(version):
+    """N-gram index over the collection, only built for large collections"""
+    records = load_collx_csv()[COLLX_SEARCH_COLS].astype("string").fillna("")  # no "<NA>" for a blank year
+    return NgramIndex(records.itertuples(index=False, name=None))
+
+def collx_search_hits(collx_df, query, within=None):
+    """
+    Row positions where query is a (literal, case-insensitive) substring of any
+    search column. within: positions already known to hold every match - only
+    those rows are checked.
+    """
+    query = query.lower()
+    if len(collx_df) >= COLLX_INDEX_MIN_ROWS:
+        return np.asarray(get_collx_search_index(collx_version()).search(query, within=within), dtype=np.int64)
+    if within is None:
+        return np.flatnonzero(collx_df['_haystack'].str.contains(query, regex=False).to_numpy(dtype=bool))
+    within = np.asarray(within, dtype=np.int64)
+    return within[collx_df['_haystack'].iloc[within].str.contains(query, regex=False).to_numpy(dtype=bool)]
+
+@st.cache_resource(max_entries=1)
+def get_global_index(collx_ver, catalog_version):
+    """One merged search index over every catalog set plus the CollX collection"""
+    entries = []
+    for set_info in get_sets():
+        cards, _ = get_checklist(set_info["set_id"])
+        for num, player, team, card_type, notes in cards:
+            num_str = f"#{num}" if num.isdigit() else num
+            detail = f"{card_type} · {notes}" if notes else card_type
+            entries.append((set_info["label"], num, player, team, detail, f"{set_info['name']} {num_str} {player}"))
+    collx_df = load_collx_csv()
+    for row in collx_df.itertuples(index=False):
+        if not row.name:
+            continue
+        detail = f"{row.set} · {row.flags}" if row.flags else row.set
+        year = year_text(row.year)
+        ebay_q = f"{year} {row.set} {row.name}" if row.set else f"{year} {row.brand} {row.name}"
+        entries.append(("CollX", row.number, row.name, row.team, detail, ebay_q.strip()))
+    return GlobalSearchIndex(entries)
+
+# eBay links for the whole collection, built once per (collection version, search format, min price)
+@st.cache_resource(max_entries=32)
+def get_collx_ebay_urls(collx_ver, search_fmt, min_price):
+    collx_df = load_collx_csv()
+    return ebay_search_urls(collx_queries(collx_df, search_fmt), min_price=min_price)
+
+# Rendered table pages, shared by every session (LRU bounded by HTML size, see page_cache.py)
+@st.cache_resource
+def get_page_cache():
+    return LRUCache()
+
+def refresh_shared_data():
+    """Drop every shared dataset, index and rendered page; the next rerun reloads from disk"""
+    # Page modules register their own st.cache_resource loaders when first
+    # imported, so clear the whole resource cache rather than a fixed list
+    st.cache_resource.clear()
+
+# ── Precomputed link grids ───────────────────────────────────────────
+# Reference pages build their per-item <div> fragments once (st.cache_resource)
+# and join them here; a search-filtered view joins just the matching fragments.
+def link_grid(style, items):
+    """CSS-grid block of prebuilt item fragments"""
+    return f'<div style="{style}">' + ''.join(items) + '</div>'
+
+# ── Incremental search ───────────────────────────────────────────────
+def narrowed_search(state_key, scope, query, search):
+    """
+    Hits for a search box query, narrowing the last query's hits while the user
+    keeps typing. search(query, within) returns the matches for query, checking
+    only the positions in within when it is given. If the new query contains the
+    last one, every match for it also matched the last one, so only those are
+    checked; a deletion, an edit or a new scope (set, data version) scans everything.
+    """
+    last = st.session_state.get(state_key)
+    within = last[2] if last and last[0] == scope and last[1] in query else None
+    hits = search(query, within)
+    st.session_state[state_key] = (scope, query, hits)
+    return hits
+
+# ── Pagination ───────────────────────────────────────────────────────
+def find_card(cards, text):
+    """Position of the first (number, player, ...) row whose number is text, else whose player contains it"""
+    t = text.strip().lower().lstrip("#")
+    if not t:
+        return None
+    for pos, card in enumerate(cards):
+        if str(card[0]).lower() == t:
+            return pos
+    for pos, card in enumerate(cards):
+        if t in str(card[1]).lower():
+            return pos
+    return None
+
+def _step_page(page_key, delta, n_pages):
+    st.session_state[page_key] = min(max(st.session_state.get(page_key, 1) + delta, 1), n_pages)
+
+def _queue_jump(jump_key):
+    st.session_state[jump_key + "_pending"] = True
+
+def page_controls(key, total, page_size, signature, find=None):
+    """
+    Prev / next / page number / jump-to-card controls for a result list.
+    Returns the (start, stop) slice to render - only that page goes to the browser.
+    The page resets to 1 whenever signature (query, filters, sort, page size) changes.
+    find(text) -> position of a card in the result list, or None.
+    """
+    n_pages = max(1, -(-total // page_size))
+    page_key, sig_key, jump_key = f"{key}_page", f"{key}_page_sig", f"{key}_jump"
+    if st.session_state.get(sig_key) != signature:
+        st.session_state[sig_key] = signature
+        st.session_state[page_key] = 1
+    st.session_state[page_key] = min(max(st.session_state.get(page_key, 1), 1), n_pages)
+
+    jump_msg = ""
+    if st.session_state.pop(jump_key + "_pending", False) and find:
+        pos = find(st.session_state.get(jump_key, ""))
+        if pos is None:
+            jump_msg = "No card matches that jump."
+        else:
+            st.session_state[page_key] = pos // page_size + 1
+
+    if n_pages > 1:
+        nav1, nav2, nav3, nav4 = st.columns([1, 1, 1, 3])
+        with nav1:
+            st.button("◀ Prev", key=f"{key}_prev", disabled=st.session_state[page_key] <= 1,
+                      on_click=_step_page, args=(page_key, -1, n_pages))
+        with nav2:
+            st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key, label_visibility="collapsed")
+        with nav3:
+            st.button("Next ▶", key=f"{key}_next", disabled=st.session_state[page_key] >= n_pages,
+                      on_click=_step_page, args=(page_key, 1, n_pages))
+        with nav4:
+            st.text_input("Jump to card", placeholder="Jump to card # or player...", key=jump_key,
+                          on_change=_queue_jump, args=(jump_key,), label_visibility="collapsed")
+
+    page_num = st.session_state[page_key]
+    start = (page_num - 1) * page_size
+    stop = min(start + page_size, total)
+    if n_pages > 1:
+        st.caption(f"Showing {start + 1}–{stop} of {total} · page {page_num} of {n_pages}"
+                   + (f" · {jump_msg}" if jump_msg else ""))
+    return start, stop
@@ -0,0 +1,56 @@
+"""
+By Year & Sport
+Graded $50+ sold links for every year since 1980 in each league.
+"""
+
+import streamlit as st
+
+from ebay_urls import ebay_search_url
+from views.shared import fragment, link_grid
+
+SPORTS = ["MLB", "NFL", "NBA", "NHL"]
+YEARS = list(range(1980, 2026))
+
+
+GRID_STYLE = "display:grid;grid-template-columns:repeat(8,1fr);gap:4px 8px;font-size:13px;"
+
+
+@st.cache_resource
+def _sport_items():
+    """{sport: [(year text, grid item HTML), ...]} for every year, built once per process"""
+    sport_items = {}
+    for sport in SPORTS:
+        sport_items[sport] = []
+        for year in YEARS:
+            url = ebay_search_url(f"{year} {sport} (PSA, BGS, Beckett)", sold=True, min_price=50, exclude_auto=True)
+            sport_items[sport].append((str(year), f'<div><a href="{url}" target="_blank">{year}</a></div>'))
+    return sport_items
+
+
+@fragment
+def _year_grids():
+    """Year filter and the per-sport year grids - reruns on its own"""
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        year_sport_search = st.text_input("Filter by year...", placeholder="1986", key="year_sport_search")
+    with col2:
+        expand_all_sports = st.checkbox("Expand All", key="expand_sports")
+    
+    search_year = year_sport_search.strip() if year_sport_search else ""
+    
+    for sport, year_items in _sport_items().items():
+        if search_year:
+            items = [item for y, item in year_items if search_year in y]
+            if not items:
+                continue
+        else:
+            items = [item for _, item in year_items]
+        
+        with st.expander(f"**{sport}** ({len(items)} years)", expanded=expand_all_sports or bool(search_year)):
+            st.markdown(link_grid(GRID_STYLE, items), unsafe_allow_html=True)
+
+def render():
+    st.header("📆 BY YEAR & SPORT - PSA/BGS $50+")
+    st.caption("Click = eBay SOLD $50+, PSA or Beckett graded, no autos")
+    
+    _year_grids()